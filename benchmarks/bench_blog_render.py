@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Blog page render benchmark: precompiled HTML template vs Markdown per post
+
+Renders the static HTML page of N keyword posts two ways - converting
+each post's Markdown to HTML, and filling the content template that was
+converted once at import (MarkdownTemplate.render_html) - checks both
+give the same pages, and prints posts/second. Then times the short /
+medium / long content variants made in one pass (generate_variants)
+against three separate compose calls, and runs the whole batch pipeline
+(trends, content, images, page written to disk) for the same keywords.
+
+Usage:
+python benchmarks/bench_blog_render.py [N] [--workers W]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import blog_automation
+from sitegen.blog import render_post_page
+
+
+def bench(render, posts, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for keyword, post in posts:
+            render(keyword, post)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blog page render benchmark")
+    parser.add_argument('n', nargs='?', type=int, default=10000)
+    parser.add_argument('--workers', '-w', type=int, default=1)
+    args = parser.parse_args()
+
+    generator = blog_automation.WebsiteGenerator(verbose=False)
+    keywords = [f'키워드 {i}' for i in range(args.n)]
+    posts = [(keyword, generator.create_blog_post(keyword)) for keyword in keywords]
+
+    def per_post(keyword, post):
+        return render_post_page(post)
+
+    for keyword, post in posts[:100]:
+        assert generator.render_html(keyword, post) == per_post(keyword, post), keyword
+
+    markdown = bench(per_post, posts)
+    compiled = bench(generator.render_html, posts)
+    print(f"render {args.n} blog pages")
+    print(f"  Markdown per post:     {markdown:6.2f}s  ({args.n / markdown:8.0f} posts/s)")
+    print(f"  precompiled template:  {compiled:6.2f}s  ({args.n / compiled:8.0f} posts/s)  "
+          f"speedup {markdown / compiled:.1f}x")
+
+    limits = blog_automation.VARIANT_LIMITS
+    separate = bench(lambda keyword, post: [generator.compose_content(keyword, limit) for limit in limits.values()],
+                     posts)
+    one_pass = bench(lambda keyword, post: generator.generate_variants(keyword), posts)
+    print(f"content variants {', '.join(f'{name} {limit}' for name, limit in limits.items())}")
+    print(f"  three compose calls:   {separate:6.2f}s  ({args.n / separate:8.0f} keywords/s)")
+    print(f"  one pass:              {one_pass:6.2f}s  ({args.n / one_pass:8.0f} keywords/s)  "
+          f"speedup {separate / one_pass:.1f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report = blog_automation.run_blog_batch(keywords, os.path.join(tmp, 'posts.jsonl'), args.workers,
+                                                html_dir=os.path.join(tmp, 'html'))
+        pages = len(os.listdir(os.path.join(tmp, 'html')))
+    print(f"batch pipeline with pages, {args.workers} worker(s)")
+    print(f"  {report['seconds']:6.2f}s  "
+          f"({report['total'] / report['seconds']:8.0f} posts/s, {pages} pages written)")
+    return 1 if report['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
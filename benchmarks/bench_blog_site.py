@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Static blog builder benchmark: full build vs incremental rebuild
+
+Builds a blog of N generated posts from scratch, then adds ten new
+posts, changes one old post and rebuilds, and prints the time and the
+number of pages written for each build.
+
+Usage:
+python benchmarks/bench_blog_site.py [N]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import blog_automation
+from sitegen.blog_site import BlogBuilder
+
+
+def build(folder, generator, keywords, word_limit=2000):
+    started = time.perf_counter()
+    with BlogBuilder(folder) as blog:
+        for keyword in keywords:
+            post = generator.create_blog_post(keyword, word_limit)
+            blog.add(keyword, post, generator.render_body(keyword, post))
+        report = blog.build()
+    return time.perf_counter() - started, report
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    generator = blog_automation.WebsiteGenerator(verbose=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        elapsed, report = build(tmp, generator, (f'키워드 {i}' for i in range(n)))
+        print(f"full build of {n} posts:     {elapsed:7.2f}s  {report['pages']:6d} pages written "
+              f"({n / elapsed:.0f} posts/s)")
+
+        elapsed, report = build(tmp, generator, [f'키워드 {i}' for i in range(n, n + 10)])
+        print(f"add 10 posts:               {elapsed:7.2f}s  {report['pages']:6d} pages written")
+
+        elapsed, report = build(tmp, generator, ['키워드 7'], word_limit=500)
+        print(f"change 1 old post:          {elapsed:7.2f}s  {report['pages']:6d} pages written")
+
+        elapsed, report = build(tmp, generator, [f'키워드 {i}' for i in range(n, n + 10)])
+        print(f"rebuild, nothing changed:   {elapsed:7.2f}s  {report['pages']:6d} pages written")
+
+
+if __name__ == "__main__":
+    main()
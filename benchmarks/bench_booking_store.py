@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Booking store benchmark: admin-panel queries on a large tenant
+
+Fills a SQLite booking store with one busy tenant (N bookings) among
+many small ones, then times the queries the admin panel makes - the
+Total / Today / per-status counts, the daily / weekly / monthly history,
+the first and the last page of the paged list, a status filter and a
+booking-date filter - and prints the SQLite query plan of each, to show
+they run on the (site, ...) indexes and the booking_counts counters
+rather than scanning the table. Opening the virtual admin table costs
+one stats call plus one page.
+
+Usage:
+python benchmarks/bench_booking_store.py [N]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sitegen import booking_store
+from sitegen.booking_store import SQLiteBookingStore
+
+BUSY = 'busy-cafe-website'
+STATUSES = ['pending', 'confirmed', 'completed']
+
+
+def fill(store, n, small_tenants=1000):
+    rows = []
+    for i in range(n):
+        rows.append((BUSY, STATUSES[i % 3], f'2026-01-{1 + i % 28:02d}T09:00:00.000Z', f'2026-02-{1 + i % 28:02d}',
+                     f'{{"name": "Customer {i}", "phone": "010-0000-0000", "business": "Busy Cafe"}}'))
+    for i in range(small_tenants * 10):
+        rows.append((f'tenant-{i % small_tenants:04d}-website', 'pending', '2026-01-01T09:00:00.000Z', '2026-02-01',
+                     '{"name": "Other"}'))
+    with store.db:
+        store.db.execute('BEGIN')
+        store.db.executemany(booking_store.INSERT, rows)
+    store.create(BUSY, {'name': 'Walk-in', 'phone': '010-1111-2222', 'date': '2026-02-03'})
+
+
+def best_of(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteBookingStore(os.path.join(tmp, 'bookings.db'))
+        started = time.perf_counter()
+        fill(store, n)
+        print(f"{n} bookings for {BUSY} + 10000 for 1000 other tenants ({time.perf_counter() - started:.1f}s)")
+
+        queries = [
+            ('stats (total/today/statuses)', lambda: store.stats(BUSY),
+             [(booking_store.COUNT_STATUSES, (BUSY,)), (booking_store.COUNT_SINCE, (BUSY, '2026-01-28'))]),
+            ('history by day', lambda: store.history(BUSY), [(booking_store.COUNT_DAYS, (BUSY, ''))]),
+            ('history by week', lambda: store.history(BUSY, by='week'), []),
+            ('history by month', lambda: store.history(BUSY, by='month'), []),
+            ('first page (200 bookings)', lambda: store.list(BUSY, limit=200),
+             [(booking_store.SELECT_ALL, (BUSY, 0, 200))]),
+            ('last page (after=<id>)', lambda: store.list(BUSY, after=n - 200, limit=200),
+             [(booking_store.SELECT_ALL, (BUSY, n - 200, 200))]),
+            ("list status='pending'", lambda: store.list(BUSY, status='pending'),
+             [(booking_store.SELECT_STATUS, (BUSY, 'pending', 0, -1))]),
+            ("list date='2026-02-03'", lambda: store.list(BUSY, date='2026-02-03'),
+             [(booking_store.SELECT_DATE, (BUSY, '2026-02-03', 0, -1))]),
+            ('small tenant stats', lambda: store.stats('tenant-0001-website'), []),
+        ]
+        for label, fn, plans in queries:
+            print(f"  {label:<32} {best_of(fn) * 1000:9.2f} ms")
+            for sql, params in plans:
+                for row in store.db.execute('EXPLAIN QUERY PLAN ' + sql, params):
+                    print(f"      plan: {row[-1]}")
+
+        create = best_of(lambda: store.create(BUSY, {'name': 'Kim', 'phone': '010-1234-5678'}), 200)
+        print(f"  {'create one booking':<32} {create * 1000:9.2f} ms")
+        booking_id = store.list(BUSY, limit=1)[0]['id']
+        flips = iter(STATUSES * 100)
+        update = best_of(lambda: store.update(BUSY, booking_id, {'status': next(flips)}), 200)
+        print(f"  {'change one status':<32} {update * 1000:9.2f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Booking export / import benchmark
+
+Imports N bookings into one tenant of a SQLite booking store in batches
+of 200 (the admin panel's import batch), then streams them back out as
+NDJSON and CSV through the server's chunked export, and compares the
+peak Python memory of the stream with building the whole list at once.
+
+Usage:
+python benchmarks/bench_export.py [N]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sitegen.booking_store import SQLiteBookingStore
+from sitegen.server import BookingAPI, Export
+
+TENANT = 'busy-cafe-website'
+BATCH = 200
+
+
+class CountingWriter:
+    """Stands in for the client connection: counts the bytes and chunks written."""
+
+    def __init__(self):
+        self.bytes = 0
+        self.writes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        self.writes += 1
+
+    async def drain(self):
+        pass
+
+
+def booking(i):
+    return {
+        'name': f'Customer {i}',
+        'phone': '010-0000-0000',
+        'email': f'customer{i}@example.com',
+        'service': 'Basic Service',
+        'date': '2026-02-03',
+        'message': 'Window seat, please',
+        'status': 'pending',
+        'createdAt': f'2025-{1 + i % 12:02d}-{1 + i % 28:02d}T09:00:00.000Z',
+    }
+
+
+def measure(fn):
+    """(seconds, peak traced MB, result): timed on one call, traced on a second (tracing is slow)."""
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteBookingStore(os.path.join(tmp, 'bookings.db'))
+        api = BookingAPI(store)
+
+        started = time.perf_counter()
+        for first in range(0, n, BATCH):
+            store.import_bookings(TENANT, [booking(i) for i in range(first, min(n, first + BATCH))])
+        elapsed = time.perf_counter() - started
+        print(f"import {n} bookings in batches of {BATCH}: {elapsed:.2f}s ({n / elapsed:.0f} bookings/s)")
+
+        for fmt in ('ndjson', 'csv'):
+            def export():
+                writer = CountingWriter()
+                asyncio.run(api.stream_export(Export(TENANT, fmt), writer, False))
+                return writer
+            elapsed, peak, writer = measure(export)
+            print(f"  stream {fmt:<6} {writer.bytes / 1e6:7.1f} MB in {writer.writes:4d} writes  "
+                  f"{elapsed:6.2f}s  peak {peak:6.1f} MB")
+
+        elapsed, peak, body = measure(lambda: json.dumps({'bookings': store.list(TENANT)}, ensure_ascii=False))
+        print(f"  whole list    {len(body) / 1e6:7.1f} MB at once         {elapsed:6.2f}s  peak {peak:6.1f} MB")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
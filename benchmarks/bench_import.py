@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Import-time benchmark for the sitegen core
+
+Runs each module import in a fresh interpreter under `python -X importtime`
+and reports the cumulative import time (best of N runs), so start-up cost
+of the CLI and of each generator stays visible as the core grows.
+
+Usage:
+python benchmarks/bench_import.py [runs]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    'sitegen',
+    'sitegen.config',
+    'sitegen.templates',
+    'sitegen.pipeline',
+    'sitegen.cli',
+    'sitegen.generators.auto',
+    'sitegen.generators.simple',
+    'sitegen.generators.custom',
+    'sitegen.generators.maker',
+    'sitegen.generators.v2',
+    'sitegen.generators.v2_ko',
+    'sitegen.generators.demo',
+]
+
+
+def import_time(module):
+    """Cumulative import time of one module in microseconds (fresh process)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    # Last line is the requested module: "import time: self | cumulative | name"
+    for line in reversed(result.stderr.splitlines()):
+        fields = [f.strip() for f in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"Cumulative import time, best of {runs} (fresh interpreter each run)")
+    for module in MODULES:
+        best = min(import_time(module) for _ in range(runs))
+        print(f"  {module:<28} {best / 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Template render benchmark: precompiled templates vs the original f-strings
+
+Renders index.html + admin.html for N business configs with both paths,
+checks they give the same pages byte for byte and prints per-site
+render time.
+
+Usage:
+python benchmarks/bench_templates.py [N]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import legacy_fstring
+from sitegen.generators import v2
+
+COLORS = ['professional', 'warm', 'medical', 'tech']
+
+
+def make_configs(n):
+    return [{
+        'business_name': f'Business {i}',
+        'type': 'service',
+        'color': COLORS[i % len(COLORS)],
+        'icon': '🏢',
+        'keywords': ['coffee', 'dessert', f'brunch {i}'],
+        'phone': f'010-0000-{i:04d}',
+        'email': f'info{i}@example.com',
+        'address': 'Seoul, Gangnam-gu',
+        'services': ['Professional Consultation', 'Custom Service', 'After-care'],
+    } for i in range(n)]
+
+
+def bench(module, configs, repeat=3):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for config in configs:
+            module.generate_html_template(config)
+            module.generate_admin_template(config)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    generator = v2
+    configs = make_configs(n)
+
+    for config in configs[:len(COLORS)]:
+        assert generator.generate_html_template(config) == legacy_fstring.generate_html_template(config)
+        assert generator.generate_admin_template(config) == legacy_fstring.generate_admin_template(config)
+
+    legacy = bench(legacy_fstring, configs)
+    compiled = bench(generator, configs)
+
+    print(f"Rendered {n} sites (index.html + admin.html), best of 3")
+    print(f"  f-string   : {legacy:.3f}s  ({legacy / n * 1e6:.1f} us/site)")
+    print(f"  precompiled: {compiled:.3f}s  ({compiled / n * 1e6:.1f} us/site)")
+    print(f"  speedup    : {legacy / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Multi-tenant booking server benchmark
+
+Spreads N requests over T tenants (site folders) from C keep-alive
+connections: a mix of booking POSTs and admin-panel list GETs, each for
+a random tenant. Reports requests/second, latency percentiles, the
+status codes seen (429 = a tenant hit its rate limit) and checks that
+every tenant got exactly its own bookings back.
+
+Without --url a server is started on a free local port with a temporary
+booking log and stopped afterwards.
+
+Usage:
+python benchmarks/bench_tenants.py [--tenants 1000] [--connections 200] [--requests 20000] [--rate 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_bookings import TOKEN, booking, free_port, percentile, raise_open_file_limit, start_server
+
+
+def tenant_path(tenant):
+    return f'/sites/tenant-{tenant:04d}-website/api/bookings'
+
+
+class Connection:
+    """One keep-alive client connection, reopened if the server closes it."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.writer.write(
+            f'{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n'
+            f'Authorization: Bearer {TOKEN}\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body
+        )
+        await self.writer.drain()
+        head = (await self.reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+        lines = head.split('\r\n')
+        headers = dict(line.lower().split(': ', 1) for line in lines[1:] if ': ' in line)
+        data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection') == 'close':
+            self.close()
+        return int(lines[0].split(' ', 2)[1]), data
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def run(host, port, tenants, connections, total, post_ratio):
+    rng = random.Random(1)
+    plan = [(rng.randrange(tenants), rng.random() < post_ratio) for _ in range(total)]
+    latencies = []
+    statuses = Counter()
+    created = Counter()
+    next_request = 0
+
+    async def client():
+        nonlocal next_request
+        conn = Connection(host, port)
+        try:
+            while next_request < total:
+                tenant, post = plan[next_request]
+                next_request += 1
+                started = time.perf_counter()
+                try:
+                    if post:
+                        status, _ = await conn.request('POST', tenant_path(tenant), booking(tenant))
+                    else:
+                        status, _ = await conn.request('GET', tenant_path(tenant))
+                except (OSError, asyncio.IncompleteReadError):
+                    conn.close()
+                    status = 'error'
+                latencies.append(time.perf_counter() - started)
+                statuses[status] += 1
+                if post and status == 201:
+                    created[tenant] += 1
+        finally:
+            conn.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+
+    # Every tenant must see exactly the bookings it created
+    conn = Connection(host, port)
+    mismatched = 0
+    for tenant in range(tenants):
+        status, data = await conn.request('GET', tenant_path(tenant))
+        while status == 429:
+            await asyncio.sleep(1)
+            status, data = await conn.request('GET', tenant_path(tenant))
+        if len(json.loads(data)['bookings']) != created[tenant]:
+            mismatched += 1
+    conn.close()
+    return latencies, statuses, elapsed, mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-tenant booking server benchmark")
+    parser.add_argument('--tenants', '-t', type=int, default=1000)
+    parser.add_argument('--connections', '-c', type=int, default=200)
+    parser.add_argument('--requests', '-n', type=int, default=20000)
+    parser.add_argument('--post-ratio', type=float, default=0.5, help="share of booking POSTs (rest: list GETs)")
+    parser.add_argument('--rate', default='20', help="per-tenant rate limit of the started server")
+    parser.add_argument('--url', help="running booking server, e.g. http://127.0.0.1:8080 (must be empty)")
+    args = parser.parse_args()
+    raise_open_file_limit()
+
+    process = None
+    tmp = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        tmp = tempfile.mkdtemp(prefix='bookings-')
+        host, port = '127.0.0.1', free_port()
+        process = start_server(port, os.path.join(tmp, 'bookings.db'), '--rate', args.rate)
+
+    try:
+        latencies, statuses, elapsed, mismatched = asyncio.run(
+            run(host, port, args.tenants, args.connections, args.requests, args.post_ratio))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    codes = '  '.join(f"{status}: {count}" for status, count in sorted(statuses.items(), key=str))
+    print(f"{args.requests} requests, {args.tenants} tenants, {args.connections} keep-alive connections")
+    print(f"  throughput: {len(latencies) / elapsed:.0f} req/s ({elapsed:.2f}s)")
+    print(f"  latency:    p50 {percentile(latencies, 50) * 1000:.2f} ms  "
+          f"p99 {percentile(latencies, 99) * 1000:.2f} ms  max {max(latencies, default=0) * 1000:.2f} ms")
+    print(f"  status:     {codes}")
+    print(f"  isolation:  {args.tenants - mismatched}/{args.tenants} tenants see exactly their own bookings")
+    return 1 if mismatched or statuses['error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
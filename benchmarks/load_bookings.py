@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Load test for the booking server
+
+Fires N booking POSTs with C of them in flight at once (one connection
+per request, like separate visitors), then checks the server stored every
+booking and reports throughput and latency percentiles.
+
+Without --url a server is started on a free local port with a temporary
+booking log and no rate limit, and stopped afterwards. All bookings go
+to one site, so a running server needs a high enough --rate for it.
+Requests carry the admin token in $SITEGEN_ADMIN_TOKEN (the started
+server gets the same one).
+
+Usage:
+python benchmarks/load_bookings.py [--requests 10000] [--concurrency 2000] [--url URL]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sitegen.server import TOKEN_ENV, raise_open_file_limit
+
+TOKEN = os.environ.get(TOKEN_ENV, 'load-test')
+
+
+def booking(i):
+    return {
+        'name': f'Customer {i}',
+        'phone': f'010-0000-{i % 10000:04d}',
+        'email': f'customer{i}@example.com',
+        'service': 'Basic Service',
+        'date': '2026-01-15',
+        'message': 'Load test booking',
+        'business': 'Load Test Cafe',
+    }
+
+
+async def send(host, port, method, path, payload=None):
+    """One request on a fresh connection; returns (status, body bytes)."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        writer.write(
+            f'{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+            f'Authorization: Bearer {TOKEN}\r\n'
+            f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + body
+        )
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    head, _, data = response.partition(b'\r\n\r\n')
+    return int(head.split(b' ', 2)[1]), data
+
+
+async def run(host, port, path, total, concurrency):
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def post(i):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                status, _ = await send(host, port, 'POST', path, booking(i))
+            except OSError:
+                status = None
+            if status == 201:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(post(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+
+    _, data = await send(host, port, 'GET', path)
+    stored = len(json.loads(data)['bookings'])
+    return latencies, errors, elapsed, stored
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))] if values else 0.0
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, data, *args):
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'sitegen.server', '--port', str(port), '--data', data, '--admin-token', TOKEN, *args],
+        cwd=ROOT, stdout=subprocess.DEVNULL
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("booking server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent booking POST load test")
+    parser.add_argument('--requests', '-n', type=int, default=10000)
+    parser.add_argument('--concurrency', '-c', type=int, default=2000)
+    parser.add_argument('--url', help="running booking API, e.g. http://127.0.0.1:8080/sites/load-test-website/api/bookings")
+    args = parser.parse_args()
+    raise_open_file_limit()
+
+    process = None
+    tmp = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port, path = url.hostname, url.port or 80, url.path
+    else:
+        tmp = tempfile.mkdtemp(prefix='bookings-')
+        host, port, path = '127.0.0.1', free_port(), '/sites/load-test-website/api/bookings'
+        process = start_server(port, os.path.join(tmp, 'bookings.db'), '--rate', '0')
+
+    try:
+        latencies, errors, elapsed, stored = asyncio.run(run(host, port, path, args.requests, args.concurrency))
+    finally:
+        if process:
+            process.terminate()
+            process.wait()
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    ok = len(latencies)
+    print(f"{args.requests} POSTs, {args.concurrency} concurrent")
+    print(f"  succeeded: {ok}  failed: {errors}  stored on server: {stored}")
+    print(f"  elapsed:   {elapsed:.2f}s ({ok / elapsed:.0f} req/s)")
+    print(f"  latency:   p50 {percentile(latencies, 50) * 1000:.1f} ms  "
+          f"p99 {percentile(latencies, 99) * 1000:.1f} ms  max {max(latencies, default=0) * 1000:.1f} ms")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
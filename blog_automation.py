@@ -11,47 +11,62 @@
 
 사용법:
 python blog_automation.py
+python blog_automation.py --keywords keywords.txt --output posts.jsonl --workers 8
+
+배치 모드: 키워드 파일(한 줄에 하나)의 모든 키워드로 포스트를 만듭니다.
+키워드는 청크 단위로 워커 프로세스에 나뉘고, 각 워커 안에서는
+트렌드 분석 → 콘텐츠 → 이미지 세 단계가 제너레이터 체인으로 이어져
+키워드 하나가 세 단계를 마치는 대로 다음 키워드가 흘러갑니다. 끝난
+청크의 포스트는 바로 출력 JSONL에 한 줄씩 기록됩니다.
+
+트렌드는 sitegen.trends의 제공자(--trends: JSON/JSONL 파일 또는 SQLite)
+에서 가져오며, 워커마다 키워드 기준 TTL + LRU 캐시를 거치므로 같은
+키워드나 첫 단어가 같은 관련 키워드는 다시 조회하지 않습니다.
+
+--html-dir을 주면 포스트마다 정적 HTML 페이지(<키워드>.html, 이름이 겹치면 -2, -3 ...)도 씁니다.
+본문 Markdown 템플릿은 시작할 때 HTML로 한 번 변환해 두므로, 포스트마다
+Markdown을 다시 변환하지 않고 키워드만 채웁니다 (sitegen.blog).
+
+--blog-dir을 주면 포스트를 정적 블로그(포스트 페이지, 페이지별 목록,
+태그 페이지, RSS, sitemap.xml)에 쌓습니다 (sitegen.blog_site). 다시
+실행하면 새로 추가되거나 바뀐 포스트가 들어가는 페이지만 다시 씁니다.
 """
 
-import os
+import argparse
 import json
-import uuid
+import sqlite3
+import sys
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
-class WebsiteGenerator:
-    def __init__(self):
-        self.keyword = ""
-        self.content = ""
-        self.images = []
-        self.trends = {}
+from sitegen.batch import iter_chunks, map_chunks
+from sitegen.blog import SectionComposer, SlugTable, post_slug, render_post_page
+from sitegen.blog_site import BlogBuilder
+from sitegen.trends import TrendCache, open_provider
 
-    def analyze_trends(self, keyword):
-        """키워드 트렌드 분석"""
-        print(f"'{keyword}' 키워드 트렌드 분석 중...")
-
-        # 실제 구현시 Google Trends API, 뉴스 API 등 활용
-        trends_data = {
-            "keyword": keyword,
-            "popularity": "상승",
-            "related_terms": ["AI 세무", "디지털 전환", "자동화 기장"],
-            "current_issues": ["세무 디지털화", "AI 도입", "효율성 증대"]
-        }
+CHUNK_SIZE = 50  # keywords per worker task
+PROGRESS_EVERY = 1000
+TREND_CACHE_SIZE = 1024
+TREND_TTL = 3600  # seconds
 
-        self.trends = trends_data
-        return trends_data
+# Character budgets of generate_variants
+VARIANT_LIMITS = {'short': 400, 'medium': 800, 'long': 2000}
 
-    def generate_content(self, keyword, word_limit=2000):
-        """애플 필모그래피 스타일 콘텐츠 생성"""
-        print(f"'{keyword}' 콘텐츠 생성 중... (목표: {word_limit}자)")
+# One trend cache per worker process, shared by all of its chunks
+_trend_caches = {}
 
-        # 애플 스타일: 간결, 명확, 시각적, 감성적
-        content_template = f"""
-# {keyword}의 새로운 패러다임
+# 애플 스타일: 간결, 명확, 시각적, 감성적
+# {{keyword}} 자리만 바뀌므로 ## 섹션별로 Markdown과 HTML 양쪽으로 한 번만 컴파일해 둠.
+# 섹션 길이는 (고정 글자 수 + 키워드 길이 × 등장 횟수)로 계산되어
+# word_limit 안에 들어가는 섹션까지만 렌더링함
+CONTENT = SectionComposer("""
+# {{keyword}}의 새로운 패러다임
 *AI가 바꾸는 세무의 미래*
 
 ## 시작하기 전에
-{keyword}이라는 단어를 들으면 무엇이 떠오르시나요?
+{{keyword}}이라는 단어를 들으면 무엇이 떠오르시나요?
 복잡한 장부? 끝없는 서류?
 
 이제는 다릅니다.
@@ -63,12 +78,12 @@ class WebsiteGenerator:
 - **효율성의 재발견**: 시간은 돈입니다
 
 ### 무엇이 달라졌나?
-전통적인 {keyword} 방식:
+전통적인 {{keyword}} 방식:
 ```
 수작업 입력 → 검토 → 수정 → 재검토
 ```
 
-AI 기반 {keyword} 방식:
+AI 기반 {{keyword}} 방식:
 ```
 데이터 입력 → AI 분석 → 자동 분류 → 완료
 ```
@@ -127,14 +142,14 @@ AI 활용: 월 8시간
 
 ## 결론
 
-{keyword}의 미래는 이미 시작되었습니다.
+{{keyword}}의 미래는 이미 시작되었습니다.
 변화를 두려워할 필요 없습니다.
 
 **한 걸음씩, 확실하게.**
 
 ---
 *"가장 간단한 해결책이 가장 우아한 해결책이다"*
-- 애플의 디자인 철학처럼, {keyword}도 단순함 속에서 완벽을 찾아야 합니다.
+- 애플의 디자인 철학처럼, {{keyword}}도 단순함 속에서 완벽을 찾아야 합니다.
 
 ## 다음 단계
 1. 현재 프로세스 점검
@@ -142,14 +157,55 @@ AI 활용: 월 8시간
 3. 단계적 도입 계획 수립
 
 **오늘부터 시작하세요.**
-"""
+""")
+
+
+class WebsiteGenerator:
+    def __init__(self, verbose=True, trends=None):
+        self.verbose = verbose  # 배치 모드는 키워드마다 진행 메시지를 찍지 않음
+        self.trend_cache = trends or TrendCache()  # sitegen.trends.TrendCache
+        self.keyword = ""
+        self.content = ""
+        self.images = []
+        self.trends = {}
+
+    def analyze_trends(self, keyword):
+        """키워드 트렌드 분석"""
+        if self.verbose:
+            print(f"'{keyword}' 키워드 트렌드 분석 중...")
+
+        # 제공자(기본: 고정 샘플, 파일/SQLite 대체 구현) 앞의 캐시에서 조회
+        trends_data = self.trend_cache.get(keyword)
+
+        self.trends = trends_data
+        return trends_data
+
+    def generate_content(self, keyword, word_limit=2000):
+        """애플 필모그래피 스타일 콘텐츠 생성 (word_limit자 안에 들어가는 섹션까지)"""
+        return self.compose_content(keyword, word_limit)[0]
+
+    def compose_content(self, keyword, word_limit=2000):
+        """(콘텐츠, 글자 수, 섹션 수): 제목과 도입부 뒤로 섹션을 순서대로 더하다 word_limit을 넘기 전에 멈춤"""
+        if self.verbose:
+            print(f"'{keyword}' 콘텐츠 생성 중... (목표: {word_limit}자)")
 
-        self.content = content_template
-        return content_template
+        # 글자 수는 섹션마다 더해 가며 계산 (완성된 문자열을 다시 세지 않음)
+        content, count, sections = CONTENT.compose({"keyword": keyword}, word_limit)
+
+        self.content = content
+        return content, count, sections
+
+    def generate_variants(self, keyword, limits=None):
+        """짧은 / 중간 / 긴 버전을 한 번에 생성: {이름: (콘텐츠, 글자 수, 섹션 수)}
+
+        섹션 길이를 한 번만 훑고, 각 섹션은 한 번만 렌더링해 모든 버전이 공유함.
+        """
+        return CONTENT.variants({"keyword": keyword}, limits or VARIANT_LIMITS)
 
     def generate_images(self, keyword):
         """이미지 생성 (텍스트 설명으로 대체)"""
-        print(f"'{keyword}' 관련 이미지 생성 중...")
+        if self.verbose:
+            print(f"'{keyword}' 관련 이미지 생성 중...")
 
         # 애플 스타일 이미지 컨셉
         image_concepts = [
@@ -175,27 +231,45 @@ AI 활용: 월 8시간
 
     def create_blog_post(self, keyword, word_limit=2000):
         """완전한 블로그 포스트 생성"""
-        print(f"\n=== {keyword} 블로그 포스트 자동 생성 ===\n")
+        if self.verbose:
+            print(f"\n=== {keyword} 블로그 포스트 자동 생성 ===\n")
 
         # 트렌드 분석
         trends = self.analyze_trends(keyword)
 
         # 콘텐츠 생성
-        content = self.generate_content(keyword, word_limit)
+        content, word_count, sections = self.compose_content(keyword, word_limit)
 
         # 이미지 생성
         images = self.generate_images(keyword)
 
+        return self.assemble_post(keyword, trends, content, images, word_count, sections)
+
+    def render_body(self, keyword, post):
+        """포스트 본문 HTML (컴파일된 섹션 HTML 템플릿에 키워드만 채움)"""
+        return CONTENT.render_html({"keyword": keyword}, post['metadata'].get('sections'))
+
+    def render_html(self, keyword, post):
+        """포스트의 정적 HTML 페이지"""
+        return render_post_page(post, self.render_body(keyword, post))
+
+    def assemble_post(self, keyword, trends, content, images, word_count=None, sections=None):
+        """세 단계의 결과와 메타데이터를 포스트 하나로 묶음
+
+        word_count / sections는 compose_content가 센 값 (없으면 content를 다시 셈).
+        """
         # 메타데이터 생성
         metadata = {
             "title": f"{keyword}의 새로운 패러다임 - AI가 바꾸는 세무의 미래",
             "description": f"{keyword} 자동화의 모든 것. AI 기술로 효율성을 높이고 미래를 준비하세요.",
             "keywords": ["세무기장", "AI", "자동화", "디지털전환", "효율성"],
             "created_date": datetime.now().strftime("%Y-%m-%d"),
-            "word_count": len(content),
+            "word_count": len(content) if word_count is None else word_count,
             "style": "애플 필모그래피",
             "images_count": len(images)
         }
+        if sections is not None:
+            metadata["sections"] = sections
 
         return {
             "metadata": metadata,
@@ -204,9 +278,189 @@ AI 활용: 월 8시간
             "trends": trends
         }
 
+# 배치 모드: 단계별 제너레이터 체인
+# 각 단계는 앞 단계의 레코드를 하나씩 받아 자기 결과를 붙여 넘기고,
+# 실패한 레코드는 건드리지 않고 그대로 흘려보냄
+
+def _record(keyword):
+    return {'keyword': keyword, 'ok': True, 'post': None, 'error': None, 'started': time.perf_counter()}
+
+
+def _stage(records, work):
+    """records의 성공한 레코드마다 work(record)를 실행; 예외는 그 키워드의 실패로 기록"""
+    for record in records:
+        if record['ok']:
+            try:
+                work(record)
+            except Exception as e:
+                record.update(ok=False, error=f"{type(e).__name__}: {e}")
+        yield record
+
+
+def _trend_stage(generator):
+    cache = generator.trend_cache
+
+    def work(record):
+        hits = cache.hits
+        started = time.perf_counter()
+        record['trends'] = generator.analyze_trends(record['keyword'])
+        record['trend_seconds'] = time.perf_counter() - started
+        record['trend_hit'] = cache.hits > hits
+    return work
+
+
+def _assemble(generator, records):
+    for record in records:
+        if record['ok']:
+            content, word_count, sections = record.pop('content')
+            record['post'] = generator.assemble_post(record['keyword'], record.pop('trends'), content,
+                                                     record.pop('images'), word_count, sections)
+        for stage in ('trends', 'content', 'images'):
+            record.pop(stage, None)
+        yield record
+
+
+def _finish(records):
+    for record in records:
+        record['seconds'] = time.perf_counter() - record.pop('started')
+        yield record
+
+
+def _page_stage(generator, html_dir, slug):
+    def work(record):
+        path = Path(html_dir) / f"{slug(record['keyword'])}.html"
+        body = record.get('body') or generator.render_body(record['keyword'], record['post'])
+        path.write_text(render_post_page(record['post'], body), encoding='utf-8')
+        record['page'] = str(path)
+    return work
+
+
+def iter_posts(generator, keywords, word_limit=2000, html_dir=None, bodies=False, slug=post_slug):
+    """키워드마다 트렌드 → 콘텐츠 → 이미지(→ 본문 HTML → HTML 페이지)를 거친 결과 레코드를 순서대로 생성
+
+    bodies면 레코드에 본문 HTML('body')을 남김 (BlogBuilder.add에 넘길 것).
+    slug(keyword)는 html_dir 안의 페이지 이름.
+    """
+    records = (_record(keyword) for keyword in keywords)
+    records = _stage(records, _trend_stage(generator))
+    records = _stage(records, lambda r: r.update(content=generator.compose_content(r['keyword'], word_limit)))
+    records = _stage(records, lambda r: r.update(images=generator.generate_images(r['keyword'])))
+    records = _assemble(generator, records)
+    if bodies:
+        records = _stage(records, lambda r: r.update(body=generator.render_body(r['keyword'], r['post'])))
+    if html_dir:
+        records = _stage(records, _page_stage(generator, html_dir, slug))
+    return _finish(records)
+
+
+def worker_trend_cache(trends=None, cache_size=TREND_CACHE_SIZE, ttl=TREND_TTL):
+    """이 프로세스의 트렌드 캐시 (처음 부를 때 제공자를 열고 이후 재사용)"""
+    key = (str(trends) if trends else None, cache_size, ttl)
+    if key not in _trend_caches:
+        _trend_caches[key] = TrendCache(open_provider(trends), cache_size, ttl)
+    return _trend_caches[key]
+
+
+def post_chunk(keywords, word_limit=2000, trends=None, cache_size=TREND_CACHE_SIZE, ttl=TREND_TTL, html_dir=None,
+               bodies=False):
+    """워커 한 번의 작업: 키워드 청크의 결과 레코드 목록 (예외를 던지지 않음)
+
+    html_dir이 있으면 keywords는 (키워드, 페이지 slug) 쌍 (iter_blog_batch가 정함).
+    """
+    generator = WebsiteGenerator(verbose=False, trends=worker_trend_cache(trends, cache_size, ttl))
+    slug = post_slug
+    if html_dir:
+        slug = dict(keywords).__getitem__
+        keywords = [keyword for keyword, _ in keywords]
+    return list(iter_posts(generator, keywords, word_limit, html_dir, bodies, slug))
+
+
+def iter_keywords(path):
+    """키워드 파일을 한 줄씩 읽음 (빈 줄과 #으로 시작하는 줄은 건너뜀)"""
+    with open(path, encoding='utf-8-sig') as f:
+        for line in f:
+            keyword = line.strip()
+            if keyword and not keyword.startswith('#'):
+                yield keyword
+
+
+def iter_blog_batch(keywords, workers=None, word_limit=2000, chunk_size=CHUNK_SIZE, max_pending=None,
+                    trends=None, cache_size=TREND_CACHE_SIZE, ttl=TREND_TTL, html_dir=None, bodies=False):
+    """모든 키워드의 결과 레코드를 청크가 끝나는 순서대로 생성
+
+    keywords는 어떤 iterable이든 되며(지연 제너레이터 포함), 한 번에
+    max_pending개 청크만 워커에 넘기므로 입력은 풀이 비는 속도로만 읽힘.
+    trends는 트렌드 제공자 경로(open_provider), cache_size / ttl은 워커별 캐시 설정.
+    html_dir을 주면 포스트마다 그 폴더에 정적 HTML 페이지를 씀 (레코드의 'page').
+    slug가 같은 다른 키워드('AI tools', 'ai-tools')는 -2, -3 ... 이 붙은 페이지를 받음.
+    bodies면 워커가 렌더링한 본문 HTML을 레코드의 'body'로 돌려줌.
+    """
+    # 제공자를 여기서 한 번 열어 보면 잘못된 경로가 워커마다 실패하기 전에 드러남
+    if trends:
+        open_provider(trends).close()
+    if html_dir:
+        Path(html_dir).mkdir(parents=True, exist_ok=True)
+        # 페이지 이름은 모든 키워드를 보는 여기서 정해야 워커끼리 겹치지 않음
+        slugs = SlugTable()
+        keywords = ((keyword, slugs.get(keyword)) for keyword in keywords)
+    task = partial(post_chunk, word_limit=word_limit, trends=trends, cache_size=cache_size, ttl=ttl,
+                   html_dir=html_dir, bodies=bodies)
+    for results in map_chunks(task, iter_chunks(keywords, max(chunk_size, 1)), workers, max_pending):
+        yield from results
+
+
+def run_blog_batch(keywords, output, workers=None, word_limit=2000, chunk_size=CHUNK_SIZE, max_pending=None,
+                   trends=None, cache_size=TREND_CACHE_SIZE, ttl=TREND_TTL, html_dir=None, blog=None):
+    """모든 키워드의 포스트를 만들어 output(JSONL)에 끝나는 대로 기록; 보고서 dict 반환
+
+    report['trends']는 모든 워커를 합한 트렌드 캐시 지표
+    (lookups, hits, hit_ratio, avg_ms, max_ms).
+    blog(sitegen.blog_site.BlogBuilder)를 주면 포스트를 블로그에 쌓고 마지막에
+    바뀐 목록 / 태그 페이지, RSS, sitemap을 씀 (report['blog']).
+    """
+    started = time.perf_counter()
+    report = {'total': 0, 'succeeded': 0, 'failed': 0, 'output': str(output)}
+    lookups = hits = 0
+    lookup_seconds = max_seconds = 0.0
+    with open(output, 'w', encoding='utf-8') as f:
+        for result in iter_blog_batch(keywords, workers, word_limit, chunk_size, max_pending,
+                                      trends, cache_size, ttl, html_dir, bodies=blog is not None):
+            report['total'] += 1
+            if 'trend_seconds' in result:
+                lookups += 1
+                hits += result.pop('trend_hit')
+                lookup_seconds += result['trend_seconds']
+                max_seconds = max(max_seconds, result.pop('trend_seconds'))
+            if result['ok']:
+                report['succeeded'] += 1
+                line = dict(keyword=result['keyword'], **result['post'])
+                if 'page' in result:
+                    line['page'] = result['page']
+                f.write(json.dumps(line, ensure_ascii=False) + '\n')
+                if blog is not None:
+                    blog.add(result['keyword'], result['post'], result.pop('body'))
+            else:
+                report['failed'] += 1
+                print(f"FAIL  {result['keyword']}: {result['error']}")
+            if report['total'] % PROGRESS_EVERY == 0:
+                f.flush()
+                print(f"... {report['total']} posts ({time.perf_counter() - started:.1f}s)")
+    if blog is not None:
+        report['blog'] = blog.build()
+    report['seconds'] = time.perf_counter() - started
+    report['trends'] = {
+        'lookups': lookups,
+        'hits': hits,
+        'hit_ratio': hits / lookups if lookups else 0.0,
+        'avg_ms': lookup_seconds * 1000 / lookups if lookups else 0.0,
+        'max_ms': max_seconds * 1000,
+    }
+    return report
+
+
 # 실행 함수
 def run_blog_automation():
-    blog_bot = BlogAutomation()
+    blog_bot = WebsiteGenerator()
     result = blog_bot.create_blog_post("세무기장", 2000)
 
     print("=== 생성된 블로그 포스트 ===")
@@ -226,5 +480,52 @@ def run_blog_automation():
 
     return result
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="블로그 포스트 자동 생성 (키워드 파일이 있으면 배치 모드)")
+    parser.add_argument('--keywords', '-k', help="키워드 파일, 한 줄에 하나")
+    parser.add_argument('--output', '-o', default='posts.jsonl', help="배치 결과 JSONL (기본: posts.jsonl)")
+    parser.add_argument('--workers', '-w', type=int, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--word-limit', type=int, default=2000, help="포스트 목표 글자 수 (기본: 2000)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help=f"워커 작업당 키워드 수 (기본: {CHUNK_SIZE})")
+    parser.add_argument('--trends', help="트렌드 제공자: JSON/JSONL 파일 또는 SQLite(.db) (기본: 고정 샘플)")
+    parser.add_argument('--trend-cache-size', type=int, default=TREND_CACHE_SIZE,
+                        help=f"워커별 트렌드 캐시 항목 수 (기본: {TREND_CACHE_SIZE})")
+    parser.add_argument('--trend-ttl', type=float, default=TREND_TTL,
+                        help=f"트렌드 캐시 유효 시간(초) (기본: {TREND_TTL})")
+    parser.add_argument('--html-dir', help="포스트별 정적 HTML 페이지를 쓸 폴더")
+    parser.add_argument('--blog-dir', help="포스트를 쌓을 정적 블로그 폴더 (증분 빌드)")
+    parser.add_argument('--blog-url', default='https://example.com/', help="블로그 주소 (RSS / sitemap의 절대 URL)")
+    parser.add_argument('--blog-title', default='블로그', help="블로그 제목 (기본: 블로그)")
+    args = parser.parse_args(argv)
+
+    if not args.keywords:
+        run_blog_automation()
+        return 0
+    blog = None
+    try:
+        if args.blog_dir:
+            blog = BlogBuilder(args.blog_dir, args.blog_url, args.blog_title)
+        report = run_blog_batch(iter_keywords(args.keywords), args.output, args.workers, args.word_limit,
+                                args.chunk_size, trends=args.trends, cache_size=args.trend_cache_size,
+                                ttl=args.trend_ttl, html_dir=args.html_dir, blog=blog)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}")
+        return 2
+    finally:
+        if blog is not None:
+            blog.close()
+    rate = report['total'] / report['seconds'] if report['seconds'] else 0
+    print(f"\nTotal: {report['total']}  Succeeded: {report['succeeded']}  Failed: {report['failed']}")
+    print(f"Elapsed: {report['seconds']:.2f}s ({rate:.1f} posts/s) -> {report['output']}")
+    trends = report['trends']
+    print(f"Trends: {trends['hit_ratio']:.1%} cache hits ({trends['hits']}/{trends['lookups']}), "
+          f"lookup avg {trends['avg_ms']:.3f} ms, max {trends['max_ms']:.2f} ms")
+    if 'blog' in report:
+        blog_report = report['blog']
+        print(f"Blog: {blog_report['added']} added, {blog_report['changed']} changed, "
+              f"{blog_report['unchanged']} unchanged, {blog_report['pages']} pages written -> {args.blog_dir}")
+    return 1 if report['failed'] else 0
+
+
 if __name__ == "__main__":
-    run_blog_automation()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
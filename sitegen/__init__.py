@@ -0,0 +1,6 @@
+"""
+sitegen - shared core for the website generator scripts
+
+Keep this module free of heavy imports: the generator CLIs import it on
+every run.
+"""
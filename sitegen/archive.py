@@ -0,0 +1,102 @@
+"""
+Direct-to-archive output
+
+Streams rendered sites straight into one .zip or .tar.gz, one entry per
+file (`happy-cafe-website/index.html`), without creating any site folders.
+Has the same write(folder, files) interface as writer.BundleWriter, so it
+plugs into pipeline.build_site and the batch engine.
+
+The archive is written to `<path>.part` and renamed on close, so an
+interrupted run never leaves a truncated archive under the final name.
+
+    with ArchiveWriter('sites.zip') as archive:
+        build_site(config, 'v2', writer=archive)
+"""
+
+import io
+import os
+import time
+from pathlib import Path
+
+from .cache import MANIFEST_NAME
+
+FORMATS = {
+    '.zip': 'zip',
+    '.tar.gz': 'tar.gz',
+    '.tgz': 'tar.gz',
+}
+
+
+def archive_format(path):
+    """Archive format from the file name ('sites.zip' -> 'zip')."""
+    name = str(path).lower()
+    for suffix, fmt in FORMATS.items():
+        if name.endswith(suffix):
+            return fmt
+    raise ValueError(f"Unsupported archive '{path}' (use {', '.join(FORMATS)})")
+
+
+class ArchiveWriter:
+    """Append site bundles to a zip or tar.gz archive."""
+
+    def __init__(self, path, fmt=None):
+        self.path = Path(path)
+        self.format = fmt or archive_format(path)
+        self.partial = self.path.with_name(self.path.name + '.part')
+        self.entries = 0
+
+        if self.format == 'zip':
+            import zipfile
+            self._zip = zipfile
+            self._archive = zipfile.ZipFile(self.partial, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            import tarfile
+            self._tar = tarfile
+            self._archive = tarfile.open(self.partial, 'w:gz', compresslevel=6)
+
+    def write(self, folder, files):
+        """Add one site ({filename: str or bytes}) under folder/; return the folder name."""
+        folder = Path(folder).as_posix()
+        for name, content in files.items():
+            if name == MANIFEST_NAME:
+                continue  # only meaningful for on-disk incremental builds
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            self._add(f"{folder}/{name}", content)
+        return folder
+
+    def _add(self, arcname, data):
+        if self.format == 'zip':
+            info = self._zip.ZipInfo(arcname, time.localtime()[:6])
+            # Precompressed sidecars are stored as-is
+            stored = arcname.endswith(('.gz', '.br'))
+            info.compress_type = self._zip.ZIP_STORED if stored else self._zip.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._archive.writestr(info, data)
+        else:
+            info = self._tar.TarInfo(arcname)
+            info.size = len(data)
+            info.mtime = time.time()
+            info.mode = 0o644
+            self._archive.addfile(info, io.BytesIO(data))
+        self.entries += 1
+
+    def close(self):
+        """Finish the archive and move it to its final name."""
+        self._archive.close()
+        os.replace(self.partial, self.path)
+
+    def discard(self):
+        """Abandon the archive."""
+        self._archive.close()
+        self.partial.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
@@ -0,0 +1,129 @@
+"""
+Fingerprinted CSS / JS assets
+
+In asset mode the static <style> and <script> blocks of each page
+template are moved into files under assets/ and the page links them:
+
+    <style>:root { --primary: #2c3e50; --secondary: #3498db; }</style>
+    <link rel="stylesheet" href="assets/index.3f9a1c0b2d.css">
+
+Color slots inside the CSS become custom properties (var(--primary)), so
+the stylesheet is byte-identical for every site built from the same
+template and only the small :root block stays per business. Scripts that
+still contain slots (e.g. the business name) stay inline.
+
+File names carry a hash of the final content (after minification), so
+they can be served with `Cache-Control: immutable`.
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+from .templates import Template
+
+ASSET_DIR = 'assets'
+COLOR_SLOTS = ('primary', 'secondary', 'accent')
+
+_BLOCK = re.compile(r'<(style|script)>(.*?)</\1>', re.S)
+_SLOT = re.compile(r'\{\{\w+\}\}')
+_ASSET_REF = re.compile(r'(["\'])' + ASSET_DIR + r'/([\w-]+)\.(css|js)\1')
+
+
+def _asset_path(assets, stem, ext, content):
+    for path, existing in assets.items():
+        if existing == content and path.endswith('.' + ext):
+            return path  # same block on another page (e.g. the booking store script)
+    path = f"{ASSET_DIR}/{stem}.{ext}"
+    n = 1
+    while path in assets:
+        path = f"{ASSET_DIR}/{stem}-{n}.{ext}"
+        n += 1
+    return path
+
+
+def split_page(template, stem, assets=None):
+    """Move the slot-free style/script blocks of a page template into assets.
+
+    Returns (page template, {asset path: content}). Pass the assets of the
+    other pages to reuse their files for identical blocks.
+    """
+    assets = {} if assets is None else assets
+
+    def extract(match):
+        kind, body = match.groups()
+        if kind == 'style':
+            used = [name for name in COLOR_SLOTS if '{{' + name + '}}' in body]
+            for name in used:
+                body = body.replace('{{' + name + '}}', f'var(--{name})')
+            if _SLOT.search(body):
+                return match.group()
+            content = body.strip() + '\n'
+            path = _asset_path(assets, stem, 'css', content)
+            assets[path] = content
+            link = f'<link rel="stylesheet" href="{path}">'
+            if not used:
+                return link
+            variables = ' '.join(f'--{name}: {{{{{name}}}}};' for name in used)
+            return f'<style>:root {{ {variables} }}</style>\n    {link}'
+
+        if _SLOT.search(body):
+            return match.group()
+        content = body.strip() + '\n'
+        path = _asset_path(assets, stem, 'js', content)
+        assets[path] = content
+        return f'<script src="{path}"></script>'
+
+    return Template(_BLOCK.sub(extract, template.source)), assets
+
+
+@lru_cache(maxsize=None)
+def asset_pages(module):
+    """Asset-mode page templates of a generator: ({filename: Template}, {asset path: content}).
+
+    Computed once per generator module (i.e. per template version) and process.
+    """
+    pages = {}
+    assets = {}
+    for filename, template in module.PAGES.items():
+        pages[filename], _ = split_page(template, filename.rsplit('.', 1)[0], assets)
+    return pages, assets
+
+
+@lru_cache(maxsize=256)
+def content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+
+
+def fingerprint_assets(files, asset_url=None):
+    """Rename assets/<name>.<ext> to assets/<name>.<hash>.<ext> and relink the pages.
+
+    asset_url (e.g. 'https://cdn.example.com/assets/') makes pages load the
+    assets from a shared location instead of the site's own assets/ folder.
+    """
+    renamed = {}
+    result = {}
+    for name, content in files.items():
+        match = _ASSET_REF.fullmatch(f'"{name}"')
+        if match:
+            stem, ext = match.group(2), match.group(3)
+            hashed = f"{stem}.{content_hash(content)}.{ext}"
+            renamed[name] = hashed
+            result[f"{ASSET_DIR}/{hashed}"] = content
+        else:
+            result[name] = content
+    if not renamed:
+        return files
+
+    base = asset_url.rstrip('/') + '/' if asset_url else f"{ASSET_DIR}/"
+
+    def relink(match):
+        target = renamed.get(f"{ASSET_DIR}/{match.group(2)}.{match.group(3)}")
+        if target is None:
+            return match.group()
+        return f"{match.group(1)}{base}{target}{match.group(1)}"
+
+    for name, content in result.items():
+        if name.endswith('.html'):
+            result[name] = _ASSET_REF.sub(relink, content)
+    return result
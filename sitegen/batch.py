@@ -0,0 +1,221 @@
+"""
+Batch site generation
+
+Fans site builds out over a process pool so a whole list of business
+configs is built in parallel instead of one site at a time.
+
+Usage:
+    from sitegen.batch import run_batch, print_report
+
+    report = run_batch(configs, generator='v2', workers=8)
+    print_report(report)
+"""
+
+import os
+import time
+from functools import partial
+from itertools import islice
+
+from . import cache
+from .pipeline import GENERATORS, build_site, render_bundle
+from .writer import BundleWriter
+
+SYNC_BATCH = 16  # sites per sync barrier
+
+
+def build_one(generator, config, incremental=False, output_dir=None, writer=None, options=None):
+    """Build one site and return a result record (never raises)."""
+    name = config.get('business_name', '')
+    started = time.perf_counter()
+    hits = cache.stats['hits']
+    sizes = {} if options and options.get('compress') else None
+    try:
+        path = build_site(config, generator, incremental, output_dir, writer, options, sizes)
+        return {'name': name, 'ok': True, 'path': str(path), 'error': None,
+                'cached': cache.stats['hits'] > hits, 'seconds': time.perf_counter() - started,
+                'sizes': sizes or None}
+    except Exception as e:
+        return {'name': name, 'ok': False, 'path': None, 'error': f"{type(e).__name__}: {e}",
+                'cached': False, 'seconds': time.perf_counter() - started, 'sizes': None}
+
+
+def build_chunk(generator, configs, incremental=False, output_dir=None, sync=True, options=None):
+    """Build a chunk of sites that share one sync barrier; return their result records."""
+    writer = BundleWriter(sync=sync, batch_size=None)  # flushed once, below
+    results = [build_one(generator, config, incremental, output_dir, writer, options) for config in configs]
+    try:
+        writer.flush()
+    except Exception as e:
+        # Sites the flush did not rename into place were never written
+        committed = {str(folder) for folder in writer.committed}
+        for result in results:
+            if result['ok'] and not result['cached'] and result['path'] not in committed:
+                result.update(ok=False, path=None, error=f"{type(e).__name__}: {e}")
+    return results
+
+
+def render_chunk(generator, configs, output_dir=None, options=None):
+    """Render a chunk of sites in memory (archive mode); results carry their files."""
+    from .compress import size_report
+
+    results = []
+    for config in configs:
+        name = config.get('business_name', '')
+        started = time.perf_counter()
+        try:
+            folder, files = render_bundle(config, generator, output_dir, options)
+            sizes = size_report(files) if options and options.get('compress') else None
+            results.append({'name': name, 'ok': True, 'path': folder, 'error': None, 'cached': False,
+                            'seconds': time.perf_counter() - started, 'sizes': sizes, 'files': files})
+        except Exception as e:
+            results.append({'name': name, 'ok': False, 'path': None, 'error': f"{type(e).__name__}: {e}",
+                            'cached': False, 'seconds': time.perf_counter() - started, 'sizes': None})
+    return results
+
+
+def iter_chunks(configs, size):
+    """Group any iterable into lists of up to size items, lazily."""
+    iterator = iter(configs)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_batch(configs, generator='v2', workers=None, max_pending=None, output_dir=None,
+               incremental=False, sync=True, sync_batch=SYNC_BATCH, archive=None, options=None):
+    """Build every config and yield result records as sites complete.
+
+    configs may be any iterable (including a lazy generator); at most
+    max_pending chunks of sync_batch sites are in flight at once, so the
+    input is consumed only as fast as the pool drains it. Each chunk is
+    written atomically with one sync (sync=False skips it). With
+    incremental set, sites whose config and templates are unchanged since
+    the last build are skipped.
+
+    With archive set ('sites.zip' / 'sites.tar.gz') workers only render;
+    every site is streamed into that one archive and no folders are created.
+    options selects the output stages, e.g. {'minify': True}.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"Unknown generator '{generator}' (choose from {', '.join(GENERATORS)})")
+    if archive:
+        if incremental:
+            raise ValueError("incremental builds need site folders and cannot write to an archive")
+        yield from _iter_archive(configs, generator, workers, max_pending, output_dir, sync_batch, archive,
+                                 options)
+        return
+
+    task = partial(build_chunk, generator, incremental=incremental, output_dir=output_dir, sync=sync,
+                   options=options)
+    for results in map_chunks(task, iter_chunks(configs, max(sync_batch, 1)), workers, max_pending):
+        yield from results
+
+
+def map_chunks(task, chunks, workers=None, max_pending=None):
+    """Run task(chunk) for every chunk over the pool; yield each chunk's results as it finishes."""
+    workers = workers or os.cpu_count() or 1
+    max_pending = max(max_pending or workers * 2, 1)
+
+    if workers == 1:
+        # Serial fallback: no pool startup cost, easier to debug
+        for chunk in chunks:
+            yield task(chunk)
+        return
+
+    # Imported here: the pool machinery is most of the package's import time
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(pool.submit(task, chunk))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def _iter_archive(configs, generator, workers, max_pending, output_dir, chunk_size, archive, options):
+    """Render in the pool and append each finished site to the archive."""
+    from .archive import ArchiveWriter
+
+    with ArchiveWriter(archive) as writer:
+        task = partial(render_chunk, generator, output_dir=output_dir, options=options)
+        for results in map_chunks(task, iter_chunks(configs, max(chunk_size, 1)), workers, max_pending):
+            for result in results:
+                files = result.pop('files', None)
+                if files:
+                    writer.write(result['path'], files)
+                yield result
+
+
+def run_batch(configs, generator='v2', workers=None, max_pending=None, output_dir=None,
+              incremental=False, on_result=None, sync=True, sync_batch=SYNC_BATCH, archive=None, options=None):
+    """Build every config in parallel and return a success/failure report."""
+    started = time.perf_counter()
+    report = {'generator': generator, 'total': 0, 'succeeded': 0, 'failed': 0, 'cached': 0,
+              'sizes': None, 'results': []}
+
+    for result in iter_batch(configs, generator, workers, max_pending, output_dir, incremental,
+                             sync, sync_batch, archive, options):
+        report['total'] += 1
+        report['succeeded' if result['ok'] else 'failed'] += 1
+        report['cached'] += result['cached']
+        if result['sizes']:
+            report['sizes'] = add_sizes(report['sizes'], result['sizes'])
+        report['results'].append(result)
+        if on_result:
+            on_result(result)
+
+    report['seconds'] = time.perf_counter() - started
+    return report
+
+
+def add_sizes(total, sizes):
+    """Accumulate per-site byte counts ({'raw', 'gzip', 'brotli'}) into a total."""
+    if total is None:
+        return dict(sizes)
+    for key, value in sizes.items():
+        if value is not None:
+            total[key] = (total.get(key) or 0) + value
+    return total
+
+
+def format_sizes(sizes):
+    """'raw 24.1KB -> gzip 6.3KB (26%)' style summary of a size report."""
+    raw = sizes['raw'] or 1
+    text = f"raw {sizes['raw'] / 1024:.1f}KB -> gzip {sizes['gzip'] / 1024:.1f}KB ({sizes['gzip'] / raw:.0%})"
+    if sizes.get('brotli') is not None:
+        text += f", brotli {sizes['brotli'] / 1024:.1f}KB ({sizes['brotli'] / raw:.0%})"
+    return text
+
+
+def print_report(report):
+    """Print a per-site summary of a batch run."""
+    print()
+    print("=" * 50)
+    print(f"    Batch Report ({report['generator']})")
+    print("=" * 50)
+    for result in report['results']:
+        if result['cached']:
+            print(f"SKIP  {result['name']} -> {result['path']} (unchanged)")
+        elif result['ok']:
+            print(f"OK    {result['name']} -> {result['path']} ({result['seconds']:.2f}s)")
+            if result['sizes']:
+                print(f"      {format_sizes(result['sizes'])}")
+        else:
+            print(f"FAIL  {result['name']}: {result['error']}")
+    print()
+    rate = report['total'] / report['seconds'] if report['seconds'] else 0
+    print(f"Total: {report['total']}  Succeeded: {report['succeeded']}  Failed: {report['failed']}"
+          f"  Unchanged: {report['cached']}")
+    print(f"Elapsed: {report['seconds']:.2f}s ({rate:.1f} sites/s)")
+    if report['sizes']:
+        print(f"Bytes: {format_sizes(report['sizes'])}")
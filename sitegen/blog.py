@@ -0,0 +1,344 @@
+"""
+Blog post pages
+
+Turns the Markdown of a blog post (blog_automation.py) into a static
+HTML page. markdown_to_html covers the Markdown the generator writes:
+headings, paragraphs, - / 1. lists, > quotes, ``` code, --- rules and
+**bold** / *italic* / `code` / [link](url) inline.
+
+Posts of one keyword template differ only in their slots, so a
+MarkdownTemplate converts the template source once, {{slot}} markers and
+all, into two precompiled Templates: the Markdown and its HTML. A post is
+then one join with the (escaped) keyword dropped in, not a Markdown pass
+over 2,000 characters. Slot values are text: Markdown syntax inside them
+is shown as typed on the HTML side.
+
+    CONTENT = MarkdownTemplate("# {{keyword}}의 미래\\n...")
+    CONTENT.render({'keyword': '세무기장'})       # Markdown
+    body = CONTENT.render_html({'keyword': '세무기장'})
+    html = render_post_page(post, body)
+
+A SectionComposer splits such a template at its ## headings and emits
+sections in order until a length budget (characters or words) is spent.
+A section's length is known without rendering it - its static length
+plus the length of each slot value - so the running count is kept by
+addition, and short / medium / long variants come out of one pass.
+
+    COMPOSER = SectionComposer(source)
+    markdown, count, sections = COMPOSER.compose({'keyword': '세무기장'}, 800)
+    COMPOSER.variants({'keyword': '세무기장'}, {'short': 400, 'long': 2000})
+"""
+
+import re
+from html import escape
+
+from .templates import Template
+
+FENCE = '```'
+HEADING = re.compile(r'(#{1,6})\s+(.*)')
+BULLET = re.compile(r'[-*+]\s+(.*)')
+NUMBERED = re.compile(r'\d+[.)]\s+(.*)')
+RULE = re.compile(r'(?:-{3,}|\*{3,}|_{3,})')
+INLINE = [
+    (re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    (re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])'), r'<em>\1</em>'),
+    (re.compile(r'\[([^\]]+)\]\(([^)\s]+)\)'), r'<a href="\2">\1</a>'),
+]
+
+
+def inline_html(text):
+    """Escape a line of text and apply the inline markup."""
+    text = escape(text, quote=False)
+    for pattern, replacement in INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def markdown_to_html(text):
+    """HTML for the Markdown subset the blog generator writes."""
+    out = []
+    paragraph = []
+    items = []      # open list: (tag, [item html])
+    quote = []
+    code = None     # lines of an open ``` block
+
+    def flush():
+        if paragraph:
+            out.append(f"<p>{inline_html(chr(10).join(paragraph))}</p>")
+            paragraph.clear()
+        if items:
+            tag, lis = items.pop()
+            out.append(f"<{tag}>" + ''.join(f"<li>{li}</li>" for li in lis) + f"</{tag}>")
+        if quote:
+            out.append(f"<blockquote><p>{inline_html(chr(10).join(quote))}</p></blockquote>")
+            quote.clear()
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if code is not None:
+            if stripped.startswith(FENCE):
+                out.append(f"<pre><code>{escape(chr(10).join(code), quote=False)}</code></pre>")
+                code = None
+            else:
+                code.append(line)
+            continue
+        if stripped.startswith(FENCE):
+            flush()
+            code = []
+            continue
+        if not stripped:
+            flush()
+            continue
+
+        heading = HEADING.fullmatch(stripped)
+        bullet = BULLET.fullmatch(stripped)
+        numbered = NUMBERED.fullmatch(stripped)
+        if heading:
+            flush()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline_html(heading.group(2))}</h{level}>")
+        elif RULE.fullmatch(stripped):
+            flush()
+            out.append("<hr>")
+        elif bullet or numbered:
+            tag = 'ul' if bullet else 'ol'
+            if paragraph or quote or (items and items[0][0] != tag):
+                flush()
+            if not items:
+                items.append((tag, []))
+            items[0][1].append(inline_html((bullet or numbered).group(1)))
+        elif stripped.startswith('>'):
+            if paragraph or items:
+                flush()
+            quote.append(stripped[1:].strip())
+        else:
+            if items or quote:
+                flush()
+            paragraph.append(stripped)
+
+    if code is not None:
+        out.append(f"<pre><code>{escape(chr(10).join(code), quote=False)}</code></pre>")
+    flush()
+    return '\n'.join(out)
+
+
+class MarkdownTemplate:
+    """Markdown source with {{slot}} markers, compiled to Markdown and HTML templates once."""
+
+    def __init__(self, source):
+        self.markdown = Template(source)
+        self.html = Template(markdown_to_html(source))
+        if self.html.slot_names != self.markdown.slot_names:
+            raise ValueError("Slots must stay in plain text (not in code blocks or link URLs)")
+
+    def render(self, values):
+        """The Markdown with every slot filled."""
+        return self.markdown.render(values)
+
+    def render_html(self, values):
+        """The HTML body with every slot filled (values are HTML-escaped)."""
+        return self.html.render({name: escape(str(value), quote=False) for name, value in values.items()})
+
+
+def count_words(text):
+    return len(text.split())
+
+
+UNITS = {'chars': len, 'words': count_words}
+
+
+class SectionComposer:
+    """Markdown template composed ## section by ## section up to a length budget.
+
+    The first section (the title and lead before the first ##) is always
+    kept; after it, composing stops at the first section that would go
+    over the limit. Word counts treat slot values as non-empty text.
+    """
+
+    SECTION_START = re.compile(r'(?m)^(?=## )')
+
+    def __init__(self, source):
+        self.sections = [MarkdownTemplate(part) for part in self.SECTION_START.split(source) if part]
+        self.sizes = {unit: [self._size(section.markdown, measure) for section in self.sections]
+                      for unit, measure in UNITS.items()}
+
+    @staticmethod
+    def _size(template, measure):
+        """(static length, {slot: occurrences}) of a section; a slot counts as one character / word."""
+        slots = {}
+        for _, name in template.slots:
+            slots[name] = slots.get(name, 0) + 1
+        return measure(template.render(dict.fromkeys(slots, 'x'))) - sum(slots.values()), slots
+
+    def iter_sections(self, values, unit='chars'):
+        """Yield (section index, running count) for every section, measured for values."""
+        measure = UNITS[unit]
+        value_sizes = {name: measure(str(value)) for name, value in values.items()}
+        count = 0
+        for index, (static, slots) in enumerate(self.sizes[unit]):
+            count += static + sum(value_sizes[name] * times for name, times in slots.items())
+            yield index, count
+
+    def fit(self, values, limit, unit='chars'):
+        """(number of sections, their count) that fit in limit."""
+        kept, total = 0, 0
+        for index, count in self.iter_sections(values, unit):
+            if index and count > limit:
+                break
+            kept, total = index + 1, count
+        return kept, total
+
+    def compose(self, values, limit, unit='chars'):
+        """(markdown, count, number of sections) of the sections that fit in limit."""
+        kept, count = self.fit(values, limit, unit)
+        return ''.join(section.render(values) for section in self.sections[:kept]), count, kept
+
+    def variants(self, values, limits, unit='chars'):
+        """{name: (markdown, count, sections)} for several limits, e.g. {'short': 400, 'long': 2000}.
+
+        One pass over the section counts; each section is rendered at most
+        once and shared by every variant that includes it.
+        """
+        cuts = {}
+        open_limits = sorted(limits.items(), key=lambda item: item[1])
+        previous = (0, 0)
+        for index, count in self.iter_sections(values, unit):
+            while open_limits and index and count > open_limits[0][1]:
+                cuts[open_limits.pop(0)[0]] = previous
+            if not open_limits:
+                break
+            previous = (index + 1, count)
+        for name, _ in open_limits:
+            cuts[name] = previous
+
+        rendered = [section.render(values) for section in self.sections[:max(kept for kept, _ in cuts.values())]]
+        return {name: (''.join(rendered[:kept]), count, kept) for name, (kept, count) in cuts.items()}
+
+    def render(self, values, sections=None):
+        """The Markdown of the first sections (all by default)."""
+        return ''.join(section.render(values) for section in self.sections[:sections])
+
+    def render_html(self, values, sections=None):
+        """The HTML of the first sections (all by default), from the precompiled section templates."""
+        return '\n'.join(filter(None, (section.render_html(values) for section in self.sections[:sections])))
+
+
+# Shared by post pages and the list pages of sitegen.blog_site
+BLOG_CSS = """
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Apple SD Gothic Neo', 'Segoe UI', sans-serif; color: #1D1D1F; background: #fff; margin: 0; line-height: 1.7; }
+        article { max-width: 720px; margin: 0 auto; padding: 4rem 1.5rem; }
+        .meta { color: #86868B; font-size: 0.9rem; margin-bottom: 2rem; }
+        h1 { font-size: 2.5rem; line-height: 1.2; letter-spacing: -0.02em; margin: 0 0 0.5rem; }
+        h2 { font-size: 1.75rem; margin: 3rem 0 1rem; }
+        h3 { font-size: 1.25rem; margin: 2rem 0 0.75rem; }
+        pre { background: #F5F5F7; border-radius: 12px; padding: 1rem 1.25rem; overflow-x: auto; }
+        blockquote { border-left: 3px solid #007AFF; margin: 1.5rem 0; padding-left: 1rem; color: #515154; }
+        hr { border: 0; border-top: 1px solid #D2D2D7; margin: 3rem 0; }
+        .tags { display: flex; flex-wrap: wrap; gap: 0.5rem; padding: 0; list-style: none; }
+        .tags li { background: #F5F5F7; border-radius: 980px; padding: 0.25rem 0.9rem; font-size: 0.85rem; }
+        figure { background: #F5F5F7; border-radius: 12px; margin: 1.5rem 0; padding: 1.25rem; }
+        figcaption { font-weight: 600; margin-bottom: 0.25rem; }
+        nav { font-weight: 600; margin-bottom: 2rem; }
+        a { color: #0066CC; text-decoration: none; }
+        .tags a { color: inherit; }
+        .posts { list-style: none; padding: 0; }
+        .posts li { border-bottom: 1px solid #D2D2D7; padding: 1.25rem 0; }
+        .posts p { color: #515154; margin: 0.25rem 0 0; }
+        .pager { display: flex; justify-content: space-between; margin-top: 2rem; }
+"""
+
+POST_PAGE = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}}</title>
+    <meta name="description" content="{{description}}">
+    <meta name="keywords" content="{{keywords}}">
+    <style>""" + BLOG_CSS + """    </style>
+</head>
+<body>
+    <article>
+{{nav}}        <p class="meta">{{created_date}} · {{word_count}}자 · {{style}}</p>
+{{body}}
+        <section class="images">
+{{images}}
+        </section>
+        <ul class="tags">{{tags}}</ul>
+    </article>
+</body>
+</html>
+""")
+
+
+def post_slug(keyword):
+    """File-safe slug of a keyword ('세무기장 비용?' -> '세무기장-비용')."""
+    return re.sub(r'[^\w]+', '-', keyword.strip().lower()).strip('-') or 'post'
+
+
+def numbered_slugs(keyword):
+    """post_slug(keyword), then its -2, -3 ... variants: the slugs to try when one is taken."""
+    base = post_slug(keyword)
+    yield base
+    number = 2
+    while True:
+        yield f'{base}-{number}'
+        number += 1
+
+
+class SlugTable:
+    """Page slugs that stay distinct across keywords ('AI tools' -> 'ai-tools', 'ai-tools' -> 'ai-tools-2').
+
+    A keyword keeps the slug it was first given; the table lives for one
+    run (sitegen.blog_site keeps the same assignment in its index).
+    """
+
+    def __init__(self):
+        self.slugs = {}     # keyword -> slug
+        self.taken = set()
+
+    def get(self, keyword):
+        slug = self.slugs.get(keyword)
+        if slug is None:
+            slug = next(slug for slug in numbered_slugs(keyword) if slug not in self.taken)
+            self.slugs[keyword] = slug
+            self.taken.add(slug)
+        return slug
+
+
+def tag_url(tag, root=''):
+    """Link to a tag's page in a built blog (sitegen.blog_site)."""
+    return f"{root}tags/{post_slug(tag)}/index.html"
+
+
+def render_post_page(post, body=None, root=None, home='홈'):
+    """Static HTML page of a post ({'metadata', 'content', 'images', 'trends'}).
+
+    body is the post's HTML if already rendered (MarkdownTemplate.render_html);
+    otherwise the content Markdown is converted here. With root (the
+    relative path to a built blog's top, e.g. '../') the page links back
+    to the blog's home and tag pages.
+    """
+    metadata = post['metadata']
+    if body is None:
+        body = markdown_to_html(post['content'])
+    images = ''.join(
+        f"""        <figure><figcaption>{escape(image['title'])}</figcaption>"""
+        f"""<p>{escape(image['description'])}</p></figure>\n"""
+        for image in post.get('images', ()))
+    return POST_PAGE.render({
+        'title': escape(metadata['title']),
+        'description': escape(metadata['description']),
+        'keywords': escape(', '.join(metadata['keywords'])),
+        'created_date': escape(metadata['created_date']),
+        'word_count': str(metadata['word_count']),
+        'style': escape(metadata['style']),
+        'body': body,
+        'images': images,
+        'tags': ''.join(
+            f"<li>{escape(tag)}</li>" if root is None else
+            f"<li><a href=\"{escape(tag_url(tag, root))}\">{escape(tag)}</a></li>"
+            for tag in metadata['keywords']),
+        'nav': '' if root is None else f"""        <nav><a href="{root}index.html">{escape(home)}</a></nav>\n""",
+    })
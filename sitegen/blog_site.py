@@ -0,0 +1,445 @@
+"""
+Static blog builder
+
+Accumulates blog posts (blog_automation.py) into a static site folder:
+
+    posts/<slug>.html               one page per post
+    index.html, page/<n>.html       the newest posts, then numbered archive pages
+    tags/index.html                 every tag with its post count
+    tags/<tag>/index.html, <n>.html the same per tag (tags are metadata['keywords'])
+    rss.xml                         the newest posts
+    sitemap.xml, sitemaps/*.xml     a sitemap index over fixed-size chunks
+
+Builds are incremental. What the folder holds is recorded in a SQLite
+index (.blog.db) - every post's keyword, slug, hash, title, tags and
+position - so a build writes only the pages its new or changed posts land on.
+Archive pages are numbered from the oldest post: page n always holds
+posts n*page_size-page_size+1 .. n*page_size in the order they were first
+added, so appending posts rewrites only the last page(s), never the
+thousands before them. The same holds for tag pages and sitemap chunks.
+A changed post keeps its position; only its own page, the list pages it
+appears on and its sitemap chunk are rewritten. index.html, the tag
+index, rss.xml and sitemap.xml are small and rewritten on every build
+that changed something.
+
+A post keeps the slug and created date it was first added with. Two
+keywords with the same slug ('세무 비용' and '세무-비용') get distinct
+pages: the later one's slug gains a suffix ('세무-비용-2').
+
+    with BlogBuilder('blog', base_url='https://blog.example.com/') as blog:
+        for keyword, post in posts:
+            blog.add(keyword, post)
+    # on exit: list pages, feed and sitemap; blog.report has the counts
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from html import escape
+from pathlib import Path
+
+from .blog import BLOG_CSS, numbered_slugs, post_slug, render_post_page
+from .templates import Template
+
+INDEX_NAME = '.blog.db'
+PAGE_SIZE = 20
+FEED_SIZE = 20
+SITEMAP_SIZE = 10000  # URLs per sitemap chunk (the protocol allows 50,000)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    seq INTEGER PRIMARY KEY,       -- 1, 2, 3 ... in the order posts were first added
+    slug TEXT NOT NULL UNIQUE,
+    keyword TEXT,                  -- what add() was called with (NULL in indexes built before it was kept)
+    hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    created TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    tags TEXT NOT NULL              -- JSON list of tag names
+);
+CREATE UNIQUE INDEX IF NOT EXISTS posts_keyword ON posts (keyword);
+CREATE TABLE IF NOT EXISTS post_tags (
+    tag TEXT NOT NULL,             -- tag slug
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (tag, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0   -- rows in post_tags, kept by add()
+);
+"""
+
+LIST_PAGE = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}}</title>
+    <link rel="alternate" type="application/rss+xml" href="{{root}}rss.xml">
+    <style>""" + BLOG_CSS + """    </style>
+</head>
+<body>
+    <article>
+        <nav><a href="{{root}}index.html">{{blog_title}}</a> · <a href="{{root}}tags/index.html">태그</a></nav>
+        <h1>{{heading}}</h1>
+        <ul class="posts">
+{{items}}        </ul>
+        <p class="pager">{{pager}}</p>
+    </article>
+</body>
+</html>
+""")
+
+RSS = Template("""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+<title>{{title}}</title>
+<link>{{link}}</link>
+<description>{{title}}</description>
+<lastBuildDate>{{built}}</lastBuildDate>
+{{items}}</channel>
+</rss>
+""")
+
+URLSET = Template("""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{{urls}}</urlset>
+""")
+
+SITEMAP_INDEX = Template("""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{{sitemaps}}</sitemapindex>
+""")
+
+
+def post_hash(post):
+    """Content hash of a post: a post whose hash is unchanged is not rewritten.
+
+    created_date is left out: it is the day the post was generated, so
+    regenerating the same post on another day is not a change.
+    """
+    metadata = {key: value for key, value in post['metadata'].items() if key != 'created_date'}
+    payload = json.dumps({**post, 'metadata': metadata}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def write_text(path, text):
+    """Replace path with text (written to a temp file first, so readers never see half a page)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f'.{path.name}.tmp')
+    temp.write_text(text, encoding='utf-8')
+    os.replace(temp, path)
+
+
+def page_count(total, size):
+    return max((total + size - 1) // size, 1)
+
+
+class BlogBuilder:
+    """Incremental static blog in folder; add() posts, then build() (or use as a context manager)."""
+
+    def __init__(self, folder, base_url='https://example.com/', title='블로그', page_size=PAGE_SIZE,
+                 feed_size=FEED_SIZE, sitemap_size=SITEMAP_SIZE):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.base_url = base_url.rstrip('/') + '/'
+        self.title = title
+        self.page_size = max(page_size, 1)
+        self.feed_size = feed_size
+        self.sitemap_size = sitemap_size
+        self.db = sqlite3.connect(str(self.folder / INDEX_NAME))
+        if self.db.execute("SELECT 1 FROM sqlite_master WHERE name = 'posts'").fetchone() and not any(
+                column[1] == 'keyword' for column in self.db.execute("PRAGMA table_info(posts)")):
+            self.db.execute("ALTER TABLE posts ADD COLUMN keyword TEXT")
+        self.db.executescript(SCHEMA)
+        self._reset()
+
+    def _reset(self):
+        self.total = self.posts_before = self.db.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+        self.pages = set()          # archive page numbers to rewrite
+        self.tag_pages = {}         # tag -> set of page numbers to rewrite
+        self.tag_tails = {}         # tag -> first page number whose later pages all shift
+        self.sitemap_chunks = set()
+        self.report = {'added': 0, 'changed': 0, 'unchanged': 0, 'pages': 0}
+
+    def _tag_count(self, tag):
+        return self.db.execute("SELECT count FROM tags WHERE tag = ?", (tag,)).fetchone()[0]
+
+    def _tag_page(self, tag, seq):
+        """Archive page of a tag that post seq is on (a range count: used for changed posts only)."""
+        position = self.db.execute("SELECT COUNT(*) FROM post_tags WHERE tag = ? AND seq < ?",
+                                   (tag, seq)).fetchone()[0]
+        return position // self.page_size + 1
+
+    def _find(self, keyword):
+        """(row, slug) of keyword's post; row is (seq, hash, created, tags), or None for a new post.
+
+        A slug already taken by another keyword gets a numeric suffix. A
+        post indexed without its keyword is claimed by the first keyword
+        with its slug.
+        """
+        row = self.db.execute("SELECT seq, hash, created, tags, slug FROM posts WHERE keyword = ?",
+                              (keyword,)).fetchone()
+        if row:
+            return row[:4], row[4]
+        for slug in numbered_slugs(keyword):
+            row = self.db.execute("SELECT seq, hash, created, tags, keyword FROM posts WHERE slug = ?",
+                                  (slug,)).fetchone()
+            if row is None:
+                return None, slug
+            if row[4] is None:
+                self.db.execute("UPDATE posts SET keyword = ? WHERE seq = ?", (keyword, row[0]))
+                return row[:4], slug
+
+    def _write(self, name, text):
+        write_text(self.folder / name, text)
+        self.report['pages'] += 1
+
+    def add(self, keyword, post, body=None):
+        """Add or update the post for keyword; returns 'added', 'changed' or 'unchanged'.
+
+        The post page is written right away; the list pages, feed and
+        sitemap it affects are written by build(). body is the post's
+        HTML if already rendered (see sitegen.blog.render_post_page).
+        """
+        digest = post_hash(post)
+        row, slug = self._find(keyword)
+        if row and row[1] == digest:
+            self.report['unchanged'] += 1
+            return 'unchanged'
+        if row:
+            # A changed post keeps the date it was first published with
+            post = {**post, 'metadata': {**post['metadata'], 'created_date': row[2]}}
+
+        metadata = post['metadata']
+        now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        names = list(dict.fromkeys(metadata.get('keywords', [])))
+        values = (digest, metadata['title'], metadata['description'], metadata['created_date'], now,
+                  json.dumps(names, ensure_ascii=False))
+        if row:
+            seq, old_names = row[0], json.loads(row[3])
+            self.db.execute("UPDATE posts SET hash = ?, title = ?, description = ?, created = ?, updated = ?,"
+                            " tags = ? WHERE seq = ?", values + (seq,))
+        else:
+            self.total += 1
+            seq, old_names = self.total, []
+            self.db.execute("INSERT INTO posts (hash, title, description, created, updated, tags, seq, slug,"
+                            " keyword) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values + (seq, slug, keyword))
+
+        tags = {post_slug(name): name for name in names}
+        old_tags = {post_slug(name) for name in old_names}
+        for tag in old_tags - tags.keys():
+            # Later posts of the tag move up a place: every page from this one on changes
+            page = self._tag_page(tag, seq)
+            self.tag_tails[tag] = min(self.tag_tails.get(tag, page), page)
+            self.db.execute("DELETE FROM post_tags WHERE tag = ? AND seq = ?", (tag, seq))
+            self.db.execute("UPDATE tags SET count = count - 1 WHERE tag = ?", (tag,))
+        for tag, name in tags.items():
+            if tag in old_tags:
+                self.tag_pages.setdefault(tag, set()).add(self._tag_page(tag, seq))
+                continue
+            self.db.execute("INSERT OR IGNORE INTO tags (tag, name) VALUES (?, ?)", (tag, name))
+            self.db.execute("UPDATE tags SET count = count + 1 WHERE tag = ?", (tag,))
+            self.db.execute("INSERT INTO post_tags (tag, seq) VALUES (?, ?)", (tag, seq))
+            if row:
+                # A new tag on an old post slots it in among the tag's posts
+                page = self._tag_page(tag, seq)
+                self.tag_tails[tag] = min(self.tag_tails.get(tag, page), page)
+            else:
+                # A new post goes last; if it starts a page, the one before gains a link to it
+                position = self._tag_count(tag) - 1
+                page = position // self.page_size + 1
+                self.tag_pages.setdefault(tag, set()).add(page)
+                if position and position % self.page_size == 0:
+                    self.tag_pages[tag].add(page - 1)
+
+        self.pages.add((seq - 1) // self.page_size + 1)
+        self.sitemap_chunks.add((seq - 1) // self.sitemap_size + 1)
+        self.report['changed' if row else 'added'] += 1
+        page = render_post_page(post, body, root='../', home=self.title)
+        self._write(f'posts/{slug}.html', page)
+        return 'changed' if row else 'added'
+
+    def build(self):
+        """Write the list pages, feed and sitemap affected since the last build; returns the report."""
+        if not (self.report['added'] or self.report['changed']):
+            self.db.commit()
+            return self.report
+        total = self.total
+
+        pages = page_count(total, self.page_size)
+        if pages > page_count(self.posts_before, self.page_size):
+            # The old last page gains a link to the new one after it
+            self.pages.add(page_count(self.posts_before, self.page_size))
+        for number in sorted(self.pages):
+            self._write_archive(number, pages)
+        self._write_latest(total, pages)
+
+        for tag in sorted(self.tag_pages.keys() | self.tag_tails.keys()):
+            self._write_tag(tag)
+        self._write_tag_index()
+        self._write_feed()
+        self._write_sitemaps(total)
+        self.db.commit()
+        report = self.report
+        self._reset()
+        return report
+
+    # List pages
+
+    def _item(self, row, root):
+        slug, title, description, created = row
+        return (f"""            <li><a href="{root}posts/{escape(slug)}.html">{escape(title)}</a> """
+                f"""<time>{escape(created)}</time><p>{escape(description)}</p></li>\n""")
+
+    def _list_page(self, name, heading, rows, root, newer=None, older=None):
+        pager = ''
+        if older:
+            pager += f'<a href="{older}">← 이전 글</a>'
+        if newer:
+            pager += f'<a href="{newer}">다음 글 →</a>'
+        self._write(name, LIST_PAGE.render({
+            'title': escape(f"{heading} - {self.title}" if heading != self.title else heading),
+            'blog_title': escape(self.title),
+            'heading': escape(heading),
+            'items': ''.join(self._item(row, root) for row in rows),
+            'pager': pager,
+            'root': root,
+        }))
+
+    def _archive_rows(self, number):
+        first = (number - 1) * self.page_size + 1
+        return self.db.execute(
+            "SELECT slug, title, description, created FROM posts WHERE seq BETWEEN ? AND ? ORDER BY seq DESC",
+            (first, first + self.page_size - 1)).fetchall()
+
+    def _write_archive(self, number, pages):
+        self._list_page(f'page/{number}.html', f"전체 글 - {number}페이지", self._archive_rows(number),
+                        '../', newer=f'{number + 1}.html' if number < pages else None,
+                        older=f'{number - 1}.html' if number > 1 else None)
+
+    def _write_latest(self, total, pages):
+        rows = self.db.execute("SELECT slug, title, description, created FROM posts ORDER BY seq DESC LIMIT ?",
+                               (self.page_size,)).fetchall()
+        # The newest page_size posts can straddle the last two archive pages; link past both
+        older = total - self.page_size
+        self._list_page('index.html', self.title, rows, '',
+                        older=f'page/{(older - 1) // self.page_size + 1}.html' if older > 0 else None)
+
+    def _tag_latest(self, tag):
+        return self.db.execute(
+            "SELECT p.slug, p.title, p.description, p.created FROM post_tags t JOIN posts p ON p.seq = t.seq"
+            " WHERE t.tag = ? ORDER BY t.seq DESC LIMIT ?", (tag, self.page_size)).fetchall()
+
+    def _iter_tag_pages(self, tag, numbers):
+        """(number, rows newest first) for the tag's archive pages in numbers.
+
+        Consecutive pages come from one query, so the OFFSET skip is paid
+        once per run of pages rather than once per page.
+        """
+        numbers = sorted(numbers)
+        while numbers:
+            first = last = numbers.pop(0)
+            while numbers and numbers[0] == last + 1:
+                last = numbers.pop(0)
+            rows = self.db.execute(
+                "SELECT p.slug, p.title, p.description, p.created FROM post_tags t JOIN posts p ON p.seq = t.seq"
+                " WHERE t.tag = ? ORDER BY t.seq LIMIT ? OFFSET ?",
+                (tag, (last - first + 1) * self.page_size, (first - 1) * self.page_size))
+            for number in range(first, last + 1):
+                yield number, rows.fetchmany(self.page_size)[::-1]
+
+    def _write_tag(self, tag):
+        name = self.db.execute("SELECT name FROM tags WHERE tag = ?", (tag,)).fetchone()[0]
+        total = self._tag_count(tag)
+        pages = page_count(total, self.page_size)
+        numbers = set(self.tag_pages.get(tag, ()))
+        tail = self.tag_tails.get(tag)
+        if tail is not None:
+            numbers.update(range(tail, pages + 1))
+        folder = f'tags/{tag}'
+        for number, rows in self._iter_tag_pages(tag, {number for number in numbers if 1 <= number <= pages}):
+            self._list_page(f'{folder}/{number}.html', f"#{name} - {number}페이지", rows, '../../',
+                            newer=f'{number + 1}.html' if number < pages else None,
+                            older=f'{number - 1}.html' if number > 1 else None)
+        # Pages past the end are left over from posts that dropped the tag
+        stale = pages + 1
+        while (self.folder / folder / f'{stale}.html').exists():
+            (self.folder / folder / f'{stale}.html').unlink()
+            stale += 1
+        older = total - self.page_size
+        self._list_page(f'{folder}/index.html', f"#{name}", self._tag_latest(tag),
+                        '../../', older=f'{(older - 1) // self.page_size + 1}.html' if older > 0 else None)
+
+    def _write_tag_index(self):
+        rows = self.db.execute("SELECT tag, name, count FROM tags WHERE count > 0 ORDER BY count DESC, name").fetchall()
+        items = ''.join(f"""            <li><a href="{escape(tag)}/index.html">#{escape(name)}</a> <time>{count}</time></li>\n"""
+                        for tag, name, count in rows)
+        self._write('tags/index.html', LIST_PAGE.render({
+            'title': escape(f"태그 - {self.title}"), 'blog_title': escape(self.title), 'heading': '태그',
+            'items': items, 'pager': '', 'root': '../',
+        }))
+
+    # Feed and sitemap
+
+    def _write_feed(self):
+        rows = self.db.execute("SELECT slug, title, description, created FROM posts ORDER BY seq DESC LIMIT ?",
+                               (self.feed_size,)).fetchall()
+        items = ''.join(
+            f"<item><title>{escape(title)}</title><link>{escape(self.base_url)}posts/{escape(slug)}.html</link>"
+            f"<guid>{escape(self.base_url)}posts/{escape(slug)}.html</guid><description>{escape(description)}"
+            f"</description><pubDate>{format_datetime(self._published(created))}</pubDate></item>\n"
+            for slug, title, description, created in rows)
+        self._write('rss.xml', RSS.render({
+            'title': escape(self.title),
+            'link': escape(self.base_url),
+            'built': format_datetime(datetime.now(timezone.utc)),
+            'items': items,
+        }))
+
+    @staticmethod
+    def _published(created):
+        """RFC 822 date of a post's created date (a bare 'YYYY-MM-DD' is taken as midnight UTC)."""
+        published = datetime.fromisoformat(created)
+        return published if published.tzinfo else published.replace(tzinfo=timezone.utc)
+
+    def _url(self, path, lastmod=None):
+        lastmod = f"<lastmod>{lastmod}</lastmod>" if lastmod else ''
+        return f"<url><loc>{escape(self.base_url + path)}</loc>{lastmod}</url>\n"
+
+    def _write_sitemaps(self, total):
+        chunks = page_count(total, self.sitemap_size)
+        for number in sorted(self.sitemap_chunks):
+            first = (number - 1) * self.sitemap_size + 1
+            rows = self.db.execute("SELECT slug, updated FROM posts WHERE seq BETWEEN ? AND ? ORDER BY seq",
+                                   (first, first + self.sitemap_size - 1))
+            self._write(f'sitemaps/posts-{number}.xml', URLSET.render({
+                'urls': ''.join(self._url(f'posts/{slug}.html', updated[:10]) for slug, updated in rows)}))
+        tags = self.db.execute("SELECT tag FROM tags WHERE count > 0").fetchall()
+        self._write('sitemaps/pages.xml', URLSET.render({
+            'urls': self._url('index.html') + ''.join(self._url(f'tags/{tag}/index.html') for tag, in tags)}))
+        today = datetime.now(timezone.utc).date().isoformat()
+        names = ['pages.xml'] + [f'posts-{number}.xml' for number in range(1, chunks + 1)]
+        self._write('sitemap.xml', SITEMAP_INDEX.render({'sitemaps': ''.join(
+            f"<sitemap><loc>{escape(self.base_url)}sitemaps/{name}</loc><lastmod>{today}</lastmod></sitemap>\n"
+            for name in names)}))
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.build()
+            else:
+                self.db.rollback()
+        finally:
+            self.close()
@@ -0,0 +1,1104 @@
+"""
+Booking store client for the generated pages
+
+Every booking form and admin panel goes through one small store object
+instead of touching localStorage directly. BOOKING_SCRIPT is all a
+visitor page loads: openBookingStore() with add(). Admin pages also load
+BOOKING_ADMIN_SCRIPT, which gives the same store its reading and editing
+side (list, page, stats, history, update, watch, addMany) and the admin
+panel helpers (showHistory, patchList, escapeHtml):
+
+    const bookingStore = openBookingStore('happy-cafe-website', {from: 'bookings', business: 'Happy Cafe'});
+    bookingStore.add(booking).then(...);
+    bookingStore.watch(bookings => ..., {business: 'Happy Cafe'});    // admin panels: render on every change
+
+Each site has its own storage key, 'bookings:<site folder>', so sites
+served from one origin (a preview host with many *-website folders) never
+read each other's bookings. Earlier versions shared one localStorage key
+('bookings', 'custom_bookings' or 'website_bookings') between all sites
+and filtered by business name; a site moves its own bookings out of that
+array the first time it opens and leaves the others' in place. Pages get
+the arguments from store_args().
+
+By default the store keeps the bookings in this browser's IndexedDB: one
+database per site, keyed by booking id and indexed on
+business, status and createdAt. A booking write stores one record
+instead of re-serializing every booking, and admin panels ask for
+list({business: ...}) through the indexes. Browsers without IndexedDB
+keep the site's bookings as one array in localStorage.
+
+Dashboard numbers come from counters, not from the bookings: next to
+the bookings the database keeps one record per day, {day, statuses:
+{status: count}}, which add() and update() adjust in the same
+transaction. stats() ({total, today, statuses}) and history(by, since)
+(per day, week or month) read those few records however many bookings
+the site has; showHistory() draws the weekly and monthly bars of the
+admin panels. The booking server keeps the same counters (see
+booking_store).
+
+A site built with --backend URL gets a <meta name="booking-api"> tag
+pointing at its own tenant on the booking server (python -m
+sitegen.server), and the same calls go there instead, so every
+visitor's bookings reach the admin panel. Every call but add() is an
+admin request: the panel asks for the server's admin token once per
+browser session and sends it along.
+
+Admin panels do not poll: they re-render when another tab writes the
+bookings (BroadcastChannel, or the storage event in the localStorage
+fallback) or on server-sent events from the booking server, and only
+when the bookings actually changed. They draw their lists with
+patchList(), which keys rows by booking id and only touches the rows
+that were added, changed or removed.
+
+BOOKING_TABLE_SCRIPT adds openBookingTable() for the v2 / demo admin
+tables: a virtual table that keeps only the rows in view in the DOM,
+fetches bookings a page at a time by cursor (bookingStore.page()) and
+takes its totals from bookingStore.stats(), so a site with 100k bookings
+opens with one page and one stats request.
+
+BOOKING_TRANSFER_SCRIPT adds the admin panels' backups: exportBookings()
+downloads every booking as NDJSON or CSV a page at a time (or straight
+from the booking server's streaming /export), importBookings() reads an
+NDJSON file as a stream and stores it in batches through addMany().
+
+The scripts have no slots, so in asset mode each becomes one shared file.
+"""
+
+import json
+from html import escape
+from urllib.parse import quote
+
+BOOKING_SCRIPT = """<script>
+        // Booking store: the booking server named in <meta name="booking-api">,
+        // or this browser's IndexedDB when the site has no backend.
+        // site is the site folder name: every site on an origin keeps its own
+        // bookings. legacy ({from, business, unassigned}) names the localStorage
+        // key that earlier versions shared between sites, and which of its
+        // bookings are this site's: those with its business name, plus with
+        // unassigned those that carry no business name at all.
+        // This is the visitor side (add() only); on admin pages
+        // BOOKING_ADMIN_SCRIPT adds reading, editing and watching.
+        function openBookingStore(site, legacy) {
+            const key = 'bookings:' + site;
+            const meta = document.querySelector('meta[name="booking-api"]');
+            const api = meta ? meta.content.replace(/\\/+$/, '') : '';
+            const watchers = [];
+            // Tells this site's other tabs that the local bookings changed
+            const channel = !api && window.BroadcastChannel ? new BroadcastChannel(key) : null;
+            let local = null;
+
+            // body is sent as JSON, or as it is when a content type is given.
+            // A failed request rejects with an Error carrying the HTTP status.
+            function send(method, path, body, type, headers) {
+                const init = { method: method, headers: Object.assign({}, headers) };
+                if (body !== undefined) {
+                    init.headers['Content-Type'] = type || 'application/json';
+                    init.body = type ? body : JSON.stringify(body);
+                }
+                return fetch(api + path, init).then(response => {
+                    if (!response.ok) {
+                        const error = new Error('Booking server error ' + response.status);
+                        error.status = response.status;
+                        throw error;
+                    }
+                    return response;
+                });
+            }
+
+            // This site's bookings from the shared localStorage array of earlier
+            // versions. commit() then removes them from it, leaving the other
+            // sites' bookings (and any written since by an old page) in place.
+            function takeLegacy() {
+                if (!legacy) {
+                    return { mine: [], commit() {} };
+                }
+                const mine = JSON.parse(localStorage.getItem(legacy.from) || '[]').filter(b =>
+                    b.business === undefined ? Boolean(legacy.unassigned) : b.business === legacy.business);
+                return {
+                    mine: mine,
+                    commit() {
+                        if (!mine.length) {
+                            return;
+                        }
+                        const taken = new Set(mine.map(b => JSON.stringify(b)));
+                        const rest = JSON.parse(localStorage.getItem(legacy.from) || '[]').filter(b => !taken.has(JSON.stringify(b)));
+                        if (rest.length) {
+                            localStorage.setItem(legacy.from, JSON.stringify(rest));
+                        } else {
+                            localStorage.removeItem(legacy.from);
+                        }
+                    }
+                };
+            }
+
+            // Browser-side bookings: an IndexedDB object store keyed by id with
+            // indexes on business, status and createdAt. Each write touches one
+            // record, off the main thread. This site's bookings from the shared
+            // localStorage key are moved in once, when the database is created.
+            // Version 2 adds the 'counts' store: one {day, statuses} record per
+            // local day, counted once from the stored bookings on upgrade.
+            function openLocal() {
+                if (!local) {
+                    local = new Promise(resolve => {
+                        if (!window.indexedDB) {
+                            resolve(storageBackend());
+                            return;
+                        }
+                        let migration = null;
+                        const open = indexedDB.open(key, 2);
+                        open.onupgradeneeded = event => {
+                            let store;
+                            if (event.oldVersion < 1) {
+                                store = open.result.createObjectStore('bookings', { keyPath: 'id', autoIncrement: true });
+                                store.createIndex('business', 'business');
+                                store.createIndex('status', 'status');
+                                store.createIndex('createdAt', 'createdAt');
+                                migration = takeLegacy();
+                                migration.mine.forEach(booking => store.put(booking));
+                            } else {
+                                store = open.transaction.objectStore('bookings');
+                            }
+                            if (event.oldVersion < 2) {
+                                const counts = open.result.createObjectStore('counts', { keyPath: 'day' });
+                                const days = {};
+                                store.openCursor().onsuccess = cursorEvent => {
+                                    const cursor = cursorEvent.target.result;
+                                    if (cursor) {
+                                        tally(days, cursor.value, 1);
+                                        cursor.continue();
+                                    } else {
+                                        Object.keys(days).forEach(day => counts.put(days[day]));
+                                    }
+                                };
+                            }
+                        };
+                        open.onsuccess = () => {
+                            // Only once the copies are committed
+                            if (migration) {
+                                migration.commit();
+                            }
+                            resolve(indexedBackend(open.result));
+                        };
+                        // Storage disabled (some private modes): keep using localStorage
+                        open.onerror = () => resolve(storageBackend());
+                    });
+                }
+                return local;
+            }
+
+            function indexedBackend(db) {
+                // Run work(store, done, counts) in one transaction; resolves with
+                // done's value once committed
+                function run(mode, work) {
+                    return new Promise((resolve, reject) => {
+                        const transaction = db.transaction(['bookings', 'counts'], mode);
+                        let result;
+                        work(transaction.objectStore('bookings'), value => {
+                            result = value;
+                        }, transaction.objectStore('counts'));
+                        transaction.oncomplete = () => resolve(result);
+                        transaction.onerror = transaction.onabort = () => reject(transaction.error);
+                    });
+                }
+
+                // Add deltas ({status: +1 or -1}) to the counters of one day
+                function count(counts, day, deltas) {
+                    const request = counts.get(day);
+                    request.onsuccess = () => {
+                        const record = request.result || { day: day, statuses: {} };
+                        Object.keys(deltas).forEach(status => {
+                            record.statuses[status] = (record.statuses[status] || 0) + deltas[status];
+                        });
+                        counts.put(record);
+                    };
+                }
+
+                return {
+                    run: run,
+                    count: count,
+
+                    add(booking) {
+                        return run('readwrite', (store, done, counts) => {
+                            const request = store.put(booking);
+                            request.onsuccess = () => {
+                                booking.id = request.result;
+                                done(booking);
+                            };
+                            count(counts, localDay(booking.createdAt), { [booking.status]: 1 });
+                        });
+                    }
+                };
+            }
+
+            // Add delta to the day record of a booking in days ({day: {day, statuses}})
+            function tally(days, booking, delta) {
+                const day = localDay(booking.createdAt);
+                const record = days[day] = days[day] || { day: day, statuses: {} };
+                record.statuses[booking.status] = (record.statuses[booking.status] || 0) + delta;
+            }
+
+            // The whole array in localStorage[key], for browsers without IndexedDB
+            function storageBackend() {
+                function read() {
+                    return JSON.parse(localStorage.getItem(key) || '[]');
+                }
+
+                function write(bookings) {
+                    localStorage.setItem(key, JSON.stringify(bookings));
+                }
+
+                if (localStorage.getItem(key) === null) {
+                    const migration = takeLegacy();
+                    if (migration.mine.length) {
+                        write(migration.mine);
+                        migration.commit();
+                    }
+                }
+
+                return {
+                    read: read,
+                    write: write,
+
+                    add(booking) {
+                        const bookings = read();
+                        bookings.push(booking);
+                        write(bookings);
+                        return Promise.resolve(booking);
+                    }
+                };
+            }
+
+            function changed(value) {
+                // Storage events only reach other tabs of a localStorage site; tell
+                // this tab's watchers directly and the other tabs over the channel
+                watchers.forEach(refresh => refresh());
+                if (channel) {
+                    channel.postMessage('changed');
+                }
+                return value;
+            }
+
+            const store = {
+                remote: Boolean(api),
+                site: site,
+
+                add(booking) {
+                    if (api) {
+                        return send('POST', '/bookings', booking).then(response => response.json());
+                    }
+                    return openLocal().then(backend => backend.add(booking)).then(changed);
+                }
+            };
+            if (typeof adminBookingStore === 'function') {
+                adminBookingStore(store, {
+                    key: key, api: api, channel: channel, watchers: watchers,
+                    send: send, openLocal: openLocal, changed: changed, tally: tally
+                });
+            }
+            return store;
+        }
+
+        // 'YYYY-MM-DD' of a time (ISO string or ms) in the browser's time zone
+        function localDay(time) {
+            const date = new Date(time === undefined ? Date.now() : time);
+            return date.getFullYear() + '-' + String(date.getMonth() + 1).padStart(2, '0') + '-' +
+                String(date.getDate()).padStart(2, '0');
+        }
+    </script>"""
+
+BOOKING_ADMIN_SCRIPT = """<script>
+        // Admin side of the booking store, for admin pages only (after
+        // BOOKING_SCRIPT): openBookingStore() hands each store to
+        // adminBookingStore(), which adds list / page / stats / history /
+        // update / addMany / watch. internals are the visitor store's own
+        // pieces: {key, api, channel, watchers, send, openLocal, changed, tally}.
+        function adminBookingStore(store, internals) {
+            const api = internals.api;
+            const key = internals.key;
+            const watchers = internals.watchers;
+            const channel = internals.channel;
+            const changed = internals.changed;
+            const tally = internals.tally;
+
+            // The booking server's admin token, asked for once per browser session
+            // (again when the server turns it down)
+            function adminToken(ask) {
+                const tokenKey = 'booking-token:' + api;
+                let token = sessionStorage.getItem(tokenKey);
+                if (token === null || ask) {
+                    token = window.prompt('Admin token of the booking server') || '';
+                    sessionStorage.setItem(tokenKey, token);
+                }
+                return token;
+            }
+
+            // Admin requests carry the token; a 401 asks for it again, once
+            function send(method, path, body, type, retried) {
+                const headers = { Authorization: 'Bearer ' + adminToken(retried) };
+                return internals.send(method, path, body, type, headers).catch(error => {
+                    if (error.status === 401 && !retried) {
+                        return send(method, path, body, type, true);
+                    }
+                    throw error;
+                });
+            }
+
+            function request(method, path, body) {
+                return send(method, path, body).then(response => response.json());
+            }
+
+            // where: {field: value} on one indexed field (business or status)
+            function matches(booking, where) {
+                return !where || Object.keys(where).every(field => booking[field] === where[field]);
+            }
+
+            // The browser-side backend, with the admin methods added on first use
+            function openLocal() {
+                return internals.openLocal().then(backend => {
+                    if (!backend.all) {
+                        Object.assign(backend, backend.run ? indexedAdmin(backend) : storageAdmin(backend));
+                    }
+                    return backend;
+                });
+            }
+
+            function indexedAdmin(backend) {
+                const run = backend.run;
+                const count = backend.count;
+
+                function then(request, callback) {
+                    request.onsuccess = () => callback(request.result);
+                }
+
+                return {
+                    all(where) {
+                        return run('readonly', (store, done) => {
+                            const field = where && Object.keys(where)[0];
+                            then(field ? store.index(field).getAll(IDBKeyRange.only(where[field])) : store.getAll(), done);
+                        });
+                    },
+
+                    page(cursor, limit) {
+                        return run('readonly', (store, done) => {
+                            const range = cursor ? IDBKeyRange.lowerBound(cursor, true) : undefined;
+                            then(store.getAll(range, limit + 1), bookings => {
+                                const more = bookings.length > limit;
+                                bookings = bookings.slice(0, limit);
+                                done({ bookings: bookings, next: more ? bookings[bookings.length - 1].id : null });
+                            });
+                        });
+                    },
+
+                    // Read from the day counters: no booking is read
+                    stats() {
+                        return run('readonly', (store, done, counts) => {
+                            then(counts.getAll(), days => done(summarize(days)));
+                        });
+                    },
+
+                    history(by, since) {
+                        return run('readonly', (store, done, counts) => {
+                            then(counts.getAll(since ? IDBKeyRange.lowerBound(since) : undefined),
+                                days => done(foldCounts(days, by)));
+                        });
+                    },
+
+                    // Store a batch in one transaction; bookings with a known id replace it
+                    putMany(bookings) {
+                        return run('readwrite', (store, done, counts) => {
+                            const deltas = {};
+                            let left = bookings.length;
+                            // The counters are adjusted once per day, after every old record was seen
+                            function stored() {
+                                if (--left === 0) {
+                                    Object.keys(deltas).forEach(day => count(counts, day, deltas[day].statuses));
+                                }
+                            }
+                            bookings.forEach(booking => {
+                                tally(deltas, booking, 1);
+                                if (booking.id === undefined) {
+                                    then(store.put(booking), stored);
+                                    return;
+                                }
+                                then(store.get(booking.id), old => {
+                                    if (old) {
+                                        tally(deltas, old, -1);
+                                    }
+                                    then(store.put(booking), stored);
+                                });
+                            });
+                            done(bookings.length);
+                        });
+                    },
+
+                    update(id, changes) {
+                        return run('readwrite', (store, done, counts) => {
+                            then(store.get(id), booking => {
+                                if (booking) {
+                                    const status = booking.status;
+                                    Object.assign(booking, changes);
+                                    store.put(booking);
+                                    if (booking.status !== status) {
+                                        // One call: both deltas land on the same day record
+                                        count(counts, localDay(booking.createdAt), { [status]: -1, [booking.status]: 1 });
+                                    }
+                                }
+                                done(booking);
+                            });
+                        });
+                    }
+                };
+            }
+
+            // Day records of a list of bookings, oldest day first
+            function days(bookings) {
+                const counted = {};
+                bookings.forEach(booking => tally(counted, booking, 1));
+                return Object.keys(counted).sort().map(day => counted[day]);
+            }
+
+            // {total, today, statuses} from day records
+            function summarize(records) {
+                const stats = { total: 0, today: 0, statuses: {} };
+                const today = localDay(Date.now());
+                records.forEach(record => {
+                    Object.keys(record.statuses).forEach(status => {
+                        const count = record.statuses[status];
+                        stats.total += count;
+                        stats.statuses[status] = (stats.statuses[status] || 0) + count;
+                        if (record.day === today) {
+                            stats.today += count;
+                        }
+                    });
+                });
+                Object.keys(stats.statuses).forEach(status => {
+                    if (!stats.statuses[status]) {
+                        delete stats.statuses[status];
+                    }
+                });
+                return stats;
+            }
+
+            function storageAdmin(backend) {
+                const read = backend.read;
+                const write = backend.write;
+
+                return {
+                    all(where) {
+                        return Promise.resolve(read().filter(b => matches(b, where)));
+                    },
+
+                    page(cursor, limit) {
+                        const bookings = read();
+                        const start = cursor || 0;
+                        const end = start + limit;
+                        return Promise.resolve({ bookings: bookings.slice(start, end), next: end < bookings.length ? end : null });
+                    },
+
+                    // No counters here: every call counts the array
+                    stats() {
+                        return Promise.resolve(summarize(days(read())));
+                    },
+
+                    history(by, since) {
+                        return Promise.resolve(foldCounts(days(read()).filter(d => !since || d.day >= since), by));
+                    },
+
+                    putMany(batch) {
+                        const bookings = read();
+                        const positions = new Map(bookings.map((booking, index) => [booking.id, index]));
+                        batch.forEach(booking => {
+                            if (booking.id !== undefined && positions.has(booking.id)) {
+                                bookings[positions.get(booking.id)] = booking;
+                            } else {
+                                bookings.push(booking);
+                            }
+                        });
+                        write(bookings);
+                        return Promise.resolve(batch.length);
+                    },
+
+                    update(id, changes) {
+                        const bookings = read();
+                        const booking = bookings.find(b => b.id === id);
+                        if (booking) {
+                            Object.assign(booking, changes);
+                            write(bookings);
+                        }
+                        return Promise.resolve(booking);
+                    }
+                };
+            }
+
+            // Bookings as JSON text: unchanged data is detected by comparing strings
+            function readText(where) {
+                if (api) {
+                    return send('GET', '/bookings').then(response => response.text());
+                }
+                return openLocal().then(backend => backend.all(where)).then(bookings => JSON.stringify(bookings));
+            }
+
+            function parse(text, where) {
+                return api ? JSON.parse(text).bookings.filter(b => matches(b, where)) : JSON.parse(text);
+            }
+
+            // Call onChange(booking) after the server stored a new or updated
+            // booking, and onChange(null) whenever any booking may have changed
+            function listen(onChange) {
+                if (api && window.EventSource) {
+                    // Reconnects on its own; onopen catches up on changes missed while offline
+                    const events = new EventSource(api + '/events?token=' + encodeURIComponent(adminToken()));
+                    events.onopen = () => onChange(null);
+                    events.onmessage = event => onChange(JSON.parse(event.data));
+                    return;
+                }
+                watchers.push(() => onChange(null));
+                if (channel) {
+                    channel.onmessage = () => watchers.forEach(refresh => refresh());
+                }
+                window.addEventListener('storage', event => {
+                    if (event.key === key || event.key === null) {
+                        onChange(null);
+                    }
+                });
+            }
+
+            Object.assign(store, {
+                // Store a batch of exported bookings; resolves with the number stored.
+                // The browser store keeps their ids (importing a backup twice replaces
+                // the same bookings), the booking server gives them new ones.
+                addMany(bookings) {
+                    if (api) {
+                        const body = bookings.map(booking => JSON.stringify(booking)).join('\\n');
+                        return send('POST', '/import', body, 'application/x-ndjson')
+                            .then(response => response.json()).then(answer => answer.imported);
+                    }
+                    return openLocal().then(backend => backend.putMany(bookings)).then(changed);
+                },
+
+                // Where the booking server streams every booking (null without one)
+                exportUrl(format) {
+                    return api ? api + '/export?format=' + format + '&token=' + encodeURIComponent(adminToken()) : null;
+                },
+
+                // All bookings, or those matching where, e.g. {business: 'Happy Cafe'}
+                list(where) {
+                    return readText(where).then(text => parse(text, where));
+                },
+
+                // One page of bookings, oldest first: {bookings, next}. Start with
+                // cursor 0 and pass next back for the following page (null at the end).
+                page(cursor, limit) {
+                    if (api) {
+                        return request('GET', '/bookings?limit=' + limit + (cursor ? '&after=' + cursor : ''));
+                    }
+                    return openLocal().then(backend => backend.page(cursor, limit));
+                },
+
+                // {total, today, statuses: {status: count}}; today starts at local midnight
+                stats() {
+                    if (api) {
+                        const midnight = new Date();
+                        midnight.setHours(0, 0, 0, 0);
+                        return request('GET', '/stats?since=' + encodeURIComponent(midnight.toISOString()));
+                    }
+                    return openLocal().then(backend => backend.stats());
+                },
+
+                // Counts per period, oldest first: [{period, total, statuses}].
+                // by is 'day', 'week' (period = its Monday) or 'month' ('YYYY-MM');
+                // since is an optional first day, 'YYYY-MM-DD'.
+                history(by, since) {
+                    if (api) {
+                        return request('GET', '/stats/history?by=' + by + (since ? '&since=' + since : ''))
+                            .then(answer => answer.periods);
+                    }
+                    return openLocal().then(backend => backend.history(by, since));
+                },
+
+                update(id, changes) {
+                    if (api) {
+                        return request('PATCH', '/bookings/' + encodeURIComponent(id), changes);
+                    }
+                    return openLocal().then(backend => backend.update(id, changes)).then(booking => {
+                        if (!booking) {
+                            throw new Error('Unknown booking ' + id);
+                        }
+                        return changed(booking);
+                    });
+                },
+
+                // Call render(bookings) now and again whenever the bookings change:
+                // writes in this or another tab, or server-sent events from the
+                // booking server. Nothing is re-rendered if the data is the same.
+                watch(render, where) {
+                    let shown = null;
+                    let latest = 0;
+                    function refresh() {
+                        const ticket = ++latest;
+                        readText(where).then(text => {
+                            if (ticket !== latest || text === shown) {
+                                return;
+                            }
+                            shown = text;
+                            render(parse(text, where));
+                        });
+                    }
+
+                    listen(() => refresh());
+                    refresh();
+                },
+
+                listen: listen
+            });
+        }
+
+        // Period of a day: the day itself, the Monday of its week or 'YYYY-MM'
+        function periodOf(day, by) {
+            if (by === 'month') {
+                return day.slice(0, 7);
+            }
+            if (by === 'week') {
+                const date = new Date(day + 'T00:00:00');
+                date.setDate(date.getDate() - (date.getDay() + 6) % 7);
+                return localDay(date);
+            }
+            return day;
+        }
+
+        // Day records ({day, statuses}, oldest first) -> [{period, total, statuses}]
+        function foldCounts(records, by) {
+            const periods = [];
+            records.forEach(record => {
+                const period = periodOf(record.day, by);
+                let bucket = periods[periods.length - 1];
+                if (!bucket || bucket.period !== period) {
+                    bucket = { period: period, total: 0, statuses: {} };
+                    periods.push(bucket);
+                }
+                Object.keys(record.statuses).forEach(status => {
+                    const count = record.statuses[status];
+                    if (count) {
+                        bucket.total += count;
+                        bucket.statuses[status] = (bucket.statuses[status] || 0) + count;
+                    }
+                });
+            });
+            return periods.filter(bucket => bucket.total);
+        }
+
+        // Weekly and monthly bars of an admin panel: the last 8 weeks and 6 months
+        function showHistory(store, weekly, monthly) {
+            store.history('week').then(periods => drawHistory(weekly, periods.slice(-8))).catch(() => {});
+            store.history('month').then(periods => drawHistory(monthly, periods.slice(-6))).catch(() => {});
+        }
+
+        // One bar per period, newest first, scaled to the busiest one
+        function drawHistory(container, periods) {
+            const most = Math.max(1, ...periods.map(p => p.total));
+            const rows = periods.slice().reverse().map(p => ({ id: p.period, total: p.total }));
+            patchList(container, rows, p => `
+                <div style="display: flex; align-items: center; gap: 10px; padding: 8px 20px;">
+                    <span style="width: 80px; color: #666; font-size: 0.9rem;">${escapeHtml(p.id)}</span>
+                    <span style="flex: 1; height: 12px; background: #eee; border-radius: 6px; overflow: hidden;">
+                        <span style="display: block; height: 100%; width: ${Math.round(p.total / most * 100)}%; background: #3498db;"></span>
+                    </span>
+                    <span style="width: 50px; text-align: right; font-weight: bold;">${p.total}</span>
+                </div>
+            `, '<div style="padding: 20px; color: #999; text-align: center;">-</div>');
+        }
+
+        // Bookings come from visitors: escape every field put into admin HTML
+        function escapeHtml(value) {
+            const entities = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+            return String(value === undefined || value === null ? '' : value).replace(/[&<>"']/g, c => entities[c]);
+        }
+
+        // Keyed list rendering: each child of container is the row of one
+        // booking, matched by id. Only new, changed and removed rows touch
+        // the DOM, so the scroll position and any text selected in unchanged
+        // rows survive a refresh. renderRow(item) returns the row's HTML.
+        function patchList(container, items, renderRow, emptyHtml) {
+            if (!items.length) {
+                container.bookingRows = null;
+                container.innerHTML = emptyHtml || '';
+                return;
+            }
+            let rows = container.bookingRows;
+            if (!rows) {
+                rows = container.bookingRows = new Map();
+                container.innerHTML = '';
+            }
+            const seen = new Set();
+            items.forEach((item, index) => {
+                let key = item.id === undefined ? '#' + index : String(item.id);
+                if (seen.has(key)) {
+                    key += '#' + index;
+                }
+                seen.add(key);
+                const html = renderRow(item).trim();
+                let row = rows.get(key);
+                if (!row || row.html !== html) {
+                    const template = document.createElement('template');
+                    template.innerHTML = html;
+                    const node = template.content.firstElementChild;
+                    if (row) {
+                        row.node.replaceWith(node);
+                    }
+                    row = { node: node, html: html };
+                    rows.set(key, row);
+                }
+                // Rows before index are already in place; stale rows drift to the end
+                const current = container.children[index];
+                if (current !== row.node) {
+                    container.insertBefore(row.node, current || null);
+                }
+            });
+            rows.forEach((row, key) => {
+                if (!seen.has(key)) {
+                    row.node.remove();
+                    rows.delete(key);
+                }
+            });
+        }
+    </script>"""
+
+BOOKING_TABLE_SCRIPT = """<script>
+        // Virtual booking table for busy sites: only the rows in view are in
+        // the DOM (two spacer rows stand in for the rest), and bookings are
+        // fetched a page at a time by cursor as the table scrolls down.
+        // body is the table's <tbody>, inside a scrolling .table-scroll box.
+        function openBookingTable(store, body, renderRow, renderStats) {
+            const PAGE_SIZE = 200;
+            const OVERSCAN = 10;  // rows drawn beyond each edge of the view
+            const scroller = body.closest('.table-scroll');
+            const columns = body.parentNode.tHead.rows[0].cells.length;
+            const before = spacer(body);
+            const after = spacer(body.nextSibling);
+            let rowHeight = 45;
+            let measured = false;
+            let loaded = [];
+            let positions = new Map();  // booking id -> index in loaded
+            let next = 0;  // cursor of the next page, null once every page is loaded
+            let loading = false;
+            let generation = 0;  // bumped by reload(); answers for older ones are dropped
+            let frame = 0;
+            let statsTimer = 0;
+            let statsTicket = 0;
+
+            function spacer(ref) {
+                const section = document.createElement('tbody');
+                section.innerHTML = '<tr><td colspan="' + columns + '" style="padding: 0; border: none;"></td></tr>';
+                body.parentNode.insertBefore(section, ref);
+                return section.rows[0].cells[0];
+            }
+
+            function put(booking) {
+                const index = positions.get(booking.id);
+                if (index === undefined) {
+                    positions.set(booking.id, loaded.length);
+                    loaded.push(booking);
+                } else {
+                    loaded[index] = booking;
+                }
+            }
+
+            function draw() {
+                frame = 0;
+                const top = scroller.scrollTop;
+                const last = Math.min(loaded.length, Math.ceil((top + scroller.clientHeight) / rowHeight) + OVERSCAN);
+                const first = Math.min(last, Math.max(0, Math.floor(top / rowHeight) - OVERSCAN));
+                before.style.height = first * rowHeight + 'px';
+                after.style.height = (loaded.length - last) * rowHeight + 'px';
+                patchList(body, loaded.slice(first, last), renderRow);
+
+                const row = body.firstElementChild;
+                if (!measured && row && row.offsetHeight) {
+                    measured = true;
+                    rowHeight = row.offsetHeight;
+                    schedule();
+                }
+                if (last + OVERSCAN >= loaded.length) {
+                    loadMore();
+                }
+            }
+
+            function schedule() {
+                if (!frame) {
+                    frame = requestAnimationFrame(draw);
+                }
+            }
+
+            function loadMore() {
+                if (loading || next === null) {
+                    return;
+                }
+                const ticket = generation;
+                loading = true;
+                store.page(next, PAGE_SIZE).then(page => {
+                    if (ticket === generation) {
+                        page.bookings.forEach(put);
+                        next = page.next;
+                        schedule();
+                    }
+                }).catch(() => {}).then(() => {
+                    if (ticket === generation) {
+                        loading = false;
+                    }
+                });
+            }
+
+            function loadStats() {
+                const ticket = ++statsTicket;
+                store.stats().then(stats => {
+                    if (ticket === statsTicket) {
+                        renderStats(stats);
+                    }
+                }).catch(() => {});
+            }
+
+            // A burst of bookings asks for the counts once, not once per booking
+            function scheduleStats() {
+                if (!statsTimer) {
+                    statsTimer = setTimeout(() => {
+                        statsTimer = 0;
+                        loadStats();
+                    }, 500);
+                }
+            }
+
+            // Fetch everything again, as far as it was loaded, and swap it in at once
+            function reload() {
+                const ticket = ++generation;
+                const wanted = Math.max(loaded.length, PAGE_SIZE);
+                const fresh = [];
+                loading = true;
+                loadStats();
+
+                function fetchPage(cursor) {
+                    return store.page(cursor, PAGE_SIZE).then(page => {
+                        if (ticket !== generation) {
+                            return;
+                        }
+                        fresh.push(...page.bookings);
+                        if (page.next !== null && fresh.length < wanted) {
+                            return fetchPage(page.next);
+                        }
+                        loaded = fresh;
+                        positions = new Map(loaded.map((booking, index) => [booking.id, index]));
+                        next = page.next;
+                        loading = false;
+                        schedule();
+                    });
+                }
+                fetchPage(0).catch(() => {
+                    if (ticket === generation) {
+                        loading = false;
+                    }
+                });
+            }
+
+            store.listen(booking => {
+                if (!booking) {
+                    reload();
+                    return;
+                }
+                // Changed rows update in place; a new booking joins the end once every page is loaded
+                if (positions.has(booking.id) || (next === null && !loading)) {
+                    put(booking);
+                    schedule();
+                }
+                scheduleStats();
+            });
+            scroller.addEventListener('scroll', schedule);
+            window.addEventListener('resize', schedule);
+            reload();
+
+            return { reload: reload };
+        }
+    </script>"""
+
+BOOKING_TRANSFER_SCRIPT = """<script>
+        // Booking backups for the admin panels: export every booking as NDJSON
+        // (one JSON booking per line, the import format) or CSV, and import an
+        // NDJSON file back. Both go a page / batch at a time, so a long history
+        // never becomes one giant string or one giant request.
+        const EXPORT_PAGE = 500;
+        const EXPORT_COLUMNS = ['id', 'createdAt', 'name', 'phone', 'email', 'service', 'date', 'message',
+            'business', 'type', 'status', 'orderId'];
+        const IMPORT_BATCH = 200;  // bookings per addMany() call
+        const IMPORT_BYTES = 60000;  // and at most this much NDJSON (the server takes 64 KB per request)
+
+        function csvCell(value) {
+            const text = value === undefined || value === null ? '' : String(value);
+            return /[",\\r\\n]/.test(text) ? '"' + text.replace(/"/g, '""') + '"' : text;
+        }
+
+        function encodeBookings(bookings, format, header) {
+            if (format === 'csv') {
+                const rows = bookings.map(booking => EXPORT_COLUMNS.map(column => csvCell(booking[column])).join(','));
+                return (header ? [EXPORT_COLUMNS.join(',')] : []).concat(rows).map(row => row + '\\r\\n').join('');
+            }
+            return bookings.map(booking => JSON.stringify(booking) + '\\n').join('');
+        }
+
+        function saveAs(url, name) {
+            const link = document.createElement('a');
+            link.href = url;
+            link.download = name;
+            document.body.appendChild(link);
+            link.click();
+            link.remove();
+        }
+
+        // Download every booking; format is 'ndjson' or 'csv'. A booking server
+        // streams the file itself; browser-side bookings are read page by page
+        // into the parts of one Blob.
+        function exportBookings(store, format) {
+            const name = store.site + '-bookings.' + format;
+            const url = store.exportUrl(format);
+            if (url) {
+                saveAs(url, name);
+                return Promise.resolve();
+            }
+            const parts = [];
+            function fetchPage(cursor) {
+                return store.page(cursor, EXPORT_PAGE).then(page => {
+                    parts.push(encodeBookings(page.bookings, format, cursor === 0));
+                    return page.next === null ? null : fetchPage(page.next);
+                });
+            }
+            return fetchPage(0).then(() => {
+                const blob = new Blob(parts, { type: format === 'csv' ? 'text/csv' : 'application/x-ndjson' });
+                const blobUrl = URL.createObjectURL(blob);
+                saveAs(blobUrl, name);
+                setTimeout(() => URL.revokeObjectURL(blobUrl), 60000);
+            });
+        }
+
+        // Store the bookings of an NDJSON file, read as a stream and sent in
+        // batches; onProgress(count) after each batch. Resolves with the count.
+        function importBookings(store, file, onProgress) {
+            const encoder = new TextEncoder();
+            let rest = '';
+            let batch = [];
+            let bytes = 0;
+            let imported = 0;
+            let lineNumber = 0;
+
+            // Parse complete lines into batches and store the full ones, in order
+            function take(lines, last) {
+                const ready = [];
+                lines.forEach(line => {
+                    lineNumber++;
+                    if (!line.trim()) {
+                        return;
+                    }
+                    let booking;
+                    try {
+                        booking = JSON.parse(line);
+                    } catch (e) {
+                        throw new Error('line ' + lineNumber + ' is not valid JSON');
+                    }
+                    const size = encoder.encode(line).length + 1;
+                    if (batch.length && (batch.length >= IMPORT_BATCH || bytes + size > IMPORT_BYTES)) {
+                        ready.push(batch);
+                        batch = [];
+                        bytes = 0;
+                    }
+                    batch.push(booking);
+                    bytes += size;
+                });
+                if (last && batch.length) {
+                    ready.push(batch);
+                    batch = [];
+                }
+                return ready.reduce((chain, bookings) => chain.then(() => store.addMany(bookings)).then(count => {
+                    imported += count;
+                    if (onProgress) {
+                        onProgress(imported);
+                    }
+                }), Promise.resolve());
+            }
+
+            if (!file.stream || !window.TextDecoderStream) {
+                return file.text().then(text => take(text.split(/\\r?\\n/), true)).then(() => imported);
+            }
+            const reader = file.stream().pipeThrough(new TextDecoderStream()).getReader();
+            function pump() {
+                return reader.read().then(chunk => {
+                    const lines = (rest + (chunk.value || '')).split(/\\r?\\n/);
+                    rest = chunk.done ? '' : lines.pop();
+                    return take(lines, chunk.done).then(() => chunk.done ? imported : pump());
+                });
+            }
+            return pump().catch(error => {
+                reader.cancel();
+                throw error;
+            });
+        }
+
+        // Wire the backup controls in container: buttons with data-export="ndjson"
+        // or "csv", a file input for imports and a [data-transfer-status] element.
+        // messages: {imported, failed} in the page's language.
+        function bindBookingTransfer(store, container, messages) {
+            const status = container.querySelector('[data-transfer-status]');
+            container.querySelectorAll('[data-export]').forEach(button => {
+                button.addEventListener('click', () => {
+                    exportBookings(store, button.dataset.export).catch(error => {
+                        status.textContent = messages.failed + ': ' + error.message;
+                    });
+                });
+            });
+            const input = container.querySelector('input[type="file"]');
+            input.addEventListener('change', () => {
+                const file = input.files[0];
+                if (!file) {
+                    return;
+                }
+                const progress = count => {
+                    status.textContent = messages.imported + ': ' + count;
+                };
+                importBookings(store, file, progress).then(progress, error => {
+                    status.textContent = messages.failed + ': ' + error.message;
+                }).then(() => {
+                    input.value = '';
+                });
+            });
+        }
+    </script>"""
+
+
+def store_args(site, legacy_key, business, unassigned=False):
+    """Arguments of openBookingStore() for one site, as JS source for a page script.
+
+    site is the site folder name. legacy_key is the localStorage key the
+    generator used to share between sites; the site takes over the
+    bookings in it with its business name, and with unassigned also those
+    without one (v2 admin panels used to list every booking).
+    """
+    legacy = {'from': legacy_key, 'business': business}
+    if unassigned:
+        legacy['unassigned'] = True
+    # One dumps of [site, legacy] without the brackets: both arguments, JS-escaped
+    return json.dumps([site, legacy], ensure_ascii=False)[1:-1].replace('</', '<\\/')
+
+
+def api_url(backend, site):
+    """Booking API base URL of one site: '<backend>/sites/<site folder>/api'."""
+    return f"{backend.rstrip('/')}/sites/{quote(site, safe='')}/api"
+
+
+def wire_backend(files, backend, site):
+    """Point the booking store of every page at the site's tenant on the booking server.
+
+    site is the site folder name. Adds <meta name="booking-api"
+    content="..."> to each HTML page; other files pass through.
+    """
+    tag = f'<meta name="booking-api" content="{escape(api_url(backend, site))}">\n'
+    wired = {}
+    for name, content in files.items():
+        if name.endswith('.html'):
+            content = content.replace('</head>', f'    {tag}</head>', 1)
+        wired[name] = content
+    return wired
@@ -0,0 +1,453 @@
+"""
+Booking stores for the booking server
+
+Bookings are partitioned by tenant - the site folder name, e.g.
+'happy-cafe-website' - so one server holds every site's bookings and a
+tenant's requests only ever touch its own partition.
+
+SQLiteBookingStore (the default, `bookings.db`) keeps them in one SQLite
+database in WAL mode. The site column leads every index - (site, id),
+(site, status), (site, createdAt), (site, date) - so listing, filtering
+and the Total / Today / per-status counts of one tenant are index range
+scans that never touch other tenants' rows, however many bookings the
+server holds.
+
+Counts are kept up to date as bookings are written: a booking_counts
+table (site, day, status) -> count, maintained by triggers on every
+insert and status change. stats() and history() - the daily / weekly /
+monthly breakdowns of the admin dashboard - sum those counters, so their
+cost grows with the number of days a site has had bookings, not with
+the number of bookings. Days are UTC days of createdAt.
+
+Lists are paged by cursor: list(tenant, after=id, limit=n) returns the
+next n bookings with an id above the last one seen. That is an index
+seek however deep the page, unlike OFFSET, which skips row by row.
+
+import_bookings(tenant, bookings) restores a batch of exported bookings
+in one transaction: each gets a new id but keeps its createdAt, so the
+counters and history place it on the day it was made.
+
+BookingStore (`bookings.jsonl`) keeps them in memory and appends every
+create / update to a JSON Lines log, which is replayed on start-up. It
+keeps the same per-day counters in memory, plus each day's createdAt
+times in order, so its stats() and history() do not scan the bookings
+either.
+
+A booking's status must be one of STATUSES, the labels the generated
+pages use; anything else is rejected with ValueError.
+
+    store = open_store('bookings.db')
+    booking = store.create('happy-cafe-website', {'name': 'Kim', 'phone': '010-1234-5678'})
+    store.update('happy-cafe-website', booking['id'], {'status': 'completed'})
+    store.stats('happy-cafe-website', since='2026-01-15T00:00:00.000Z')
+    store.list('happy-cafe-website', after=booking['id'], limit=100)
+    store.history('happy-cafe-website', by='week', since='2026-01-01')
+"""
+
+import json
+import sqlite3
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+
+# Fields a client may set; anything else in a request body is ignored
+FIELDS = ('name', 'phone', 'email', 'service', 'date', 'message', 'business', 'type', 'status', 'orderId')
+MAX_FIELD_LENGTH = 2000
+# Statuses the generated pages write and count: English (lower and title case) and Korean
+STATUSES = frozenset({
+    'pending', 'confirmed', 'completed', 'cancelled',
+    'Pending', 'Confirmed', 'Completed', 'Cancelled',
+    '대기중', '확정', '완료', '취소',
+})
+PENDING_STATUSES = frozenset({'pending', 'Pending', '대기중'})  # what a booking form may submit
+PERIODS = ('day', 'week', 'month')
+
+
+def utc_now():
+    """Current time in the format of JS Date.toISOString()."""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def start_of_day():
+    """Midnight UTC today, as a createdAt-comparable string."""
+    return utc_now()[:10] + 'T00:00:00.000Z'
+
+
+def clean_fields(data):
+    """Known booking fields of a request body; raises ValueError on bad input."""
+    if not isinstance(data, dict):
+        raise ValueError("booking must be a JSON object")
+    fields = {}
+    for name in FIELDS:
+        value = data.get(name)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+            raise ValueError(f"'{name}' must be a string or number")
+        if isinstance(value, str) and len(value) > MAX_FIELD_LENGTH:
+            raise ValueError(f"'{name}' is too long")
+        if name == 'status' and value not in STATUSES:
+            raise ValueError(f"'status' must be one of {', '.join(sorted(STATUSES))}")
+        fields[name] = value
+    return fields
+
+
+def new_booking(data):
+    """Validated fields of a new booking (id and createdAt are added by the store)."""
+    booking = clean_fields(data)
+    if not str(booking.get('name', '')).strip():
+        raise ValueError("'name' is required")
+    booking.setdefault('status', 'pending')
+    return booking
+
+
+def period_of(day, by):
+    """Bucket of a 'YYYY-MM-DD' day: the day, the Monday of its ISO week or 'YYYY-MM'."""
+    if by == 'month':
+        return day[:7]
+    if by == 'week':
+        d = date.fromisoformat(day)
+        return (d - timedelta(days=d.weekday())).isoformat()
+    return day
+
+
+def fold_counts(rows, by):
+    """(day, status, count) rows, in day order -> [{'period', 'total', 'statuses'}]."""
+    if by not in PERIODS:
+        raise ValueError(f"'by' must be one of {', '.join(PERIODS)}")
+    periods = {}
+    for day, status, count in rows:
+        if not count:
+            continue
+        bucket = periods.get(period_of(day, by))
+        if bucket is None:
+            bucket = periods[period_of(day, by)] = {'period': period_of(day, by), 'total': 0, 'statuses': {}}
+        bucket['total'] += count
+        bucket['statuses'][status] = bucket['statuses'].get(status, 0) + count
+    return list(periods.values())
+
+
+def created_at(value):
+    """createdAt of an imported booking, normalized to utc_now()'s format; now if missing."""
+    if value is None:
+        return utc_now()
+    try:
+        moment = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError(f"'createdAt' is not an ISO date: {value!r}")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def imported_booking(data):
+    """Validated fields of an exported booking being imported (without its old id)."""
+    booking = new_booking(data)
+    booking['createdAt'] = created_at(data.get('createdAt'))
+    return booking
+
+
+def open_store(path):
+    """SQLite store, or the in-memory store with a JSON Lines log for *.jsonl."""
+    if str(path).endswith('.jsonl'):
+        return BookingStore(path)
+    return SQLiteBookingStore(path)
+
+
+class BookingStore:
+    """In-memory bookings per tenant with an append-only JSON Lines log.
+
+    Each line is flushed as it is written, so a crash of the server
+    process loses nothing that was acknowledged.
+    """
+
+    def __init__(self, path=None):
+        self.tenants = {}  # tenant -> {id: booking}, in creation order
+        self.counts = {}  # tenant -> {day: {status: count}}
+        self.created = {}  # tenant -> {day: sorted createdAt times}, for "today" since any time
+        self.next_id = 1
+        self._log = None
+        if path:
+            self._replay(path)
+            self._log = open(path, 'a', encoding='utf-8')
+
+    def _replay(self, path):
+        try:
+            f = open(path, encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+                # Single-site logs hold bare bookings (default tenant '')
+                tenant, booking = (entry['site'], entry['booking']) if 'booking' in entry else ('', entry)
+                bookings = self.tenants.setdefault(tenant, {})
+                if booking['id'] in bookings:
+                    self._count(tenant, bookings[booking['id']], -1)
+                else:
+                    self._add_time(tenant, booking)
+                bookings[booking['id']] = booking
+                self._count(tenant, booking, 1)
+                self.next_id = max(self.next_id, booking['id'] + 1)
+
+    def _append(self, tenant, booking):
+        if self._log is not None:
+            entry = {'site': tenant, 'booking': booking}
+            self._log.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._log.flush()
+
+    def _count(self, tenant, booking, delta):
+        statuses = self.counts.setdefault(tenant, {}).setdefault(booking['createdAt'][:10], {})
+        statuses[booking.get('status')] = statuses.get(booking.get('status'), 0) + delta
+
+    def _add_time(self, tenant, booking):
+        times = self.created.setdefault(tenant, {}).setdefault(booking['createdAt'][:10], [])
+        if times and times[-1] > booking['createdAt']:
+            insort(times, booking['createdAt'])  # an imported booking from earlier that day
+        else:
+            times.append(booking['createdAt'])
+
+    @property
+    def count(self):
+        return sum(len(bookings) for bookings in self.tenants.values())
+
+    @property
+    def sites(self):
+        return len(self.tenants)
+
+    def create(self, tenant, data):
+        """Store a new booking for a tenant; the server assigns id and createdAt."""
+        booking = new_booking(data)
+        booking['id'] = self.next_id
+        booking['createdAt'] = utc_now()
+        self.next_id += 1
+        self.tenants.setdefault(tenant, {})[booking['id']] = booking
+        self._count(tenant, booking, 1)
+        self._add_time(tenant, booking)
+        self._append(tenant, booking)
+        return booking
+
+    def import_bookings(self, tenant, items):
+        """Store a batch of exported bookings under new ids; all or nothing. Returns the count."""
+        bookings = [imported_booking(data) for data in items]
+        for booking in bookings:
+            booking['id'] = self.next_id
+            self.next_id += 1
+            self.tenants.setdefault(tenant, {})[booking['id']] = booking
+            self._count(tenant, booking, 1)
+            self._add_time(tenant, booking)
+            self._append(tenant, booking)
+        return len(bookings)
+
+    def list(self, tenant, status=None, date=None, after=None, limit=None):
+        """Bookings of a tenant, oldest first, optionally only one status / booking date.
+
+        after / limit page the result: at most `limit` bookings with an id above `after`.
+        """
+        bookings = (b for b in self.tenants.get(tenant, {}).values()
+                    if (after is None or b['id'] > after)
+                    and (status is None or b.get('status') == status) and (date is None or b.get('date') == date))
+        return list(islice(bookings, limit))
+
+    def get(self, tenant, booking_id):
+        return self.tenants.get(tenant, {}).get(booking_id)
+
+    def update(self, tenant, booking_id, data):
+        """Apply changed fields to a booking; None if the tenant has no such booking."""
+        booking = self.get(tenant, booking_id)
+        if booking is None:
+            return None
+        changes = clean_fields(data)
+        self._count(tenant, booking, -1)
+        booking.update(changes)
+        self._count(tenant, booking, 1)
+        self._append(tenant, booking)
+        return booking
+
+    def stats(self, tenant, since=None):
+        """{'total', 'today' (created since `since`), 'statuses': {status: count}}."""
+        since = since or start_of_day()
+        first_day = since[:10]
+        statuses = {}
+        today = 0
+        for day, counts in self.counts.get(tenant, {}).items():
+            total = 0
+            for status, count in counts.items():
+                statuses[status] = statuses.get(status, 0) + count
+                total += count
+            if day > first_day:
+                today += total
+        # since is a moment, not a day: on its own day only the bookings from then on count
+        times = self.created.get(tenant, {}).get(first_day, ())
+        today += len(times) - bisect_left(times, since)
+        return {
+            'total': len(self.tenants.get(tenant, {})),
+            'today': today,
+            'statuses': {status: count for status, count in statuses.items() if count},
+        }
+
+    def history(self, tenant, by='day', since=None):
+        """Booking counts per day / week / month from `since` (a 'YYYY-MM-DD' day) on."""
+        days = sorted(day for day in self.counts.get(tenant, {}) if since is None or day >= since)
+        return fold_counts(((day, status, count) for day in days
+                            for status, count in self.counts[tenant][day].items()), by)
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    site TEXT NOT NULL,
+    status TEXT NOT NULL,
+    createdAt TEXT NOT NULL,
+    date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookings_site_id ON bookings (site, id);
+CREATE INDEX IF NOT EXISTS bookings_site_status ON bookings (site, status);
+CREATE INDEX IF NOT EXISTS bookings_site_created ON bookings (site, createdAt);
+CREATE INDEX IF NOT EXISTS bookings_site_date ON bookings (site, date);
+CREATE TABLE IF NOT EXISTS booking_counts (
+    site TEXT NOT NULL,
+    day TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (site, day, status)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS booking_counts_insert AFTER INSERT ON bookings BEGIN
+    INSERT INTO booking_counts VALUES (NEW.site, substr(NEW.createdAt, 1, 10), NEW.status, 1)
+        ON CONFLICT (site, day, status) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS booking_counts_update AFTER UPDATE OF status ON bookings
+WHEN OLD.status IS NOT NEW.status BEGIN
+    UPDATE booking_counts SET count = count - 1
+        WHERE site = OLD.site AND day = substr(OLD.createdAt, 1, 10) AND status = OLD.status;
+    INSERT INTO booking_counts VALUES (NEW.site, substr(NEW.createdAt, 1, 10), NEW.status, 1)
+        ON CONFLICT (site, day, status) DO UPDATE SET count = count + 1;
+END;
+-- Databases created before booking_counts existed: count their bookings once
+-- (counter rows are never deleted, so an empty table means nothing was counted yet)
+INSERT INTO booking_counts
+SELECT site, substr(createdAt, 1, 10), status, COUNT(*) FROM bookings
+WHERE NOT EXISTS (SELECT 1 FROM booking_counts)
+GROUP BY site, substr(createdAt, 1, 10), status;
+"""
+
+# Fixed SQL text, so sqlite3's statement cache compiles each query once per connection
+INSERT = "INSERT INTO bookings (site, status, createdAt, date, data) VALUES (?, ?, ?, ?, ?)"
+UPDATE = "UPDATE bookings SET status = ?, date = ?, data = ? WHERE id = ?"
+SELECT_ONE = "SELECT id, data FROM bookings WHERE site = ? AND id = ?"
+# Every list query is one page: id > after (0 = from the start), LIMIT -1 = no limit
+SELECT_ALL = "SELECT id, data FROM bookings WHERE site = ? AND id > ? ORDER BY id LIMIT ?"
+SELECT_STATUS = "SELECT id, data FROM bookings WHERE site = ? AND status = ? AND id > ? ORDER BY id LIMIT ?"
+SELECT_DATE = "SELECT id, data FROM bookings WHERE site = ? AND date = ? AND id > ? ORDER BY id LIMIT ?"
+SELECT_STATUS_DATE = ("SELECT id, data FROM bookings WHERE site = ? AND date = ? AND status = ? AND id > ? "
+                      "ORDER BY id LIMIT ?")
+COUNT_SINCE = "SELECT COUNT(*) FROM bookings WHERE site = ? AND createdAt >= ?"
+COUNT_STATUSES = "SELECT status, SUM(count) FROM booking_counts WHERE site = ? GROUP BY status HAVING SUM(count) > 0"
+COUNT_DAYS = "SELECT day, status, count FROM booking_counts WHERE site = ? AND day >= ? ORDER BY day"
+COUNT_SITES = "SELECT COUNT(*), COUNT(DISTINCT site) FROM bookings"
+
+
+def _booking(row):
+    """Row (id, data) -> booking dict; data holds every field except the id."""
+    booking = json.loads(row[1])
+    booking['id'] = row[0]
+    return booking
+
+
+def _data(booking):
+    return json.dumps({k: v for k, v in booking.items() if k != 'id'}, ensure_ascii=False)
+
+
+class SQLiteBookingStore:
+    """Bookings per tenant in a SQLite database (WAL mode, indexed by site)."""
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path, isolation_level=None, cached_statements=64)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL never corrupts the database; a power cut may only drop the last commits
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript('BEGIN IMMEDIATE;' + SCHEMA + 'COMMIT;')
+
+    @property
+    def count(self):
+        return self.db.execute(COUNT_SITES).fetchone()[0]
+
+    @property
+    def sites(self):
+        return self.db.execute(COUNT_SITES).fetchone()[1]
+
+    def create(self, tenant, data):
+        """Store a new booking for a tenant; the server assigns id and createdAt."""
+        booking = new_booking(data)
+        booking['createdAt'] = utc_now()
+        cursor = self.db.execute(INSERT, (tenant, str(booking['status']), booking['createdAt'],
+                                          booking.get('date'), _data(booking)))
+        booking['id'] = cursor.lastrowid
+        return booking
+
+    def import_bookings(self, tenant, items):
+        """Store a batch of exported bookings under new ids; all or nothing. Returns the count."""
+        bookings = [imported_booking(data) for data in items]
+        with self.db:
+            self.db.execute('BEGIN')
+            self.db.executemany(INSERT, [(tenant, str(b['status']), b['createdAt'], b.get('date'), _data(b))
+                                         for b in bookings])
+        return len(bookings)
+
+    def list(self, tenant, status=None, date=None, after=None, limit=None):
+        """Bookings of a tenant, oldest first, optionally only one status / booking date.
+
+        after / limit page the result: at most `limit` bookings with an id above `after`.
+        """
+        page = (after or 0, -1 if limit is None else limit)
+        if status is None and date is None:
+            rows = self.db.execute(SELECT_ALL, (tenant, *page))
+        elif date is None:
+            rows = self.db.execute(SELECT_STATUS, (tenant, status, *page))
+        elif status is None:
+            rows = self.db.execute(SELECT_DATE, (tenant, date, *page))
+        else:
+            rows = self.db.execute(SELECT_STATUS_DATE, (tenant, date, status, *page))
+        return [_booking(row) for row in rows]
+
+    def get(self, tenant, booking_id):
+        row = self.db.execute(SELECT_ONE, (tenant, booking_id)).fetchone()
+        return _booking(row) if row else None
+
+    def update(self, tenant, booking_id, data):
+        """Apply changed fields to a booking; None if the tenant has no such booking."""
+        changes = clean_fields(data)
+        with self.db:
+            self.db.execute('BEGIN')
+            booking = self.get(tenant, booking_id)
+            if booking is None:
+                return None
+            booking.update(changes)
+            self.db.execute(UPDATE, (str(booking['status']), booking.get('date'), _data(booking), booking_id))
+        return booking
+
+    def stats(self, tenant, since=None):
+        """{'total', 'today' (created since `since`), 'statuses': {status: count}} from the counters."""
+        since = since or start_of_day()
+        statuses = dict(self.db.execute(COUNT_STATUSES, (tenant,)).fetchall())
+        return {
+            'total': sum(statuses.values()),
+            'today': self.db.execute(COUNT_SINCE, (tenant, since)).fetchone()[0],
+            'statuses': statuses,
+        }
+
+    def history(self, tenant, by='day', since=None):
+        """Booking counts per day / week / month from `since` (a 'YYYY-MM-DD' day) on."""
+        return fold_counts(self.db.execute(COUNT_DAYS, (tenant, since or '')), by)
+
+    def close(self):
+        self.db.close()
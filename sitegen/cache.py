@@ -0,0 +1,98 @@
+"""
+Incremental build cache
+
+Every build stores a manifest in the site folder with a hash of the
+normalized business config plus the template version (a hash of the
+generator module that rendered it and of every shared sitegen module:
+templates, colors, booking scripts, minify, assets, compress, ...). In incremental mode a generator
+checks the manifest first and skips rendering and writing entirely when
+nothing changed, so re-running a fleet of mostly-unchanged sites is close
+to a no-op.
+
+    cache = BuildCache(folder, config, module.__file__)
+    if incremental and cache.is_fresh():
+        return folder
+    files = render(...)
+    files[MANIFEST_NAME] = cache.manifest(files)   # written with the bundle
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+
+MANIFEST_NAME = '.sitegen-manifest.json'
+
+# Process-local counters (read by the batch engine to report cache hits)
+stats = {'hits': 0, 'misses': 0}
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+_versions = {}
+
+
+def shared_sources():
+    """Every module of the sitegen package itself (generators excluded), sorted."""
+    return tuple(sorted(PACKAGE_DIR.glob('*.py')))
+
+
+def template_version(source_files):
+    """Hash of the generator module(s) and the shared sitegen modules.
+
+    source_files is one path or a tuple of paths (the generator). Editing
+    a template, or any module of the render path it goes through,
+    invalidates every site it built.
+    """
+    if not isinstance(source_files, tuple):
+        source_files = (source_files,)
+    key = tuple(str(path) for path in source_files)
+    if key not in _versions:
+        digest = hashlib.sha256()
+        for path in source_files + shared_sources():
+            digest.update(f"{Path(path).name}\n".encode('utf-8'))
+            digest.update(Path(path).read_bytes())
+        _versions[key] = digest.hexdigest()[:16]
+    return _versions[key]
+
+
+def config_hash(config, version):
+    """Stable hash of a config dict (key order does not matter)."""
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{version}\n{payload}".encode('utf-8')).hexdigest()
+
+
+class BuildCache:
+    """Manifest-backed freshness check for one site folder."""
+
+    def __init__(self, folder, config, source_files, options=None):
+        self.folder = Path(folder)
+        self.version = template_version(source_files)
+        # Output options (minify, ...) change the files, so they are part of the hash
+        self.options = {k: v for k, v in (options or {}).items() if v}
+        build = self.version
+        if self.options:
+            build += json.dumps(self.options, sort_keys=True)
+        self.digest = config_hash(config, build)
+
+    def is_fresh(self):
+        """True when the folder was built from the same config and template version."""
+        try:
+            manifest = json.loads((self.folder / MANIFEST_NAME).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            fresh = False
+        else:
+            fresh = (manifest.get('hash') == self.digest
+                     and all((self.folder / name).is_file() for name in manifest.get('files', [])))
+        stats['hits' if fresh else 'misses'] += 1
+        return fresh
+
+    def manifest(self, files):
+        """Manifest text for a build of files (stored in the same bundle)."""
+        manifest = {
+            'hash': self.digest,
+            'template_version': self.version,
+            'options': self.options,
+            'files': sorted(files),
+            'built': datetime.now().isoformat()
+        }
+        return json.dumps(manifest, indent=2)
@@ -0,0 +1,92 @@
+"""
+Non-interactive bulk mode
+
+Usage:
+python -m sitegen --input businesses.jsonl --generator v2 --workers 8
+python website-auto-generator.py --input businesses.csv
+python -m sitegen --input businesses.jsonl --archive sites.zip
+python -m sitegen --input businesses.jsonl --backend http://localhost:8080
+"""
+
+import argparse
+import time
+
+from .batch import SYNC_BATCH, add_sizes, format_sizes, iter_batch
+from .pipeline import GENERATORS
+from .sources import iter_records
+
+PROGRESS_EVERY = 1000
+
+
+def build_parser(generator='v2'):
+    parser = argparse.ArgumentParser(description="Generate websites in bulk from a JSONL or CSV file")
+    parser.add_argument('--input', '-i', required=True, help="JSONL or CSV file with one business per record")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], help="input format (default: from file extension)")
+    parser.add_argument('--generator', '-g', choices=sorted(GENERATORS), default=generator)
+    parser.add_argument('--workers', '-w', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--max-pending', type=int,
+                        help="max chunks of --sync-batch sites in flight (default: 2 x workers)")
+    parser.add_argument('--output-dir', '-o', help="directory to create the site folders in")
+    parser.add_argument('--skip-invalid', action='store_true', help="skip malformed records instead of stopping")
+    parser.add_argument('--incremental', action='store_true', help="skip sites whose config and templates are unchanged")
+    parser.add_argument('--sync-batch', type=int, default=SYNC_BATCH,
+                        help=f"sites written per sync barrier (default: {SYNC_BATCH})")
+    parser.add_argument('--no-sync', action='store_true', help="skip the sync before renaming sites into place")
+    parser.add_argument('--archive', '-a', help="write every site into one .zip or .tar.gz instead of folders")
+    parser.add_argument('--minify', action='store_true', help="minify HTML, inline CSS and JS")
+    parser.add_argument('--assets', action='store_true', help="move shared CSS/JS into fingerprinted files under assets/")
+    parser.add_argument('--asset-url', help="load fingerprinted assets from this URL prefix (implies --assets)")
+    parser.add_argument('--compress', action='store_true', help="add precompressed .gz (and .br) sidecars")
+    parser.add_argument('--size-report', help="write raw vs compressed bytes per site to this CSV (with --compress)")
+    parser.add_argument('--backend', help="booking server URL for the forms and admin panels (python -m sitegen.server)")
+    return parser
+
+
+def main(argv=None, generator='v2'):
+    """Stream records from the input file through the batch engine."""
+    args = build_parser(generator).parse_args(argv)
+
+    options = {'minify': args.minify, 'assets': args.assets or bool(args.asset_url), 'asset_url': args.asset_url,
+               'compress': args.compress, 'backend': args.backend}
+
+    started = time.perf_counter()
+    total = failed = cached = 0
+    sizes = None
+    size_log = None
+
+    try:
+        if args.size_report:
+            import csv
+            size_file = open(args.size_report, 'w', newline='', encoding='utf-8')
+            size_log = csv.writer(size_file)
+            size_log.writerow(['name', 'path', 'raw_bytes', 'gzip_bytes', 'brotli_bytes'])
+
+        records = iter_records(args.input, args.format, args.skip_invalid)
+        for result in iter_batch(records, args.generator, args.workers, args.max_pending, args.output_dir,
+                                 args.incremental, not args.no_sync, args.sync_batch, args.archive, options):
+            total += 1
+            cached += result['cached']
+            if not result['ok']:
+                failed += 1
+                print(f"FAIL  {result['name']}: {result['error']}")
+            if result['sizes']:
+                sizes = add_sizes(sizes, result['sizes'])
+                if size_log:
+                    s = result['sizes']
+                    size_log.writerow([result['name'], result['path'], s['raw'], s['gzip'], s['brotli']])
+            if total % PROGRESS_EVERY == 0:
+                print(f"... {total} sites ({time.perf_counter() - started:.1f}s)")
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}")
+        return 2
+    finally:
+        if size_log:
+            size_file.close()
+
+    elapsed = time.perf_counter() - started
+    print()
+    print(f"Total: {total}  Succeeded: {total - failed}  Failed: {failed}  Unchanged: {cached}")
+    print(f"Elapsed: {elapsed:.2f}s ({total / elapsed if elapsed else 0:.1f} sites/s)")
+    if sizes:
+        print(f"Bytes: {format_sizes(sizes)}")
+    return 1 if failed else 0
@@ -0,0 +1,73 @@
+"""
+Color schemes shared by every generator
+
+Each scheme is a dict with 'primary', 'secondary' and 'accent' hex colors.
+"""
+
+# Named schemes (website-auto-generator / demo, selected via config['color'])
+NAMED_SCHEMES = {
+    'professional': {
+        'primary': '#2c3e50',
+        'secondary': '#3498db',
+        'accent': '#e74c3c'
+    },
+    'warm': {
+        'primary': '#d35400',
+        'secondary': '#f39c12',
+        'accent': '#e67e22'
+    },
+    'medical': {
+        'primary': '#2980b9',
+        'secondary': '#3498db',
+        'accent': '#1abc9c'
+    },
+    'tech': {
+        'primary': '#34495e',
+        'secondary': '#95a5a6',
+        'accent': '#f1c40f'
+    }
+}
+
+# Industry keyword schemes (custom / maker), matched as a substring of the business type
+INDUSTRY_SCHEMES = {
+    "restaurant": {"primary": "#c0392b", "secondary": "#e74c3c", "accent": "#ec7063"},
+    "cafe": {"primary": "#d35400", "secondary": "#f39c12", "accent": "#e67e22"},
+    "clinic": {"primary": "#27ae60", "secondary": "#2ecc71", "accent": "#7dcea0"},
+    "fitness": {"primary": "#8e44ad", "secondary": "#9b59b6", "accent": "#bb8fce"},
+    "beauty": {"primary": "#e91e63", "secondary": "#f06292", "accent": "#f8bbd9"},
+    "shop": {"primary": "#2980b9", "secondary": "#3498db", "accent": "#7fb3d3"},
+    "service": {"primary": "#34495e", "secondary": "#5d6d7e", "accent": "#85929e"},
+    "law": {"primary": "#2c3e50", "secondary": "#34495e", "accent": "#5d6d7e"},
+    "medical": {"primary": "#16a085", "secondary": "#1abc9c", "accent": "#48c9b0"},
+    "tech": {"primary": "#9b59b6", "secondary": "#8e44ad", "accent": "#bb8fce"}
+}
+
+# Business type schemes (simple generator), matched exactly
+SIMPLE_SCHEMES = {
+    "cafe": {"primary": "#d35400", "secondary": "#f39c12", "accent": "#e67e22"},
+    "restaurant": {"primary": "#c0392b", "secondary": "#e74c3c", "accent": "#ec7063"},
+    "shop": {"primary": "#8e44ad", "secondary": "#9b59b6", "accent": "#bb8fce"},
+    "service": {"primary": "#2980b9", "secondary": "#3498db", "accent": "#7fb3d3"},
+    "healthcare": {"primary": "#27ae60", "secondary": "#2ecc71", "accent": "#7dcea0"},
+    "beauty": {"primary": "#e91e63", "secondary": "#f06292", "accent": "#f8bbd9"},
+    "default": {"primary": "#34495e", "secondary": "#5d6d7e", "accent": "#85929e"}
+}
+
+
+def get_color_scheme(color_name):
+    """Return a named color scheme."""
+    return NAMED_SCHEMES.get(color_name, NAMED_SCHEMES['professional'])
+
+
+def match_industry_colors(business_type):
+    """Pick the first industry scheme whose keyword appears in the business type."""
+    business_lower = business_type.lower()
+    for key in INDUSTRY_SCHEMES:
+        if key in business_lower:
+            return INDUSTRY_SCHEMES[key]
+    return INDUSTRY_SCHEMES["service"]
+
+
+def simple_colors(business_type):
+    """Return the simple generator scheme for an exact business type."""
+    return SIMPLE_SCHEMES.get(business_type.lower(), SIMPLE_SCHEMES["default"])
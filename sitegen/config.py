@@ -0,0 +1,141 @@
+"""
+Business config normalization
+
+Turns loosely-shaped records (interactive answers, JSONL rows, CSV rows)
+into the config dict the generators expect.
+"""
+
+import re
+
+# Business type -> presentation defaults (same table as get_user_input)
+TYPE_PRESETS = {
+    'service': {
+        'type': 'service',
+        'color': 'professional',
+        'icon': '🏢',
+        'services': ['Professional Consultation', 'Custom Service', 'After-care']
+    },
+    'restaurant': {
+        'type': 'restaurant',
+        'color': 'warm',
+        'icon': '🍽️',
+        'services': ['Main Menu', 'Beverages', 'Desserts']
+    },
+    'medical': {
+        'type': 'medical',
+        'color': 'medical',
+        'icon': '🏥',
+        'services': ['Medical Consultation', 'Examination', 'Treatment']
+    },
+    'ecommerce': {
+        'type': 'ecommerce',
+        'color': 'tech',
+        'icon': '🛒',
+        'services': ['Product Sales', 'Delivery', 'Customer Service']
+    },
+    'business': {
+        'type': 'business',
+        'color': 'professional',
+        'icon': '💼',
+        'services': ['Basic Service', 'Premium Service', 'VIP Service']
+    }
+}
+
+# Korean service names for the same presets (홈페이지자동생성기)
+SERVICES_KO = {
+    'service': ['전문 상담', '맞춤 서비스', '사후 관리'],
+    'restaurant': ['메인 메뉴', '음료', '디저트'],
+    'medical': ['진료', '검사', '치료'],
+    'ecommerce': ['상품 판매', '배송', '고객 서비스'],
+    'business': ['기본 서비스', '고급 서비스', '프리미엄 서비스']
+}
+
+TYPE_PRESETS_KO = {key: dict(preset, services=SERVICES_KO[key]) for key, preset in TYPE_PRESETS.items()}
+
+# Interactive menu choice -> preset
+BUSINESS_TYPE_MENU = {
+    '1': 'service',
+    '2': 'restaurant',
+    '3': 'medical',
+    '4': 'ecommerce',
+    '5': 'business',
+}
+
+# Accepted input field names -> config key
+FIELD_ALIASES = {
+    'name': 'business_name',
+    'business': 'business_name',
+    'business_name': 'business_name',
+    'type': 'business_type',
+    'business_type': 'business_type',
+    'keywords': 'keywords',
+    'phone': 'phone',
+    'email': 'email',
+    'address': 'address',
+    'services': 'services',
+    'color': 'color',
+    'icon': 'icon',
+}
+
+LIST_FIELDS = ('keywords', 'services')
+_LIST_SEPARATORS = re.compile(r'[,;|]')
+
+
+def split_list(value):
+    """Accept a list or a 'a, b; c' style string and return a clean list."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = _LIST_SEPARATORS.split(value)
+    return [str(v).strip() for v in value if str(v).strip()]
+
+
+def check_type(name, value):
+    """Raise ValueError unless value suits field name: text, or for list fields text or a list of text."""
+    if isinstance(value, str):
+        return
+    if FIELD_ALIASES[name] in LIST_FIELDS:
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return
+        raise ValueError(f"'{name}' must be text or a list of text, not {type(value).__name__}")
+    raise ValueError(f"'{name}' must be text, not {type(value).__name__}")
+
+
+def normalize_record(record):
+    """Map an input record onto generator config keys.
+
+    Raises ValueError when the record has no business name or a field
+    has the wrong type (e.g. {"type": 5}).
+    """
+    config = {}
+    for key, value in record.items():
+        name = str(key).strip().lower()
+        target = FIELD_ALIASES.get(name)
+        if target is None or value is None:
+            continue
+        check_type(name, value)
+        if target in LIST_FIELDS:
+            value = split_list(value)
+        elif isinstance(value, str):
+            value = value.strip()
+        if value not in ('', []):
+            config[target] = value
+
+    if not config.get('business_name'):
+        raise ValueError("record has no business name")
+    return config
+
+
+def full_config(config, presets=None):
+    """Fill in every field a generator may use.
+
+    business_type keeps the free-form type ('legal services'); type, color,
+    icon and services come from the matching preset unless set explicitly.
+    """
+    presets = presets or TYPE_PRESETS
+    business_type = config.get('business_type') or config.get('type') or 'business'
+    full = {'keywords': [], 'phone': '', 'email': '', 'address': '', 'business_type': business_type}
+    full.update(presets.get(business_type.lower(), presets['business']))
+    full['type'] = business_type.lower()
+    full.update({k: v for k, v in config.items() if v not in (None, '', [])})
+    return full
@@ -0,0 +1,6 @@
+"""
+Page sources for each generator script
+
+Every module exposes FOLDER_SUFFIX and render(config, slug) -> {filename: content}.
+Modules are imported on demand by sitegen.pipeline.
+"""
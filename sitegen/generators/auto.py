@@ -0,0 +1,285 @@
+"""
+auto-generator.py pages
+
+Landing page with a booking form plus a statistics admin panel.
+"""
+
+import json
+from datetime import datetime
+
+from ..booking_client import BOOKING_ADMIN_SCRIPT, BOOKING_SCRIPT, BOOKING_TRANSFER_SCRIPT, store_args
+from ..templates import Template
+
+FOLDER_SUFFIX = '-website'
+
+INDEX = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - Professional {{business_type}}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .hero { background: linear-gradient(135deg, #e74c3c 0%, #c0392b 100%); color: white; padding: 100px 0; text-align: center; }
+        .hero h1 { font-size: 3rem; margin-bottom: 1rem; }
+        .hero p { font-size: 1.2rem; margin-bottom: 2rem; }
+        .btn { background: #e67e22; color: white; padding: 15px 30px; border: none; border-radius: 25px; text-decoration: none; display: inline-block; cursor: pointer; }
+        .container { max-width: 1200px; margin: 0 auto; padding: 0 20px; }
+        .section { padding: 60px 0; }
+        .services { background: #f8f9fa; }
+        .booking { background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: white; }
+        .booking-form { max-width: 600px; margin: 0 auto; background: rgba(255,255,255,0.1); padding: 40px; border-radius: 15px; }
+        .form-group { margin-bottom: 20px; }
+        .form-group label { display: block; margin-bottom: 5px; }
+        .form-group input, .form-group select, .form-group textarea { width: 100%; padding: 12px; border: none; border-radius: 8px; }
+        .contact { background: #2c3e50; color: white; }
+        .admin-link { position: fixed; bottom: 20px; right: 20px; background: #e74c3c; color: white; padding: 15px; border-radius: 50px; text-decoration: none; }
+    </style>
+</head>
+<body>
+    <section class="hero">
+        <div class="container">
+            <h1>{{business_name}}</h1>
+            <p>Professional {{business_type}} Services</p>
+            <div style="margin: 20px 0;">Specializing in: {{keywords}}</div>
+            <a href="#booking" class="btn">Book Service</a>
+        </div>
+    </section>
+
+    <section class="services section">
+        <div class="container">
+            <h2>Our Services</h2>
+            <p>We provide excellent {{business_type}} services with years of experience.</p>
+        </div>
+    </section>
+
+    <section id="booking" class="booking section">
+        <div class="container">
+            <h2>Book Your Service</h2>
+            <form class="booking-form" onsubmit="submitBooking(event)">
+                <div class="form-group">
+                    <label>Name</label>
+                    <input type="text" name="name" required>
+                </div>
+                <div class="form-group">
+                    <label>Phone</label>
+                    <input type="tel" name="phone" required>
+                </div>
+                <div class="form-group">
+                    <label>Email</label>
+                    <input type="email" name="email" required>
+                </div>
+                <div class="form-group">
+                    <label>Service Type</label>
+                    <select name="service" required>
+                        <option value="">Select Service</option>
+                        <option value="basic">Basic Service</option>
+                        <option value="premium">Premium Service</option>
+                        <option value="consultation">Consultation</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label>Preferred Date</label>
+                    <input type="date" name="date" required>
+                </div>
+                <div class="form-group">
+                    <label>Message</label>
+                    <textarea name="message" rows="4"></textarea>
+                </div>
+                <button type="submit" class="btn">Submit Booking</button>
+            </form>
+        </div>
+    </section>
+
+    <section class="contact section">
+        <div class="container">
+            <h2>Contact Information</h2>
+            <p><strong>Phone:</strong> {{phone}}</p>
+            <p><strong>Email:</strong> {{email}}</p>
+            <p><strong>Address:</strong> {{address}}</p>
+        </div>
+    </section>
+
+    <a href="admin.html" class="admin-link">Admin</a>
+
+    """ + BOOKING_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+
+        function submitBooking(event) {
+            event.preventDefault();
+            const formData = new FormData(event.target);
+            const booking = {
+                id: Date.now(),
+                name: formData.get('name'),
+                phone: formData.get('phone'),
+                email: formData.get('email'),
+                service: formData.get('service'),
+                date: formData.get('date'),
+                message: formData.get('message'),
+                createdAt: new Date().toISOString(),
+                business: '{{business_name}}',
+                status: 'pending'
+            };
+
+            const form = event.target;
+            bookingStore.add(booking).then(() => {
+                alert('Booking submitted successfully!');
+                form.reset();
+            }).catch(() => alert('Sorry, the booking could not be sent. Please try again.'));
+        }
+    </script>
+</body>
+</html>""")
+
+ADMIN = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - Admin Panel</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: Arial, sans-serif; background: #f5f6fa; }
+        .header { background: #2c3e50; color: white; padding: 20px 0; text-align: center; }
+        .container { max-width: 1200px; margin: 0 auto; padding: 20px; }
+        .stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-bottom: 30px; }
+        .stat-card { background: white; padding: 25px; border-radius: 10px; text-align: center; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .stat-number { font-size: 2rem; font-weight: bold; color: #e74c3c; }
+        .transfer { display: flex; flex-wrap: wrap; gap: 10px; align-items: center; margin-bottom: 30px; }
+        .transfer button, .transfer label { background: white; border: 1px solid #ccc; border-radius: 6px; padding: 8px 14px; cursor: pointer; font-size: 0.9rem; }
+        .transfer input { display: none; }
+        .bookings { background: white; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .bookings-header { background: #3498db; color: white; padding: 20px; }
+        .booking-item { padding: 20px; border-bottom: 1px solid #eee; }
+        .booking-name { font-weight: bold; }
+        .booking-details { color: #666; margin-top: 5px; }
+        .no-bookings { text-align: center; padding: 40px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{{business_name}} Admin Panel</h1>
+    </div>
+
+    <div class="container">
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-number" id="total">0</div>
+                <div>Total Bookings</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="today">0</div>
+                <div>Today</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="pending">0</div>
+                <div>Pending</div>
+            </div>
+        </div>
+
+        <div class="stats">
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>Bookings per Week</h2>
+                </div>
+                <div id="weeklyStats"></div>
+            </div>
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>Bookings per Month</h2>
+                </div>
+                <div id="monthlyStats"></div>
+            </div>
+        </div>
+
+        <div class="transfer" id="transfer">
+            <button data-export="ndjson">Export NDJSON</button>
+            <button data-export="csv">Export CSV</button>
+            <label>Import NDJSON <input type="file" accept=".ndjson,.jsonl"></label>
+            <span data-transfer-status></span>
+        </div>
+
+        <div class="bookings">
+            <div class="bookings-header">
+                <h2>Recent Bookings</h2>
+            </div>
+            <div id="bookingsList">
+                <div class="no-bookings">No bookings yet</div>
+            </div>
+        </div>
+    </div>
+
+    """ + BOOKING_SCRIPT + """
+    """ + BOOKING_ADMIN_SCRIPT + """
+    """ + BOOKING_TRANSFER_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+        bindBookingTransfer(bookingStore, document.getElementById('transfer'), { imported: 'Imported', failed: 'Failed' });
+
+        function loadData() {
+            bookingStore.list({ business: '{{business_name}}' }).then(renderData);
+        }
+
+        // Cards and bars read the store's day counters, not the booking list
+        function loadStats() {
+            bookingStore.stats().then(stats => {
+                document.getElementById('total').textContent = stats.total;
+                document.getElementById('today').textContent = stats.today;
+                document.getElementById('pending').textContent = stats.statuses.pending || 0;
+            }).catch(() => {});
+            showHistory(bookingStore, document.getElementById('weeklyStats'), document.getElementById('monthlyStats'));
+        }
+
+        function renderData(businessBookings) {
+            loadStats();
+
+            const sorted = businessBookings.sort((a, b) => new Date(b.createdAt) - new Date(a.createdAt));
+            patchList(document.getElementById('bookingsList'), sorted, b => `
+                    <div class="booking-item">
+                        <div class="booking-name">${escapeHtml(b.name)}</div>
+                        <div class="booking-details">
+                            ${escapeHtml(b.phone)} | ${escapeHtml(b.email)}<br>
+                            Service: ${escapeHtml(b.service)} | Date: ${escapeHtml(b.date)}<br>
+                            Booked: ${new Date(b.createdAt).toLocaleString()}
+                            ${b.message ? '<br>Note: ' + escapeHtml(b.message) : ''}
+                        </div>
+                    </div>
+                `, '<div class="no-bookings">No bookings yet</div>');
+        }
+
+        // Render now and whenever the bookings change (no polling)
+        bookingStore.watch(renderData, { business: '{{business_name}}' });
+    </script>
+</body>
+</html>""")
+
+
+PAGES = {'index.html': INDEX, 'admin.html': ADMIN}
+
+
+def render(config, slug, pages=PAGES):
+    """Return {filename: content} for one site."""
+    values = {
+        'business_name': config['business_name'],
+        'store_args': store_args(f"{slug}{FOLDER_SUFFIX}", 'bookings', config['business_name']),
+        'business_type': config['business_type'],
+        'keywords': ' • '.join(config['keywords']),
+        'phone': config['phone'],
+        'email': config['email'],
+        'address': config['address'],
+    }
+    info = {
+        "business_name": config['business_name'],
+        "business_type": config['business_type'],
+        "keywords": config['keywords'],
+        "contact": {"phone": config['phone'], "email": config['email'], "address": config['address']},
+        "created": datetime.now().isoformat()
+    }
+
+    return {
+        'index.html': pages['index.html'].render(values),
+        'admin.html': pages['admin.html'].render(values),
+        'info.json': json.dumps(info, indent=2, ensure_ascii=False),
+    }
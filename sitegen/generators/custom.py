@@ -0,0 +1,383 @@
+"""
+custom-website-maker.py pages (맞춤형 웹사이트)
+"""
+
+import json
+from datetime import datetime
+
+from ..booking_client import BOOKING_ADMIN_SCRIPT, BOOKING_SCRIPT, BOOKING_TRANSFER_SCRIPT, store_args
+from ..colors import match_industry_colors
+from ..templates import Template
+
+FOLDER_SUFFIX = '-website'
+
+INDEX = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - {{business_type}}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; }
+
+        .hero {
+            background: linear-gradient(135deg, {{primary}} 0%, {{secondary}} 100%);
+            color: white; padding: 120px 0; text-align: center; position: relative;
+        }
+        .hero::before {
+            content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+            background: rgba(0,0,0,0.1);
+        }
+        .hero-content { position: relative; z-index: 1; }
+        .hero h1 { font-size: 3.5rem; margin-bottom: 1rem; font-weight: 300; }
+        .hero .subtitle { font-size: 1.3rem; margin-bottom: 1rem; opacity: 0.9; }
+        .hero .keywords { font-size: 1.1rem; margin-bottom: 2rem; opacity: 0.8; }
+
+        .btn {
+            background: {{accent}}; color: white; padding: 18px 35px; border: none;
+            border-radius: 30px; text-decoration: none; display: inline-block;
+            font-weight: 600; transition: all 0.3s ease; cursor: pointer;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        }
+        .btn:hover { transform: translateY(-3px); box-shadow: 0 8px 25px rgba(0,0,0,0.3); }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 0 20px; }
+        .section { padding: 80px 0; }
+
+        .features { background: #f8f9fa; }
+        .features-grid {
+            display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 40px; margin-top: 50px;
+        }
+        .feature-card {
+            background: white; padding: 40px; border-radius: 20px; text-align: center;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1); transition: transform 0.3s ease;
+        }
+        .feature-card:hover { transform: translateY(-10px); }
+
+        .booking { background: linear-gradient(135deg, {{secondary}} 0%, {{primary}} 100%); color: white; }
+        .booking-form {
+            max-width: 600px; margin: 0 auto; background: rgba(255,255,255,0.15);
+            padding: 50px; border-radius: 20px; backdrop-filter: blur(10px);
+        }
+        .form-group { margin-bottom: 25px; }
+        .form-group label { display: block; margin-bottom: 8px; font-weight: 600; }
+        .form-group input, .form-group select, .form-group textarea {
+            width: 100%; padding: 15px; border: none; border-radius: 10px;
+            background: rgba(255,255,255,0.9); font-size: 16px;
+        }
+
+        .contact { background: #2c3e50; color: white; }
+        .contact-grid {
+            display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 40px; margin-top: 40px;
+        }
+        .contact-item { text-align: center; padding: 30px; }
+
+        .admin-btn {
+            position: fixed; bottom: 30px; right: 30px; background: {{primary}};
+            color: white; padding: 20px; border-radius: 60px; text-decoration: none;
+            font-weight: bold; box-shadow: 0 6px 20px rgba(0,0,0,0.3);
+        }
+
+        @media (max-width: 768px) {
+            .hero h1 { font-size: 2.5rem; }
+            .container { padding: 0 15px; }
+            .section { padding: 60px 0; }
+        }
+    </style>
+</head>
+<body>
+    <section class="hero">
+        <div class="container">
+            <div class="hero-content">
+                <h1>{{business_name}}</h1>
+                <div class="subtitle">전문 {{business_type}} 서비스</div>
+                <div class="keywords">{{keywords}}</div>
+                <a href="#booking" class="btn">예약하기</a>
+            </div>
+        </div>
+    </section>
+
+    <section class="features section">
+        <div class="container">
+            <h2 style="text-align: center; font-size: 2.5rem; margin-bottom: 20px;">왜 {{business_name}}을 선택해야 할까요?</h2>
+            <div class="features-grid">
+                <div class="feature-card">
+                    <h3>전문성</h3>
+                    <p>수년간의 경험과 전문 지식으로 최고의 {{business_type}} 서비스를 제공합니다.</p>
+                </div>
+                <div class="feature-card">
+                    <h3>품질</h3>
+                    <p>고품질의 서비스와 고객 만족을 위해 최선을 다합니다.</p>
+                </div>
+                <div class="feature-card">
+                    <h3>신뢰성</h3>
+                    <p>약속된 시간과 품질을 지키며 고객과의 신뢰를 최우선으로 합니다.</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <section id="booking" class="booking section">
+        <div class="container">
+            <h2 style="text-align: center; font-size: 2.5rem; margin-bottom: 40px;">예약 문의</h2>
+            <form class="booking-form" onsubmit="submitBooking(event)">
+                <div class="form-group">
+                    <label>성함</label>
+                    <input type="text" name="name" required placeholder="성함을 입력하세요">
+                </div>
+                <div class="form-group">
+                    <label>연락처</label>
+                    <input type="tel" name="phone" required placeholder="010-0000-0000">
+                </div>
+                <div class="form-group">
+                    <label>이메일</label>
+                    <input type="email" name="email" required placeholder="your@email.com">
+                </div>
+                <div class="form-group">
+                    <label>서비스 종류</label>
+                    <select name="service" required>
+                        <option value="">서비스를 선택하세요</option>
+                        <option value="consultation">상담</option>
+                        <option value="basic">기본 서비스</option>
+                        <option value="premium">프리미엄 서비스</option>
+                        <option value="custom">맞춤 서비스</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label>희망 날짜</label>
+                    <input type="date" name="date" required>
+                </div>
+                <div class="form-group">
+                    <label>추가 요청사항</label>
+                    <textarea name="message" rows="4" placeholder="추가로 요청하실 내용이 있으시면 입력해주세요"></textarea>
+                </div>
+                <button type="submit" class="btn" style="width: 100%; font-size: 18px;">예약 신청하기</button>
+            </form>
+        </div>
+    </section>
+
+    <section class="contact section">
+        <div class="container">
+            <h2 style="text-align: center; font-size: 2.5rem; margin-bottom: 20px;">연락처</h2>
+            <div class="contact-grid">
+                <div class="contact-item">
+                    <h3>전화번호</h3>
+                    <p style="font-size: 1.2rem;">{{phone}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>이메일</h3>
+                    <p style="font-size: 1.2rem;">{{email}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>주소</h3>
+                    <p style="font-size: 1.2rem;">{{address}}</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <a href="admin.html" class="admin-btn">관리자</a>
+
+    """ + BOOKING_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+
+        function submitBooking(event) {
+            event.preventDefault();
+
+            const formData = new FormData(event.target);
+            const booking = {
+                id: Date.now() + Math.random(),
+                business: '{{business_name}}',
+                name: formData.get('name'),
+                phone: formData.get('phone'),
+                email: formData.get('email'),
+                service: formData.get('service'),
+                date: formData.get('date'),
+                message: formData.get('message'),
+                status: 'pending',
+                createdAt: new Date().toISOString()
+            };
+
+            const form = event.target;
+            bookingStore.add(booking).then(() => {
+                alert('예약 신청이 완료되었습니다! 곧 연락드리겠습니다.');
+                form.reset();
+            }).catch(() => alert('예약을 전송하지 못했습니다. 잠시 후 다시 시도해 주세요.'));
+        }
+    </script>
+</body>
+</html>""")
+
+ADMIN = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - 관리자 페이지</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f5f6fa; }
+
+        .header {
+            background: linear-gradient(135deg, {{primary}} 0%, {{secondary}} 100%);
+            color: white; padding: 30px 0; text-align: center;
+        }
+        .header h1 { font-size: 2.5rem; font-weight: 300; }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 30px 20px; }
+
+        .stats {
+            display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 25px; margin-bottom: 40px;
+        }
+        .stat-card {
+            background: white; padding: 30px; border-radius: 15px; text-align: center;
+            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+        }
+        .stat-number { font-size: 2.5rem; font-weight: bold; color: {{primary}}; }
+        .transfer { display: flex; flex-wrap: wrap; gap: 10px; align-items: center; margin-bottom: 30px; }
+        .transfer button, .transfer label { background: white; border: 1px solid #ccc; border-radius: 6px; padding: 8px 14px; cursor: pointer; font-size: 0.9rem; }
+        .transfer input { display: none; }
+        .stat-label { color: #666; margin-top: 10px; }
+
+        .bookings {
+            background: white; border-radius: 15px; box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+        }
+        .bookings-header { background: {{secondary}}; color: white; padding: 25px; text-align: center; }
+        .booking-item { padding: 25px; border-bottom: 1px solid #eee; }
+        .booking-name { font-size: 1.2rem; font-weight: bold; color: {{primary}}; }
+        .booking-details { color: #666; margin-top: 10px; }
+        .no-bookings { text-align: center; padding: 60px; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{{business_name}} 관리자 페이지</h1>
+        <p>예약 관리 및 통계</p>
+    </div>
+
+    <div class="container">
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-number" id="total">0</div>
+                <div class="stat-label">총 예약</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="today">0</div>
+                <div class="stat-label">오늘 예약</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="pending">0</div>
+                <div class="stat-label">대기중</div>
+            </div>
+        </div>
+
+        <div class="stats">
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>주별 예약</h2>
+                </div>
+                <div id="weeklyStats"></div>
+            </div>
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>월별 예약</h2>
+                </div>
+                <div id="monthlyStats"></div>
+            </div>
+        </div>
+
+        <div class="transfer" id="transfer">
+            <button data-export="ndjson">NDJSON 내보내기</button>
+            <button data-export="csv">CSV 내보내기</button>
+            <label>NDJSON 가져오기 <input type="file" accept=".ndjson,.jsonl"></label>
+            <span data-transfer-status></span>
+        </div>
+
+        <div class="bookings">
+            <div class="bookings-header">
+                <h2>최근 예약 목록</h2>
+            </div>
+            <div id="bookingsList">
+                <div class="no-bookings">아직 예약이 없습니다</div>
+            </div>
+        </div>
+    </div>
+
+    """ + BOOKING_SCRIPT + """
+    """ + BOOKING_ADMIN_SCRIPT + """
+    """ + BOOKING_TRANSFER_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+        bindBookingTransfer(bookingStore, document.getElementById('transfer'), { imported: '가져온 예약', failed: '실패' });
+
+        function loadBookings() {
+            bookingStore.list({ business: '{{business_name}}' }).then(renderBookings);
+        }
+
+        // 통계 카드와 막대는 예약 목록 대신 날짜별 카운터에서 읽습니다
+        function loadStats() {
+            bookingStore.stats().then(stats => {
+                document.getElementById('total').textContent = stats.total;
+                document.getElementById('today').textContent = stats.today;
+                document.getElementById('pending').textContent = stats.statuses.pending || 0;
+            }).catch(() => {});
+            showHistory(bookingStore, document.getElementById('weeklyStats'), document.getElementById('monthlyStats'));
+        }
+
+        function renderBookings(businessBookings) {
+            loadStats();
+
+            const sorted = businessBookings.sort((a, b) => new Date(b.createdAt) - new Date(a.createdAt));
+            patchList(document.getElementById('bookingsList'), sorted, booking => `
+                    <div class="booking-item">
+                        <div class="booking-name">${escapeHtml(booking.name)}</div>
+                        <div class="booking-details">
+                            연락처: ${escapeHtml(booking.phone)} | 이메일: ${escapeHtml(booking.email)}<br>
+                            서비스: ${escapeHtml(booking.service)} | 희망날짜: ${escapeHtml(booking.date)}<br>
+                            신청일: ${new Date(booking.createdAt).toLocaleString()}
+                            ${booking.message ? '<br>요청사항: ' + escapeHtml(booking.message) : ''}
+                        </div>
+                    </div>
+                `, '<div class="no-bookings">아직 예약이 없습니다</div>');
+        }
+
+        // 예약이 바뀔 때마다 다시 표시 (폴링 없음)
+        bookingStore.watch(renderBookings, { business: '{{business_name}}' });
+    </script>
+</body>
+</html>""")
+
+
+PAGES = {'index.html': INDEX, 'admin.html': ADMIN}
+
+
+def render(config, slug, pages=PAGES):
+    """사이트 한 개의 {파일명: 내용}을 반환합니다."""
+    colors = match_industry_colors(config['business_type'])
+    values = {
+        'business_name': config['business_name'],
+        'store_args': store_args(f"{slug}{FOLDER_SUFFIX}", 'custom_bookings', config['business_name']),
+        'business_type': config['business_type'],
+        'keywords': ' • '.join(config['keywords']),
+        'phone': config['phone'],
+        'email': config['email'],
+        'address': config['address'],
+    }
+    info = {
+        "business_name": config['business_name'],
+        "business_type": config['business_type'],
+        "keywords": config['keywords'],
+        "contact": {"phone": config['phone'], "email": config['email'], "address": config['address']},
+        "created": datetime.now().isoformat()
+    }
+
+    return {
+        'index.html': pages['index.html'].bind(colors).render(values),
+        'admin.html': pages['admin.html'].bind(colors).render(values),
+        'info.json': json.dumps(info, indent=2, ensure_ascii=False),
+    }
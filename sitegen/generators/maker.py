@@ -0,0 +1,444 @@
+"""
+website-maker.py pages
+"""
+
+from ..booking_client import BOOKING_ADMIN_SCRIPT, BOOKING_SCRIPT, BOOKING_TRANSFER_SCRIPT, store_args
+from ..colors import match_industry_colors
+from ..templates import Template
+
+FOLDER_SUFFIX = '-auto'
+
+INDEX = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - {{business_type_title}}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; line-height: 1.6; color: #333; }
+
+        .hero {
+            background: linear-gradient(135deg, {{primary}} 0%, {{secondary}} 100%);
+            color: white; padding: 120px 0; text-align: center; position: relative;
+        }
+        .hero::before {
+            content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+            background: rgba(0,0,0,0.1);
+        }
+        .hero-content { position: relative; z-index: 1; }
+        .hero h1 { font-size: 3.5rem; margin-bottom: 1rem; font-weight: 300; }
+        .hero .subtitle { font-size: 1.3rem; margin-bottom: 1rem; opacity: 0.9; }
+        .hero .keywords { font-size: 1.1rem; margin-bottom: 2rem; opacity: 0.8; }
+
+        .btn {
+            background: {{accent}}; color: white; padding: 18px 35px; border: none;
+            border-radius: 30px; text-decoration: none; display: inline-block;
+            font-weight: 600; transition: all 0.3s ease; cursor: pointer;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+        }
+        .btn:hover { transform: translateY(-3px); box-shadow: 0 8px 25px rgba(0,0,0,0.3); }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 0 20px; }
+        .section { padding: 80px 0; }
+
+        .features { background: #f8f9fa; }
+        .features-grid {
+            display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 40px; margin-top: 50px;
+        }
+        .feature-card {
+            background: white; padding: 40px; border-radius: 20px; text-align: center;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1); transition: transform 0.3s ease;
+        }
+        .feature-card:hover { transform: translateY(-10px); }
+        .feature-icon {
+            width: 80px; height: 80px; background: {{primary}}; color: white;
+            border-radius: 50%; display: flex; align-items: center; justify-content: center;
+            font-size: 2rem; margin: 0 auto 20px;
+        }
+
+        .booking { background: linear-gradient(135deg, {{secondary}} 0%, {{primary}} 100%); color: white; }
+        .booking-form {
+            max-width: 600px; margin: 0 auto; background: rgba(255,255,255,0.15);
+            padding: 50px; border-radius: 20px; backdrop-filter: blur(10px);
+        }
+        .form-group { margin-bottom: 25px; }
+        .form-group label { display: block; margin-bottom: 8px; font-weight: 600; }
+        .form-group input, .form-group select, .form-group textarea {
+            width: 100%; padding: 15px; border: none; border-radius: 10px;
+            background: rgba(255,255,255,0.9); font-size: 16px;
+        }
+
+        .contact { background: #2c3e50; color: white; }
+        .contact-grid {
+            display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 40px; margin-top: 40px;
+        }
+        .contact-item { text-align: center; padding: 30px; }
+        .contact-item h3 { color: {{accent}}; margin-bottom: 10px; }
+
+        .admin-btn {
+            position: fixed; bottom: 30px; right: 30px; background: {{primary}};
+            color: white; padding: 20px; border-radius: 60px; text-decoration: none;
+            font-weight: bold; box-shadow: 0 6px 20px rgba(0,0,0,0.3);
+            transition: all 0.3s ease;
+        }
+        .admin-btn:hover { transform: scale(1.1); }
+
+        @media (max-width: 768px) {
+            .hero h1 { font-size: 2.5rem; }
+            .hero .subtitle { font-size: 1.1rem; }
+            .container { padding: 0 15px; }
+            .section { padding: 60px 0; }
+        }
+    </style>
+</head>
+<body>
+    <section class="hero">
+        <div class="container">
+            <div class="hero-content">
+                <h1>{{business_name}}</h1>
+                <div class="subtitle">Premium {{business_type}} Services</div>
+                <div class="keywords">🌟 {{keywords}}</div>
+                <a href="#booking" class="btn">Book Now</a>
+            </div>
+        </div>
+    </section>
+
+    <section class="features section">
+        <div class="container">
+            <h2 style="text-align: center; font-size: 2.5rem; margin-bottom: 20px;">Why Choose Us</h2>
+            <div class="features-grid">
+                <div class="feature-card">
+                    <div class="feature-icon">⭐</div>
+                    <h3>Professional Excellence</h3>
+                    <p>Top-quality {{business_type}} services with years of expertise and dedication to customer satisfaction.</p>
+                </div>
+                <div class="feature-card">
+                    <div class="feature-icon">💎</div>
+                    <h3>Premium Quality</h3>
+                    <p>We use only the finest materials and latest techniques to deliver exceptional results.</p>
+                </div>
+                <div class="feature-card">
+                    <div class="feature-icon">🚀</div>
+                    <h3>Fast & Reliable</h3>
+                    <p>Quick turnaround times without compromising on quality or attention to detail.</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <section id="booking" class="booking section">
+        <div class="container">
+            <h2 style="text-align: center; font-size: 2.5rem; margin-bottom: 40px;">Book Your Service</h2>
+            <form class="booking-form" onsubmit="submitBooking(event)">
+                <div class="form-group">
+                    <label>Your Name</label>
+                    <input type="text" name="name" required placeholder="Enter your full name">
+                </div>
+                <div class="form-group">
+                    <label>Phone Number</label>
+                    <input type="tel" name="phone" required placeholder="010-0000-0000">
+                </div>
+                <div class="form-group">
+                    <label>Email Address</label>
+                    <input type="email" name="email" required placeholder="your@email.com">
+                </div>
+                <div class="form-group">
+                    <label>Service Type</label>
+                    <select name="service" required>
+                        <option value="">Select a service</option>
+                        <option value="consultation">Free Consultation</option>
+                        <option value="basic">Basic Service</option>
+                        <option value="premium">Premium Service</option>
+                        <option value="custom">Custom Package</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label>Preferred Date</label>
+                    <input type="date" name="date" required>
+                </div>
+                <div class="form-group">
+                    <label>Additional Information</label>
+                    <textarea name="message" rows="4" placeholder="Tell us about your specific needs..."></textarea>
+                </div>
+                <button type="submit" class="btn" style="width: 100%; font-size: 18px;">Submit Booking Request</button>
+            </form>
+        </div>
+    </section>
+
+    <section class="contact section">
+        <div class="container">
+            <h2 style="text-align: center; font-size: 2.5rem; margin-bottom: 20px;">Get In Touch</h2>
+            <div class="contact-grid">
+                <div class="contact-item">
+                    <h3>📞 Phone</h3>
+                    <p style="font-size: 1.2rem;">{{phone}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>✉️ Email</h3>
+                    <p style="font-size: 1.2rem;">{{email}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>📍 Location</h3>
+                    <p style="font-size: 1.2rem;">{{address}}</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <a href="admin.html" class="admin-btn">Admin</a>
+
+    """ + BOOKING_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+
+        function submitBooking(event) {
+            event.preventDefault();
+
+            const formData = new FormData(event.target);
+            const booking = {
+                id: Date.now() + Math.random(),
+                business: '{{business_name}}',
+                name: formData.get('name'),
+                phone: formData.get('phone'),
+                email: formData.get('email'),
+                service: formData.get('service'),
+                date: formData.get('date'),
+                message: formData.get('message'),
+                status: 'pending',
+                createdAt: new Date().toISOString()
+            };
+
+            const form = event.target;
+            bookingStore.add(booking).then(() => {
+                alert('🎉 Booking submitted successfully! We will contact you soon.');
+                form.reset();
+            }).catch(() => alert('Sorry, the booking could not be sent. Please try again.'));
+        }
+    </script>
+</body>
+</html>""")
+
+ADMIN = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - Admin Dashboard</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #f5f6fa; }
+
+        .header {
+            background: linear-gradient(135deg, {{primary}} 0%, {{secondary}} 100%);
+            color: white; padding: 30px 0; text-align: center; box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        }
+        .header h1 { font-size: 2.5rem; font-weight: 300; }
+        .header p { opacity: 0.9; margin-top: 10px; }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 30px 20px; }
+
+        .stats {
+            display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 25px; margin-bottom: 40px;
+        }
+        .stat-card {
+            background: white; padding: 30px; border-radius: 15px; text-align: center;
+            box-shadow: 0 5px 20px rgba(0,0,0,0.1); transition: transform 0.3s ease;
+        }
+        .stat-card:hover { transform: translateY(-5px); }
+        .stat-number { font-size: 2.5rem; font-weight: bold; color: {{primary}}; }
+        .transfer { display: flex; flex-wrap: wrap; gap: 10px; align-items: center; margin-bottom: 30px; }
+        .transfer button, .transfer label { background: white; border: 1px solid #ccc; border-radius: 6px; padding: 8px 14px; cursor: pointer; font-size: 0.9rem; }
+        .transfer input { display: none; }
+        .stat-label { color: #666; margin-top: 10px; font-size: 1.1rem; }
+
+        .bookings {
+            background: white; border-radius: 15px; box-shadow: 0 5px 20px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .bookings-header {
+            background: {{secondary}}; color: white; padding: 25px; text-align: center;
+        }
+        .bookings-header h2 { font-size: 1.8rem; font-weight: 400; }
+
+        .booking-item {
+            padding: 25px; border-bottom: 1px solid #eee; transition: background 0.3s ease;
+        }
+        .booking-item:hover { background: #f8f9fa; }
+        .booking-item:last-child { border-bottom: none; }
+
+        .booking-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; }
+        .booking-name { font-size: 1.2rem; font-weight: bold; color: {{primary}}; }
+        .booking-status {
+            background: #27ae60; color: white; padding: 5px 12px; border-radius: 20px;
+            font-size: 0.85rem; font-weight: 600;
+        }
+        .booking-details { color: #666; line-height: 1.6; }
+        .booking-details strong { color: #333; }
+
+        .no-bookings {
+            text-align: center; padding: 60px; color: #666; font-size: 1.1rem;
+        }
+        .no-bookings-icon { font-size: 3rem; margin-bottom: 20px; }
+
+        .refresh-btn {
+            position: fixed; bottom: 30px; right: 30px; background: {{primary}};
+            color: white; padding: 15px; border-radius: 50px; border: none;
+            cursor: pointer; box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+            transition: all 0.3s ease;
+        }
+        .refresh-btn:hover { transform: scale(1.1); }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{{business_name}}</h1>
+        <p>Admin Dashboard & Booking Management</p>
+    </div>
+
+    <div class="container">
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-number" id="totalBookings">0</div>
+                <div class="stat-label">Total Bookings</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="todayBookings">0</div>
+                <div class="stat-label">Today's Bookings</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="weekBookings">0</div>
+                <div class="stat-label">This Week</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="pendingBookings">0</div>
+                <div class="stat-label">Pending</div>
+            </div>
+        </div>
+
+        <div class="stats">
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>Bookings per Week</h2>
+                </div>
+                <div id="weeklyStats"></div>
+            </div>
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>Bookings per Month</h2>
+                </div>
+                <div id="monthlyStats"></div>
+            </div>
+        </div>
+
+        <div class="transfer" id="transfer">
+            <button data-export="ndjson">Export NDJSON</button>
+            <button data-export="csv">Export CSV</button>
+            <label>Import NDJSON <input type="file" accept=".ndjson,.jsonl"></label>
+            <span data-transfer-status></span>
+        </div>
+
+        <div class="bookings">
+            <div class="bookings-header">
+                <h2>Recent Booking Requests</h2>
+            </div>
+            <div id="bookingsList">
+                <div class="no-bookings">
+                    <div class="no-bookings-icon">📅</div>
+                    <div>No booking requests yet</div>
+                    <div style="margin-top: 10px; font-size: 0.9rem;">Bookings will appear here automatically</div>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <button class="refresh-btn" onclick="loadBookings()" title="Refresh Data">🔄</button>
+
+    """ + BOOKING_SCRIPT + """
+    """ + BOOKING_ADMIN_SCRIPT + """
+    """ + BOOKING_TRANSFER_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+        bindBookingTransfer(bookingStore, document.getElementById('transfer'), { imported: 'Imported', failed: 'Failed' });
+
+        function loadBookings() {
+            bookingStore.list({ business: '{{business_name}}' }).then(renderBookings);
+        }
+
+        // Cards and bars read the store's day counters, not the booking list
+        function loadStats() {
+            bookingStore.stats().then(stats => {
+                document.getElementById('totalBookings').textContent = stats.total;
+                document.getElementById('todayBookings').textContent = stats.today;
+                document.getElementById('pendingBookings').textContent = stats.statuses.pending || 0;
+            }).catch(() => {});
+
+            // Today and the six days before it
+            const weekAgo = new Date();
+            weekAgo.setDate(weekAgo.getDate() - 6);
+            bookingStore.history('day', localDay(weekAgo)).then(days => {
+                document.getElementById('weekBookings').textContent = days.reduce((sum, day) => sum + day.total, 0);
+            }).catch(() => {});
+            showHistory(bookingStore, document.getElementById('weeklyStats'), document.getElementById('monthlyStats'));
+        }
+
+        function renderBookings(businessBookings) {
+            // Update statistics
+            loadStats();
+
+            // Display bookings
+            const sorted = businessBookings.sort((a, b) => new Date(b.createdAt) - new Date(a.createdAt));
+            const emptyHtml = `
+                <div class="no-bookings">
+                    <div class="no-bookings-icon">📅</div>
+                    <div>No booking requests yet</div>
+                    <div style="margin-top: 10px; font-size: 0.9rem;">Bookings will appear here automatically</div>
+                </div>
+                `;
+            patchList(document.getElementById('bookingsList'), sorted, booking => `
+                    <div class="booking-item">
+                        <div class="booking-header">
+                            <div class="booking-name">${escapeHtml(booking.name)}</div>
+                            <div class="booking-status">${escapeHtml(booking.status.toUpperCase())}</div>
+                        </div>
+                        <div class="booking-details">
+                            <strong>Contact:</strong> ${escapeHtml(booking.phone)} | ${escapeHtml(booking.email)}<br>
+                            <strong>Service:</strong> ${escapeHtml(booking.service)} | <strong>Date:</strong> ${escapeHtml(booking.date)}<br>
+                            <strong>Requested:</strong> ${new Date(booking.createdAt).toLocaleString()}
+                            ${booking.message ? `<br><strong>Message:</strong> "${escapeHtml(booking.message)}"` : ''}
+                        </div>
+                    </div>
+                `, emptyHtml);
+        }
+
+        // Render now and whenever the bookings change (no polling)
+        bookingStore.watch(renderBookings, { business: '{{business_name}}' });
+    </script>
+</body>
+</html>""")
+
+
+PAGES = {'index.html': INDEX, 'admin.html': ADMIN}
+
+
+def render(config, slug, pages=PAGES):
+    """Return {filename: content} for one site."""
+    colors = match_industry_colors(config['business_type'])
+    values = {
+        'business_name': config['business_name'],
+        'store_args': store_args(f"{slug}{FOLDER_SUFFIX}", 'website_bookings', config['business_name']),
+        'business_type': config['business_type'],
+        'business_type_title': config['business_type'].title(),
+        'keywords': ' • '.join(config['keywords']),
+        'phone': config['phone'],
+        'email': config['email'],
+        'address': config['address'],
+    }
+
+    return {
+        'index.html': pages['index.html'].bind(colors).render(values),
+        'admin.html': pages['admin.html'].bind(colors).render(values),
+    }
@@ -0,0 +1,456 @@
+"""
+simple-website-generator.py pages
+"""
+
+import json
+from datetime import datetime
+
+from ..booking_client import BOOKING_ADMIN_SCRIPT, BOOKING_SCRIPT, BOOKING_TRANSFER_SCRIPT, store_args
+from ..colors import simple_colors
+from ..templates import Template
+
+FOLDER_SUFFIX = '-website'
+
+INDEX = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - {{business_type_title}}</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; }
+
+        .hero {
+            background: linear-gradient(135deg, {{primary}} 0%, {{secondary}} 100%);
+            color: white;
+            padding: 100px 0;
+            text-align: center;
+        }
+        .hero h1 { font-size: 3rem; margin-bottom: 1rem; font-weight: 300; }
+        .hero p { font-size: 1.2rem; margin-bottom: 2rem; opacity: 0.9; }
+        .hero .keywords { font-size: 1rem; opacity: 0.8; margin-bottom: 2rem; }
+
+        .btn {
+            background: {{accent}};
+            color: white;
+            padding: 15px 30px;
+            border: none;
+            border-radius: 25px;
+            text-decoration: none;
+            display: inline-block;
+            transition: all 0.3s ease;
+            cursor: pointer;
+        }
+        .btn:hover { transform: translateY(-2px); box-shadow: 0 5px 15px rgba(0,0,0,0.2); }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 0 20px; }
+        .section { padding: 60px 0; }
+
+        .services { background: #f8f9fa; }
+        .services-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 30px;
+            margin-top: 30px;
+        }
+        .service-card {
+            background: white;
+            padding: 30px;
+            border-radius: 15px;
+            text-align: center;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+            transition: transform 0.3s ease;
+        }
+        .service-card:hover { transform: translateY(-5px); }
+
+        .booking {
+            background: linear-gradient(135deg, {{secondary}} 0%, {{primary}} 100%);
+            color: white;
+        }
+        .booking-form {
+            max-width: 600px;
+            margin: 0 auto;
+            background: rgba(255,255,255,0.1);
+            padding: 40px;
+            border-radius: 15px;
+            backdrop-filter: blur(10px);
+        }
+        .form-group { margin-bottom: 20px; }
+        .form-group label { display: block; margin-bottom: 5px; font-weight: 500; }
+        .form-group input, .form-group textarea, .form-group select {
+            width: 100%;
+            padding: 12px;
+            border: none;
+            border-radius: 8px;
+            background: rgba(255,255,255,0.9);
+        }
+
+        .contact {
+            background: #2c3e50;
+            color: white;
+        }
+        .contact-info {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 30px;
+            margin-top: 30px;
+        }
+        .contact-item {
+            text-align: center;
+            padding: 20px;
+        }
+
+        .admin-link {
+            position: fixed;
+            bottom: 20px;
+            right: 20px;
+            background: {{primary}};
+            color: white;
+            padding: 15px;
+            border-radius: 50px;
+            text-decoration: none;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.3);
+        }
+
+        @media (max-width: 768px) {
+            .hero h1 { font-size: 2rem; }
+            .hero p { font-size: 1rem; }
+            .container { padding: 0 15px; }
+        }
+    </style>
+</head>
+<body>
+    <section class="hero">
+        <div class="container">
+            <h1>{{business_name}}</h1>
+            <p>Professional {{business_type}} services</p>
+            <div class="keywords">{{keywords}}</div>
+            <a href="#booking" class="btn">Book Now</a>
+        </div>
+    </section>
+
+    <section class="services section">
+        <div class="container">
+            <h2>Our Services</h2>
+            <div class="services-grid">
+                <div class="service-card">
+                    <h3>Premium Service</h3>
+                    <p>High-quality {{business_type}} service tailored to your needs</p>
+                </div>
+                <div class="service-card">
+                    <h3>Professional Team</h3>
+                    <p>Experienced professionals dedicated to excellence</p>
+                </div>
+                <div class="service-card">
+                    <h3>Customer Satisfaction</h3>
+                    <p>Your satisfaction is our top priority</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <section id="booking" class="booking section">
+        <div class="container">
+            <h2>Book Your Service</h2>
+            <form class="booking-form" onsubmit="submitBooking(event)">
+                <div class="form-group">
+                    <label for="name">Name</label>
+                    <input type="text" id="name" name="name" required>
+                </div>
+                <div class="form-group">
+                    <label for="phone">Phone</label>
+                    <input type="tel" id="phone" name="phone" required>
+                </div>
+                <div class="form-group">
+                    <label for="email">Email</label>
+                    <input type="email" id="email" name="email" required>
+                </div>
+                <div class="form-group">
+                    <label for="service">Service Type</label>
+                    <select id="service" name="service" required>
+                        <option value="">Select Service</option>
+                        <option value="basic">Basic Service</option>
+                        <option value="premium">Premium Service</option>
+                        <option value="custom">Custom Service</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label for="date">Preferred Date</label>
+                    <input type="date" id="date" name="date" required>
+                </div>
+                <div class="form-group">
+                    <label for="message">Additional Notes</label>
+                    <textarea id="message" name="message" rows="4"></textarea>
+                </div>
+                <button type="submit" class="btn">Submit Booking</button>
+            </form>
+        </div>
+    </section>
+
+    <section class="contact section">
+        <div class="container">
+            <h2>Contact Information</h2>
+            <div class="contact-info">
+                <div class="contact-item">
+                    <h3>Phone</h3>
+                    <p>{{phone}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>Email</h3>
+                    <p>{{email}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>Address</h3>
+                    <p>{{address}}</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <a href="admin.html" class="admin-link">Admin</a>
+
+    """ + BOOKING_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+
+        function submitBooking(event) {
+            event.preventDefault();
+
+            const formData = new FormData(event.target);
+            const booking = {
+                id: Date.now() + Math.random(),
+                name: formData.get('name'),
+                phone: formData.get('phone'),
+                email: formData.get('email'),
+                service: formData.get('service'),
+                date: formData.get('date'),
+                message: formData.get('message'),
+                createdAt: new Date().toISOString(),
+                business: '{{business_name}}',
+                type: '{{business_type}}'
+            };
+
+            const form = event.target;
+            bookingStore.add(booking).then(() => {
+                alert('Booking submitted successfully!');
+                form.reset();
+            }).catch(() => alert('Sorry, the booking could not be sent. Please try again.'));
+        }
+    </script>
+</body>
+</html>""")
+
+ADMIN = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - Admin Panel</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #f5f6fa; }
+
+        .header {
+            background: {{primary}};
+            color: white;
+            padding: 20px 0;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .header h1 { text-align: center; }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 20px; }
+
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .stat-card {
+            background: white;
+            padding: 25px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .stat-number { font-size: 2rem; font-weight: bold; color: {{primary}}; }
+        .transfer { display: flex; flex-wrap: wrap; gap: 10px; align-items: center; margin-bottom: 30px; }
+        .transfer button, .transfer label { background: white; border: 1px solid #ccc; border-radius: 6px; padding: 8px 14px; cursor: pointer; font-size: 0.9rem; }
+        .transfer input { display: none; }
+        .stat-label { color: #666; margin-top: 5px; }
+
+        .bookings {
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .bookings-header {
+            background: {{secondary}};
+            color: white;
+            padding: 20px;
+        }
+        .booking-item {
+            padding: 20px;
+            border-bottom: 1px solid #eee;
+        }
+        .booking-item:last-child { border-bottom: none; }
+        .booking-name { font-weight: bold; font-size: 1.1rem; }
+        .booking-details { color: #666; margin-top: 5px; }
+        .booking-date { color: {{primary}}; font-weight: 500; }
+
+        .no-bookings {
+            text-align: center;
+            padding: 40px;
+            color: #666;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{{business_name}} Admin Panel</h1>
+    </div>
+
+    <div class="container">
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-number" id="totalBookings">0</div>
+                <div class="stat-label">Total Bookings</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="todayBookings">0</div>
+                <div class="stat-label">Today's Bookings</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="thisWeekBookings">0</div>
+                <div class="stat-label">This Week</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number" id="pendingBookings">0</div>
+                <div class="stat-label">Pending</div>
+            </div>
+        </div>
+
+        <div class="stats">
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>Bookings per Week</h2>
+                </div>
+                <div id="weeklyStats"></div>
+            </div>
+            <div class="bookings">
+                <div class="bookings-header">
+                    <h2>Bookings per Month</h2>
+                </div>
+                <div id="monthlyStats"></div>
+            </div>
+        </div>
+
+        <div class="transfer" id="transfer">
+            <button data-export="ndjson">Export NDJSON</button>
+            <button data-export="csv">Export CSV</button>
+            <label>Import NDJSON <input type="file" accept=".ndjson,.jsonl"></label>
+            <span data-transfer-status></span>
+        </div>
+
+        <div class="bookings">
+            <div class="bookings-header">
+                <h2>Recent Bookings</h2>
+            </div>
+            <div id="bookingsList">
+                <div class="no-bookings">No bookings yet</div>
+            </div>
+        </div>
+    </div>
+
+    """ + BOOKING_SCRIPT + """
+    """ + BOOKING_ADMIN_SCRIPT + """
+    """ + BOOKING_TRANSFER_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+        bindBookingTransfer(bookingStore, document.getElementById('transfer'), { imported: 'Imported', failed: 'Failed' });
+
+        function loadBookings() {
+            bookingStore.list({ business: '{{business_name}}' }).then(renderBookings);
+        }
+
+        // Cards and bars read the store's day counters, not the booking list
+        function loadStats() {
+            bookingStore.stats().then(stats => {
+                document.getElementById('totalBookings').textContent = stats.total;
+                document.getElementById('todayBookings').textContent = stats.today;
+                document.getElementById('pendingBookings').textContent = stats.total;
+            }).catch(() => {});
+
+            // Today and the six days before it
+            const weekAgo = new Date();
+            weekAgo.setDate(weekAgo.getDate() - 6);
+            bookingStore.history('day', localDay(weekAgo)).then(days => {
+                document.getElementById('thisWeekBookings').textContent = days.reduce((sum, day) => sum + day.total, 0);
+            }).catch(() => {});
+            showHistory(bookingStore, document.getElementById('weeklyStats'), document.getElementById('monthlyStats'));
+        }
+
+        function renderBookings(businessBookings) {
+            // Update statistics
+            loadStats();
+
+            // Display bookings
+            const sorted = businessBookings.sort((a, b) => new Date(b.createdAt) - new Date(a.createdAt));
+            patchList(document.getElementById('bookingsList'), sorted, booking => `
+                    <div class="booking-item">
+                        <div class="booking-name">${escapeHtml(booking.name)}</div>
+                        <div class="booking-details">
+                            Phone: ${escapeHtml(booking.phone)} | Email: ${escapeHtml(booking.email)}<br>
+                            Service: ${escapeHtml(booking.service)} | Date: ${escapeHtml(booking.date)}
+                        </div>
+                        <div class="booking-date">
+                            Booked: ${new Date(booking.createdAt).toLocaleString()}
+                        </div>
+                        ${booking.message ? `<div style="margin-top: 5px; font-style: italic;">"${escapeHtml(booking.message)}"</div>` : ''}
+                    </div>
+                `, '<div class="no-bookings">No bookings yet</div>');
+        }
+
+        // Render now and whenever the bookings change (no polling)
+        bookingStore.watch(renderBookings, { business: '{{business_name}}' });
+    </script>
+</body>
+</html>""")
+
+
+PAGES = {'index.html': INDEX, 'admin.html': ADMIN}
+
+
+def render(config, slug, pages=PAGES):
+    """Return {filename: content} for one site."""
+    colors = simple_colors(config['business_type'])
+    values = {
+        'business_name': config['business_name'],
+        'store_args': store_args(f"{slug}{FOLDER_SUFFIX}", 'bookings', config['business_name']),
+        'business_type': config['business_type'],
+        'business_type_title': config['business_type'].title(),
+        'keywords': ' • '.join(config['keywords']),
+        'phone': config['phone'],
+        'email': config['email'],
+        'address': config['address'],
+    }
+    info = {
+        "business_name": config['business_name'],
+        "business_type": config['business_type'],
+        "keywords": config['keywords'],
+        "contact": {
+            "phone": config['phone'],
+            "email": config['email'],
+            "address": config['address']
+        },
+        "created": datetime.now().isoformat(),
+        "files": ["index.html", "admin.html"]
+    }
+
+    return {
+        'index.html': pages['index.html'].bind(colors).render(values),
+        'admin.html': pages['admin.html'].bind(colors).render(values),
+        'info.json': json.dumps(info, indent=2, ensure_ascii=False),
+    }
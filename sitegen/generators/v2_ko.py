@@ -0,0 +1,502 @@
+"""
+홈페이지자동생성기.py pages (v2, 한국어)
+"""
+
+import json
+from functools import lru_cache
+
+from ..booking_client import BOOKING_ADMIN_SCRIPT, BOOKING_SCRIPT, BOOKING_TABLE_SCRIPT, BOOKING_TRANSFER_SCRIPT, store_args
+from ..colors import get_color_scheme
+from ..config import TYPE_PRESETS_KO
+from ..naming import site_slug
+from ..templates import Template
+
+FOLDER_SUFFIX = '-website'
+
+# Bulk runs fall back to Korean service names
+PRESETS = TYPE_PRESETS_KO
+
+
+@lru_cache(maxsize=256)
+def render_services(services):
+    """서비스 카드와 예약 옵션을 생성합니다 (서비스 목록별 캐시)."""
+    # 서비스 카드 생성
+    service_cards = ""
+    icons = ['⭐', '🎯', '💎']
+    for i, service in enumerate(services):
+        icon = icons[i] if i < len(icons) else '🏢'
+        service_cards += f"""
+                <div class="service-card">
+                    <div class="service-icon">{icon}</div>
+                    <h3>{service}</h3>
+                    <p>고객 만족을 위한 {service} 서비스를 제공합니다</p>
+                </div>"""
+
+    # 서비스 옵션 생성
+    service_options = ""
+    for service in services:
+        service_options += f'<option value="{service}">{service}</option>'
+
+    return service_cards, service_options
+
+
+INDEX_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - {{keywords}}</title>
+    <meta name="description" content="{{business_name}}는 {{keywords}}를 제공하는 전문 업체입니다.">
+    <meta name="keywords" content="{{keywords}}">
+    <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>{{icon}}</text></svg>" />
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Apple SD Gothic Neo', -apple-system, BlinkMacSystemFont, sans-serif; line-height: 1.6; color: {{primary}}; }
+
+        /* Header */
+        header { position: fixed; top: 0; left: 0; right: 0; background: rgba(255, 255, 255, 0.95); backdrop-filter: blur(15px); border-bottom: 1px solid #dee2e6; padding: 1rem 0; z-index: 1000; }
+        nav { display: flex; justify-content: space-between; align-items: center; max-width: 1200px; margin: 0 auto; padding: 0 2rem; }
+        .logo { font-size: 1.8rem; font-weight: 700; color: {{primary}}; }
+        .nav-menu { display: flex; list-style: none; gap: 2rem; }
+        .nav-item a { text-decoration: none; color: {{primary}}; font-weight: 500; transition: color 0.3s ease; }
+        .nav-item a:hover { color: {{secondary}}; }
+
+        /* Hero */
+        .hero { background: linear-gradient(135deg, {{primary}} 0%, {{secondary}} 100%); color: white; padding: 120px 0 80px; text-align: center; }
+        .hero-content { max-width: 800px; margin: 0 auto; padding: 0 2rem; }
+        .hero h1 { font-size: 3rem; margin-bottom: 1rem; font-weight: 700; }
+        .hero p { font-size: 1.2rem; margin-bottom: 2rem; opacity: 0.9; }
+        .cta-button { background: {{accent}}; color: white; padding: 15px 30px; border: none; border-radius: 8px; font-size: 1.1rem; font-weight: 600; cursor: pointer; text-decoration: none; display: inline-block; transition: transform 0.3s ease; }
+        .cta-button:hover { transform: translateY(-2px); }
+
+        /* Services */
+        .services { padding: 80px 0; background: #f8f9fa; }
+        .container { max-width: 1200px; margin: 0 auto; padding: 0 2rem; }
+        .section-title { text-align: center; margin-bottom: 3rem; }
+        .section-title h2 { font-size: 2.5rem; color: {{primary}}; margin-bottom: 1rem; }
+        .services-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; margin-top: 3rem; }
+        .service-card { background: white; padding: 2rem; border-radius: 15px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); text-align: center; transition: transform 0.3s ease; }
+        .service-card:hover { transform: translateY(-5px); }
+        .service-icon { font-size: 3rem; color: {{secondary}}; margin-bottom: 1rem; }
+        .service-card h3 { color: {{primary}}; margin-bottom: 1rem; }
+
+        /* Booking */
+        .booking { padding: 80px 0; background: white; }
+        .booking-form { max-width: 600px; margin: 0 auto; }
+        .form-grid { display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-bottom: 1rem; }
+        .form-group { margin-bottom: 1rem; }
+        .form-group label { display: block; margin-bottom: 0.5rem; font-weight: 600; }
+        .form-group input, .form-group select, .form-group textarea { width: 100%; padding: 12px; border: 2px solid #ddd; border-radius: 8px; font-size: 1rem; }
+        .form-group input:focus, .form-group select:focus, .form-group textarea:focus { outline: none; border-color: {{secondary}}; }
+
+        /* Contact */
+        .contact { padding: 80px 0; background: {{primary}}; color: white; }
+        .contact-info { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; margin-top: 2rem; }
+        .contact-item { text-align: center; }
+        .contact-item h3 { margin-bottom: 1rem; color: {{secondary}}; }
+
+        /* Footer */
+        footer { background: #2c3e50; color: white; text-align: center; padding: 2rem 0; }
+
+        /* Responsive */
+        @media (max-width: 768px) {
+            .hero h1 { font-size: 2rem; }
+            .nav-menu { display: none; }
+            .services-grid { grid-template-columns: 1fr; }
+            .form-grid { grid-template-columns: 1fr; }
+        }
+    </style>
+</head>
+<body>
+    <header>
+        <nav>
+            <div class="logo">{{icon}} {{business_name}}</div>
+            <ul class="nav-menu">
+                <li class="nav-item"><a href="#home">홈</a></li>
+                <li class="nav-item"><a href="#services">서비스</a></li>
+                <li class="nav-item"><a href="#booking">예약</a></li>
+                <li class="nav-item"><a href="#contact">연락처</a></li>
+            </ul>
+        </nav>
+    </header>
+
+    <section class="hero" id="home">
+        <div class="hero-content">
+            <h1>{{business_name}}</h1>
+            <p>{{keywords}}를 제공하는 전문 업체입니다</p>
+            <a href="#booking" class="cta-button">지금 예약하기</a>
+        </div>
+    </section>
+
+    <section class="services" id="services">
+        <div class="container">
+            <div class="section-title">
+                <h2>우리의 서비스</h2>
+                <p>고품질의 서비스를 제공합니다</p>
+            </div>
+            <div class="services-grid">{{service_cards}}
+            </div>
+        </div>
+    </section>
+
+    <section class="booking" id="booking">
+        <div class="container">
+            <div class="section-title">
+                <h2>예약하기</h2>
+                <p>간편하게 예약하실 수 있습니다</p>
+            </div>
+            <form class="booking-form" id="bookingForm">
+                <div class="form-grid">
+                    <div class="form-group">
+                        <label>이름</label>
+                        <input type="text" name="name" required placeholder="성함을 입력해주세요">
+                    </div>
+                    <div class="form-group">
+                        <label>연락처</label>
+                        <input type="tel" name="phone" required placeholder="연락처를 입력해주세요">
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>서비스</label>
+                    <select name="service" required>
+                        <option value="">선택해주세요</option>
+                        {{service_options}}
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label>희망 날짜</label>
+                    <input type="date" name="date" required>
+                </div>
+                <div class="form-group">
+                    <label>요청사항</label>
+                    <textarea name="message" rows="4" placeholder="특별한 요청사항이 있으시면 적어주세요"></textarea>
+                </div>
+                <button type="submit" class="cta-button" style="width: 100%;">예약 신청</button>
+            </form>
+        </div>
+    </section>
+
+    <section class="contact" id="contact">
+        <div class="container">
+            <div class="section-title">
+                <h2>연락처</h2>
+                <p>언제든지 문의해주세요</p>
+            </div>
+            <div class="contact-info">
+                <div class="contact-item">
+                    <h3>📞 전화번호</h3>
+                    <p>{{phone}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>📧 이메일</h3>
+                    <p>{{email}}</p>
+                </div>
+                <div class="contact-item">
+                    <h3>📍 주소</h3>
+                    <p>{{address}}</p>
+                </div>
+            </div>
+        </div>
+    </section>
+
+    <footer>
+        <div class="container">
+            <p>&copy; 2025 {{business_name}}. All rights reserved.</p>
+            <p style="margin-top: 10px; font-size: 0.9rem; opacity: 0.7;">🔧 Generated with Auto Website Generator</p>
+        </div>
+    </footer>
+
+    """ + BOOKING_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+
+        // 스무스 스크롤
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', function (e) {
+                e.preventDefault();
+                const target = document.querySelector(this.getAttribute('href'));
+                if (target) {
+                    target.scrollIntoView({ behavior: 'smooth', block: 'start' });
+                }
+            });
+        });
+
+        // 예약 폼 처리
+        document.getElementById('bookingForm').addEventListener('submit', function(e) {
+            e.preventDefault();
+
+            const formData = new FormData(this);
+            const bookingData = {
+                name: formData.get('name'),
+                phone: formData.get('phone'),
+                service: formData.get('service'),
+                date: formData.get('date'),
+                message: formData.get('message'),
+                status: '대기중',
+                orderId: Date.now(),
+                createdAt: new Date().toISOString()
+            };
+
+            const form = this;
+            bookingStore.add({ ...bookingData, id: Date.now() + Math.random() }).then(() => {
+                alert('예약이 접수되었습니다! 곧 연락드리겠습니다.');
+                form.reset();
+            }).catch(() => alert('예약을 전송하지 못했습니다. 잠시 후 다시 시도해 주세요.'));
+        });
+
+        // 오늘 날짜를 최소값으로 설정
+        document.querySelector('input[type="date"]').min = new Date().toISOString().split('T')[0];
+    </script>
+</body>
+</html>""")
+
+ADMIN_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{business_name}} - 관리자 페이지</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%); min-height: 100vh; color: #333; }
+        .login-container { max-width: 450px; margin: 100px auto; padding: 40px; background: white; border-radius: 15px; box-shadow: 0 15px 35px rgba(0,0,0,0.2); text-align: center; }
+        .login-container h2 { color: #2c3e50; margin-bottom: 30px; font-size: 1.8rem; }
+        .login-input { width: 100%; padding: 15px; margin: 10px 0; border: 2px solid #ddd; border-radius: 8px; font-size: 1rem; }
+        .login-btn { background: linear-gradient(135deg, #3498db 0%, #2980b9 100%); color: white; padding: 15px 30px; border: none; border-radius: 8px; font-size: 1.1rem; cursor: pointer; width: 100%; margin-top: 20px; }
+        .dashboard { display: none; max-width: 1400px; margin: 0 auto; padding: 20px; }
+        .dashboard-header { background: white; border-radius: 15px; padding: 25px; margin-bottom: 25px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); display: flex; justify-content: space-between; align-items: center; }
+        .logout-btn { background: #e74c3c; color: white; padding: 10px 20px; border: none; border-radius: 8px; cursor: pointer; }
+        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-bottom: 30px; }
+        .stat-card { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 15px; padding: 25px; text-align: center; }
+        .stat-card h3 { font-size: 2.5rem; margin-bottom: 10px; }
+        .management-card { background: white; border-radius: 15px; padding: 25px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); margin-bottom: 25px; }
+        .table-scroll { max-height: 70vh; overflow: auto; margin-top: 15px; }
+        .table-scroll th { position: sticky; top: 0; }
+        .table-scroll td { white-space: nowrap; }
+        .transfer { display: flex; flex-wrap: wrap; gap: 10px; align-items: center; margin-top: 15px; }
+        .transfer button, .transfer label { background: white; border: 1px solid #ccc; border-radius: 6px; padding: 8px 14px; cursor: pointer; font-size: 0.9rem; }
+        .transfer input { display: none; }
+        .data-table { width: 100%; border-collapse: collapse; }
+        .data-table th, .data-table td { padding: 12px; text-align: left; border-bottom: 1px solid #dee2e6; }
+        .data-table th { background: #f8f9fa; color: #2c3e50; font-weight: 600; }
+        .status-badge { padding: 5px 12px; border-radius: 20px; font-size: 0.85rem; font-weight: 600; }
+        .status-pending { background: #fff3cd; color: #856404; }
+        .status-completed { background: #d4edda; color: #155724; }
+    </style>
+</head>
+<body>
+    <div class="login-container" id="loginSection">
+        <h2>🔐 {{business_name}} 관리자</h2>
+        <input type="text" class="login-input" placeholder="관리자 아이디" id="username" value="admin">
+        <input type="password" class="login-input" placeholder="비밀번호" id="password" value="admin123">
+        <button class="login-btn" onclick="login()">로그인</button>
+        <p style="margin-top: 15px; font-size: 0.9rem; color: #95a5a6;">아이디: admin / 비밀번호: admin123</p>
+    </div>
+
+    <div class="dashboard" id="dashboard">
+        <div class="dashboard-header">
+            <h1>📊 {{business_name}} 관리자 대시보드</h1>
+            <button class="logout-btn" onclick="logout()">로그아웃</button>
+        </div>
+
+        <div class="stats-grid">
+            <div class="stat-card">
+                <h3 id="total-bookings">0</h3>
+                <p>총 예약</p>
+            </div>
+            <div class="stat-card">
+                <h3 id="pending-bookings">0</h3>
+                <p>대기 중인 예약</p>
+            </div>
+            <div class="stat-card">
+                <h3 id="completed-bookings">0</h3>
+                <p>완료된 예약</p>
+            </div>
+        </div>
+
+        <div class="stats-grid">
+            <div class="management-card">
+                <h3>📅 주별 예약</h3>
+                <div id="weekly-stats"></div>
+            </div>
+            <div class="management-card">
+                <h3>🗓️ 월별 예약</h3>
+                <div id="monthly-stats"></div>
+            </div>
+        </div>
+
+        <div class="management-card">
+            <h3>📋 예약 관리</h3>
+            <div class="transfer" id="transfer">
+                <button data-export="ndjson">NDJSON 내보내기</button>
+                <button data-export="csv">CSV 내보내기</button>
+                <label>NDJSON 가져오기 <input type="file" accept=".ndjson,.jsonl"></label>
+                <span data-transfer-status></span>
+            </div>
+            <div class="table-scroll">
+                <table class="data-table">
+                    <thead>
+                        <tr>
+                            <th>예약일</th>
+                            <th>고객명</th>
+                            <th>연락처</th>
+                            <th>서비스</th>
+                            <th>상태</th>
+                        </tr>
+                    </thead>
+                    <tbody id="bookings-table">
+                    </tbody>
+                </table>
+            </div>
+        </div>
+    </div>
+
+    """ + BOOKING_SCRIPT + """
+    """ + BOOKING_ADMIN_SCRIPT + """
+    """ + BOOKING_TABLE_SCRIPT + """
+    """ + BOOKING_TRANSFER_SCRIPT + """
+    <script>
+        const bookingStore = openBookingStore({{store_args}});
+        bindBookingTransfer(bookingStore, document.getElementById('transfer'), { imported: '가져온 예약', failed: '실패' });
+
+        function login() {
+            const username = document.getElementById('username').value;
+            const password = document.getElementById('password').value;
+            if (username === 'admin' && password === 'admin123') {
+                localStorage.setItem('adminLoggedIn', 'true');
+                document.getElementById('loginSection').style.display = 'none';
+                document.getElementById('dashboard').style.display = 'block';
+                loadBookings();
+            } else {
+                alert('❌ 아이디 또는 비밀번호가 올바르지 않습니다.');
+            }
+        }
+
+        function logout() {
+            localStorage.removeItem('adminLoggedIn');
+            document.getElementById('loginSection').style.display = 'block';
+            document.getElementById('dashboard').style.display = 'none';
+        }
+
+        function loadBookings() {
+            bookingTable.reload();
+        }
+
+        function renderStats(stats) {
+            document.getElementById('total-bookings').textContent = stats.total;
+            document.getElementById('pending-bookings').textContent = stats.statuses['대기중'] || 0;
+            document.getElementById('completed-bookings').textContent = stats.statuses['완료'] || 0;
+            showHistory(bookingStore, document.getElementById('weekly-stats'), document.getElementById('monthly-stats'));
+        }
+
+        function renderRow(booking) {
+            return `<tr>
+                <td>${escapeHtml(booking.date)}</td>
+                <td>${escapeHtml(booking.name)}</td>
+                <td>${escapeHtml(booking.phone)}</td>
+                <td>${escapeHtml(booking.service)}</td>
+                <td><span class="status-badge status-${booking.status === '대기중' ? 'pending' : 'completed'}">${escapeHtml(booking.status)}</span></td>
+            </tr>`;
+        }
+
+        // 로그인 상태 확인
+        if (localStorage.getItem('adminLoggedIn') === 'true') {
+            document.getElementById('loginSection').style.display = 'none';
+            document.getElementById('dashboard').style.display = 'block';
+        }
+
+        // 예약이 바뀔 때마다 다시 표시 (폴링 없음). 화면에 보이는 행만 그리고,
+        // 스크롤하면 다음 페이지를 불러옴
+        const bookingTable = openBookingTable(bookingStore, document.getElementById('bookings-table'), renderRow, renderStats);
+    </script>
+</body>
+</html>""")
+
+README_TEMPLATE = Template("""# {{business_name}} 웹사이트
+
+{{keywords}}를 제공하는 {{business_name}}의 공식 웹사이트입니다.
+
+## 기능
+- 반응형 웹 디자인
+- 예약 시스템
+- 관리자 페이지
+- 실시간 데이터 동기화
+
+## 실행 방법
+```bash
+npm install
+npm start
+```
+
+## 관리자 접속
+- URL: /admin.html
+- 아이디: admin
+- 비밀번호: admin123
+
+---
+🔧 Generated with Auto Website Generator
+""")
+
+
+PAGES = {'index.html': INDEX_TEMPLATE, 'admin.html': ADMIN_TEMPLATE}
+
+
+@lru_cache(maxsize=1024)
+def site_store_args(business_name):
+    """openBookingStore() 인자: 사이트 전용 저장소 키와 기존 공용 키에서 가져올 예약."""
+    # 이 페이지의 예약에는 업체명이 없고, 기존 관리자 페이지는 모든 예약을 표시했음
+    return store_args(f"{site_slug(business_name)}{FOLDER_SUFFIX}", 'bookings', business_name, unassigned=True)
+
+
+def generate_html_template(config, page=INDEX_TEMPLATE):
+    """HTML 템플릿을 생성합니다."""
+    colors = get_color_scheme(config['color'])
+    service_cards, service_options = render_services(tuple(config['services']))
+
+    # Color-dependent CSS is pre-rendered once per scheme
+    return page.bind(colors).render({
+        'business_name': config['business_name'],
+        'store_args': site_store_args(config['business_name']),
+        'keywords': ', '.join(config['keywords']),
+        'icon': config['icon'],
+        'service_cards': service_cards,
+        'service_options': service_options,
+        'phone': config['phone'],
+        'email': config['email'],
+        'address': config['address'],
+    })
+
+
+def generate_admin_template(config, page=ADMIN_TEMPLATE):
+    """관리자 페이지 템플릿을 생성합니다."""
+    return page.render({
+        'business_name': config['business_name'],
+        'store_args': site_store_args(config['business_name']),
+    })
+
+
+def render(config, slug, pages=PAGES):
+    """Return {filename: content} for one site."""
+    package_json = {
+        "name": slug,
+        "version": "1.0.0",
+        "description": f"{config['business_name']} 웹사이트",
+        "main": "index.html",
+        "scripts": {
+            "start": "npx live-server",
+            "deploy": "netlify deploy --prod"
+        },
+        "keywords": config['keywords'],
+        "author": config['business_name'],
+        "license": "MIT"
+    }
+
+    return {
+        'index.html': generate_html_template(config, pages['index.html']),
+        'admin.html': generate_admin_template(config, pages['admin.html']),
+        'package.json': json.dumps(package_json, indent=2, ensure_ascii=False),
+        'README.md': README_TEMPLATE.render({
+            'business_name': config['business_name'],
+            'keywords': ', '.join(config['keywords']),
+        }),
+    }
@@ -0,0 +1,269 @@
+"""
+HTML / CSS / JS minification stage
+
+Conservative minifiers for the generated pages: comments and indentation
+go, rendering and behaviour stay the same.
+
+- CSS: comments and whitespace around { } ; : , > are removed
+- JS: comments, indentation and blank lines are removed; line breaks are
+  kept (no reliance on semicolons), strings, template literals (nested
+  ones included) and regex literals are left untouched
+- HTML: <style> and <script> bodies go through the CSS / JS minifiers,
+  whitespace runs collapse to one space (newline) and whitespace next to
+  block-level tags is dropped; <pre> and <textarea> are kept as-is
+
+Style and script blocks are memoized by content. Most of them are the
+static part of a template (or one of a handful of color variants), so
+across a bulk run each distinct block is minified once per worker; a new
+template version simply produces new keys.
+
+    files = minify_files({'index.html': html, 'admin.html': admin})
+"""
+
+import re
+from functools import lru_cache
+
+BLOCK_TAGS = frozenset("""
+    html head body title meta link style script base
+    div section header footer nav main article aside
+    h1 h2 h3 h4 h5 h6 p ul ol li dl dt dd form fieldset legend
+    table thead tbody tfoot tr th td caption hr br option select
+""".split())
+
+# Raw elements (kept whole), comments and tags, in document order
+_TOKEN = re.compile(r'<(style|script|pre|textarea)\b[^>]*>.*?</\1\s*>|<!--.*?-->|<[^>]+>', re.I | re.S)
+_RAW_ELEMENT = re.compile(r'(<([a-zA-Z]+)[^>]*>)(.*)(</[^>]+>)$', re.S)
+_TAG_NAME = re.compile(r'</?([a-zA-Z0-9]+)')
+_SPACE = re.compile(r'\s+')
+_CSS_PUNCT = re.compile(r'\s*([{};,>])\s*')
+_CSS_COLON = re.compile(r':\s+')
+_JS_SPACE = re.compile(r'[ \t]{2,}')
+# A '/' after one of these (or at the start) begins a regex literal, not a division
+_REGEX_PREFIX = re.compile(r'(?:^|[(,=:\[!&|?{};+\-*%<>~^]|\b(?:return|typeof|case|do|else|in|of|void|delete|new|throw|yield|await))\s*$')
+
+
+def _split_strings(code, quotes):
+    """Yield (is_literal, text) pieces with comments removed.
+
+    Quoted strings (and, in JS, regex literals) are literals and come
+    back verbatim. A block comment becomes one space and a line comment
+    (JS only) disappears, so code on both sides of a comment arrives as
+    a single piece.
+    """
+    js = '`' in quotes
+    buffer = []
+    start = i = 0
+    n = len(code)
+    while i < n:
+        c = code[i]
+        if c in quotes:
+            buffer.append(code[start:i])
+            if any(buffer):
+                yield False, ''.join(buffer)
+            buffer = []
+            j = _template_end(code, i) if c == '`' else _quoted_end(code, i)
+            yield True, code[i:j]
+            start = i = j
+        elif code.startswith('/*', i):
+            buffer.append(code[start:i] + ' ')
+            end = code.find('*/', i + 2)
+            start = i = n if end < 0 else end + 2
+        elif code.startswith('//', i) and js and (i == 0 or code[i - 1] != ':'):
+            # JS line comment ('://' is left alone for URLs in code)
+            buffer.append(code[start:i])
+            end = code.find('\n', i)
+            start = i = n if end < 0 else end
+        elif c == '/' and js and _starts_regex(buffer, code[start:i]):
+            buffer.append(code[start:i])
+            if any(buffer):
+                yield False, ''.join(buffer)
+            buffer = []
+            j = _regex_end(code, i)
+            yield True, code[i:j]
+            start = i = j
+        else:
+            i += 1
+    buffer.append(code[start:])
+    if any(buffer):
+        yield False, ''.join(buffer)
+
+
+def _quoted_end(code, i):
+    """Index just past the quoted string that starts at code[i]."""
+    n = len(code)
+    j = i + 1
+    while j < n and code[j] != code[i]:
+        j += 2 if code[j] == '\\' else 1
+    return j + 1
+
+
+def _template_end(code, i):
+    """Index just past the template literal at code[i], nested ${`...`} included."""
+    n = len(code)
+    j = i + 1
+    while j < n:
+        c = code[j]
+        if c == '\\':
+            j += 2
+        elif c == '`':
+            return j + 1
+        elif code.startswith('${', j):
+            j = _substitution_end(code, j + 2)
+        else:
+            j += 1
+    return n
+
+
+def _substitution_end(code, j):
+    """Index just past the '}' closing a ${ substitution whose body starts at code[j]."""
+    n = len(code)
+    depth = 0
+    while j < n:
+        c = code[j]
+        if c in '"\'':
+            j = _quoted_end(code, j)
+            continue
+        if c == '`':
+            j = _template_end(code, j)
+            continue
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            if not depth:
+                return j + 1
+            depth -= 1
+        j += 1
+    return n
+
+
+def _starts_regex(buffer, pending):
+    """Whether a '/' that follows the code read so far begins a regex literal."""
+    before = pending[-32:].rstrip() or (''.join(buffer) + pending).rstrip()[-32:]
+    return bool(_REGEX_PREFIX.search(before))
+
+
+def _regex_end(code, i):
+    """Index just past the regex literal (flags included) that starts at code[i]."""
+    n = len(code)
+    j = i + 1
+    in_class = False
+    while j < n and code[j] != '\n':
+        c = code[j]
+        if c == '\\':
+            j += 2
+            continue
+        if c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            j += 1
+            while j < n and (code[j].isalnum() or code[j] == '_'):
+                j += 1
+            return j
+        j += 1
+    return j
+
+
+@lru_cache(maxsize=1024)
+def minify_css(css):
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    out = []
+    for literal, text in _split_strings(css, '"\''):
+        if literal:
+            out.append(text)
+        else:
+            text = _SPACE.sub(' ', text)
+            text = _CSS_PUNCT.sub(r'\1', text)
+            out.append(_CSS_COLON.sub(':', text))
+    return ''.join(out).replace(';}', '}').strip()
+
+
+@lru_cache(maxsize=1024)
+def minify_js(js):
+    """Strip comments, indentation and blank lines from a script."""
+    out = []
+    for literal, text in _split_strings(js, '"\'`'):
+        if literal:
+            out.append(text)
+        else:
+            at_line_start = not out or out[-1].endswith('\n')
+            lines = text.split('\n')
+            kept = []
+            for k, line in enumerate(lines):
+                if k or at_line_start:
+                    line = line.lstrip()
+                if k < len(lines) - 1:
+                    line = line.rstrip()
+                    if not line and (k or at_line_start):
+                        continue
+                kept.append(_JS_SPACE.sub(' ', line))
+            out.append('\n'.join(kept))
+    return ''.join(out).strip()
+
+
+def _is_block(token):
+    match = _TAG_NAME.match(token)
+    return not match or match.group(1).lower() in BLOCK_TAGS
+
+
+def _minify_raw(token):
+    """Minify the body of a <style> / <script>; <pre> / <textarea> stay verbatim."""
+    open_tag, name, body, close_tag = _RAW_ELEMENT.match(token).groups()
+    name = name.lower()
+    if name == 'style':
+        body = minify_css(body)
+    elif name == 'script' and 'src=' not in open_tag:
+        body = minify_js(body)
+    return open_tag + body + close_tag
+
+
+def minify_html(html):
+    """Minify a page, including its inline <style> and <script> blocks."""
+    # pieces alternate text, token, text, ..., text
+    pieces = []
+    raw = set()
+    last = 0
+    for match in _TOKEN.finditer(html):
+        pieces.append(html[last:match.start()])
+        if match.group(1):
+            raw.add(len(pieces))
+        pieces.append(match.group())
+        last = match.end()
+    pieces.append(html[last:])
+
+    out = []
+    for i, piece in enumerate(pieces):
+        if i % 2:
+            if piece.startswith('<!--') and not piece.startswith('<!--['):
+                continue
+            out.append(_minify_raw(piece) if i in raw else piece)
+            continue
+        before_block = i == 0 or _is_block(pieces[i - 1])
+        after_block = i == len(pieces) - 1 or _is_block(pieces[i + 1])
+        if before_block:
+            piece = piece.lstrip()
+        if after_block:
+            piece = piece.rstrip()
+        out.append(_SPACE.sub(_collapse, piece))
+    return ''.join(out)
+
+
+def _collapse(match):
+    return '\n' if '\n' in match.group() else ' '
+
+
+MINIFIERS = {
+    '.html': minify_html,
+    '.css': minify_css,
+    '.js': minify_js,
+}
+
+
+def minify_files(files):
+    """Minify every HTML / CSS / JS file of a bundle; other files pass through."""
+    minified = {}
+    for name, content in files.items():
+        minifier = MINIFIERS.get(name[name.rfind('.'):].lower()) if '.' in name else None
+        minified[name] = minifier(content) if minifier else content
+    return minified
@@ -0,0 +1,8 @@
+"""
+Site folder naming
+"""
+
+
+def site_slug(name):
+    """Folder-safe slug for a business name ('Happy Cafe' -> 'happy-cafe')."""
+    return name.replace(' ', '-').replace(',', '').replace('/', '-').lower()
@@ -0,0 +1,132 @@
+"""
+Site render pipeline
+
+One path from business config to files on disk, shared by every generator
+script:
+
+    config -> full_config -> generator.render -> {filename: content}
+           -> output stages (assets, minify, compress) -> bundle writer
+
+Usage:
+    from sitegen.pipeline import build_site
+
+    folder = build_site({'business_name': 'Happy Cafe', 'type': 'restaurant'}, 'v2')
+"""
+
+import importlib
+from pathlib import Path
+
+from . import booking_client
+from .cache import MANIFEST_NAME, BuildCache
+from .config import full_config
+from .naming import site_slug
+from .writer import write_bundle
+
+# Generator name -> module in sitegen.generators
+GENERATORS = {
+    'auto': 'auto',
+    'simple': 'simple',
+    'custom': 'custom',
+    'maker': 'maker',
+    'v2': 'v2',
+    'v2-ko': 'v2_ko',
+    'demo': 'demo',
+}
+
+
+def load_generator(name):
+    """Import a generator module on first use (keeps CLI start-up cheap)."""
+    if name not in GENERATORS:
+        raise ValueError(f"Unknown generator '{name}' (choose from {', '.join(GENERATORS)})")
+    return importlib.import_module(f'.generators.{GENERATORS[name]}', __package__)
+
+
+def prepare(config, generator):
+    """Return (generator module, full config, slug) for one site."""
+    module = load_generator(generator)
+    config = full_config(config, getattr(module, 'PRESETS', None))
+    return module, config, site_slug(config['business_name'])
+
+
+def render_site(config, generator):
+    """Render every file of one site in memory: {filename: content}."""
+    module, config, slug = prepare(config, generator)
+    return module.render(config, slug)
+
+
+def render_files(module, config, slug, options=None):
+    """Render one site with the selected output options: {filename: content}.
+
+    options is a dict of flags: {'minify': True, 'assets': True,
+    'asset_url': 'https://cdn.example.com/assets/', 'compress': True,
+    'backend': 'http://localhost:8080'}.
+    """
+    if not options:
+        return module.render(config, slug)
+
+    if options.get('assets'):
+        from .assets import asset_pages
+        pages, assets = asset_pages(module)
+        files = module.render(config, slug, pages)
+        files.update(assets)
+    else:
+        files = module.render(config, slug)
+
+    if options.get('backend'):
+        # Tenant on the booking server = site folder name
+        files = booking_client.wire_backend(files, options['backend'], f"{slug}{module.FOLDER_SUFFIX}")
+    if options.get('minify'):
+        from .minify import minify_files
+        files = minify_files(files)
+    if options.get('assets'):
+        # Fingerprint last so the hash covers the final bytes
+        from .assets import fingerprint_assets
+        files = fingerprint_assets(files, options.get('asset_url'))
+    if options.get('compress'):
+        from .compress import add_sidecars
+        files = add_sidecars(files)
+    return files
+
+
+def render_bundle(config, generator, output_dir=None, options=None):
+    """Render one site in memory: (folder name, {filename: content})."""
+    module, config, slug = prepare(config, generator)
+    folder = (Path(output_dir or '.') / f"{slug}{module.FOLDER_SUFFIX}").as_posix()
+    return folder, render_files(module, config, slug, options)
+
+
+def build_site(config, generator, incremental=False, output_dir=None, writer=None, options=None,
+               sizes=None):
+    """Render one site and write its folder atomically; return the folder path.
+
+    With incremental set, a site whose config and templates are unchanged
+    since the last build is neither rendered nor written. A BundleWriter
+    may be passed to share one sync across many sites; options selects
+    the output stages (see render_files). A sizes dict, if given, is
+    filled with the raw vs compressed byte counts of the written bundle.
+    """
+    module, config, slug = prepare(config, generator)
+    folder = Path(output_dir or '.') / f"{slug}{module.FOLDER_SUFFIX}"
+
+    cache = BuildCache(folder, config, module.__file__, options)
+    if incremental and cache.is_fresh():
+        return folder
+
+    files = render_files(module, config, slug, options)
+    if sizes is not None:
+        from .compress import size_report
+        sizes.update(size_report(files))
+    files[MANIFEST_NAME] = cache.manifest(files)
+    if writer is None:
+        return write_bundle(folder, files)
+    return writer.write(folder, files)
+
+
+def build_archive(configs, generator, archive, options=None):
+    """Stream every site into one .zip / .tar.gz archive and return its path."""
+    from .archive import ArchiveWriter
+
+    with ArchiveWriter(archive) as writer:
+        for config in configs:
+            writer.write(*render_bundle(config, generator, options=options))
+    return writer.path
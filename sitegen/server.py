@@ -0,0 +1,664 @@
+"""
+Booking server
+
+Optional backend for the generated sites: a small asyncio HTTP server
+with a JSON API for the booking forms and admin panels. Standard library
+only, so it runs offline next to the site folders. Sites built with
+--backend URL talk to it instead of the browser's localStorage.
+
+One process serves every site. The tenant is the site folder name that
+the generators compute ('happy-cafe-website'), and each tenant sees only
+its own bookings:
+
+    GET   /sites/<site>/api/bookings          -> {"bookings": [...]}
+          ?status=pending&date=2026-01-15     (optional filters)
+          ?limit=200&after=<id>               (one page: {"bookings", "next"};
+                                               "next" is the `after` of the
+                                               following page, null at the end)
+    POST  /sites/<site>/api/bookings          -> 201, the stored booking
+    PATCH /sites/<site>/api/bookings/<id>     -> the updated booking
+    GET   /sites/<site>/api/stats             -> {"total", "today", "statuses"}
+          ?since=<ISO time of local midnight> (start of "today", default UTC)
+    GET   /sites/<site>/api/stats/history     -> {"by", "periods": [{"period",
+          ?by=day|week|month&since=2026-01-01    "total", "statuses"}, ...]}
+                                              (UTC days; weeks start on Monday)
+    GET   /sites/<site>/api/events            -> text/event-stream, one
+          "data: <booking JSON>" message per created / updated booking
+          ("data: null" after an import: reload everything)
+    GET   /sites/<site>/api/export            -> every booking, streamed
+          ?format=ndjson|csv                  (chunked, a page at a time)
+    POST  /sites/<site>/api/import            -> {"imported": n}; the body
+          is NDJSON, one exported booking per line (new ids, same createdAt).
+          Bodies are capped at 64 KB: send large backups in batches.
+
+(/api/bookings without the /sites/<site> prefix is the default tenant,
+for sites built before tenant routing.)
+
+Only the booking form's POST /api/bookings is public, and without the
+admin token it can only create a pending booking (any other status is
+replaced by the store's 'pending'). Every other request is the admin
+panel's and needs the admin token, sent as "Authorization: Bearer
+<token>" or, where a browser cannot set headers (EventSource, download
+links), as ?token=<token>; without it the answer is 401. The token comes
+from --admin-token or SITEGEN_ADMIN_TOKEN; if neither is set a random
+one is made and printed at startup. Errors other than bad input (a
+failing store, say) are answered with 500 and logged to stderr.
+
+Exports never hold a tenant's bookings in memory: they are read EXPORT_PAGE
+at a time by id cursor and each page is written as one chunk of a
+chunked response before the next is read.
+
+Every connection is a coroutine on one event loop (no thread per
+request) and stays open for further requests (HTTP/1.1 keep-alive), so a
+single node handles thousands of concurrent clients. Each tenant has its
+own token bucket; a tenant over its rate gets 429 without slowing down
+the others. Rate buckets are kept for the MAX_TENANTS most recently
+seen tenants, and --site limits the server to a list of known tenants
+(any other /sites/<name>/ is 404 and never gets a bucket or a store
+partition). Any origin may submit a booking (pages opened from disk or
+another host), but the admin API answers cross-origin requests only
+from the --cors-origin origins ("null" for admin pages opened from
+disk). Admin panels keep one event stream open instead of polling the
+booking list.
+
+Bookings are stored in SQLite (see booking_store); a *.jsonl --data
+file selects the in-memory store with a JSON Lines log instead.
+
+Usage:
+python -m sitegen.server --port 8080 --data bookings.db --rate 20 --burst 40 \\
+    --admin-token SECRET --cors-origin https://admin.example.com
+"""
+
+import argparse
+import asyncio
+import csv
+import hmac
+import io
+import json
+import os
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from urllib.parse import parse_qs, quote, unquote
+
+from .booking_store import FIELDS, PENDING_STATUSES, open_store
+
+API_ROOT = '/api'
+API_PATH = '/api/bookings'
+STATS_PATH = '/api/stats'
+HISTORY_PATH = '/api/stats/history'
+EVENTS_PATH = '/api/events'
+EXPORT_PATH = '/api/export'
+IMPORT_PATH = '/api/import'
+SITE_PREFIX = '/sites/'
+MAX_BODY = 64 * 1024
+MAX_HEADERS = 100
+REQUEST_TIMEOUT = 30  # seconds to receive a whole request
+KEEPALIVE_TIMEOUT = 15  # seconds an idle connection stays open
+HEARTBEAT = 15  # seconds between keep-alive comments on an idle event stream
+MAX_LISTENERS = 256  # open event streams per site
+MAX_PAGE = 1000  # bookings per page of a paged list
+EXPORT_PAGE = 500  # bookings read and sent per chunk of an export
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+EXPORT_COLUMNS = ('id', 'createdAt') + FIELDS
+BACKLOG = 4096
+MAX_TENANTS = 10000  # rate buckets kept, least recently seen tenant dropped first
+TOKEN_ENV = 'SITEGEN_ADMIN_TOKEN'
+
+# The booking form: any page may POST a booking
+PUBLIC_CORS = (
+    'Access-Control-Allow-Origin: *\r\n'
+    'Access-Control-Allow-Methods: POST, OPTIONS\r\n'
+    'Access-Control-Allow-Headers: Content-Type\r\n'
+)
+# The admin API, for the configured origins only
+ADMIN_CORS = (
+    'Access-Control-Allow-Origin: {origin}\r\n'
+    'Vary: Origin\r\n'
+    'Access-Control-Allow-Methods: GET, POST, PATCH, OPTIONS\r\n'
+    'Access-Control-Allow-Headers: Content-Type, Authorization\r\n'
+)
+
+
+class HTTPError(Exception):
+    """Error answered with a JSON {"error": ...} body."""
+
+    def __init__(self, status, message=None, headers=None):
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.headers = headers or {}
+
+
+class RateLimiter:
+    """Token bucket per tenant: rate requests/second with bursts up to burst.
+
+    At most max_tenants buckets are kept; the least recently used one is
+    dropped first (an idle bucket refills to burst anyway).
+    """
+
+    def __init__(self, rate, burst=None, max_tenants=MAX_TENANTS):
+        self.rate = rate
+        self.burst = burst or max(rate * 2, 1)
+        self.max_tenants = max_tenants
+        self.buckets = OrderedDict()  # tenant -> [tokens, last refill], least recent first
+
+    def check(self, tenant):
+        """Take one token for tenant; raise 429 when the bucket is empty."""
+        if not self.rate:
+            return
+        now = time.monotonic()
+        bucket = self.buckets.get(tenant)
+        if bucket is None:
+            bucket = self.buckets[tenant] = [self.burst, now]
+            if len(self.buckets) > self.max_tenants:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(tenant)
+        tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            retry = max(1, int((1 - tokens) / self.rate + 0.999))
+            raise HTTPError(HTTPStatus.TOO_MANY_REQUESTS, "rate limit exceeded", {'Retry-After': retry})
+        bucket[0] = tokens - 1
+
+
+async def read_request(reader):
+    """Read one request: (method, target, headers, body), or None if the client went away."""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, version = line.decode('latin-1').split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "malformed request line")
+
+    headers = {'_version': version.upper()}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        if len(headers) > MAX_HEADERS:
+            raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if 'transfer-encoding' in headers:
+        raise HTTPError(HTTPStatus.LENGTH_REQUIRED)
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    body = await reader.readexactly(length) if length > 0 else b''
+    return method.upper(), target, headers, body
+
+
+def wants_keep_alive(headers):
+    """HTTP/1.1 keeps the connection unless told otherwise; HTTP/1.0 only when asked."""
+    connection = headers.get('connection', '').lower()
+    if headers['_version'] == 'HTTP/1.0':
+        return connection == 'keep-alive'
+    return connection != 'close'
+
+
+def encode_response(status, payload=None, keep_alive=False, headers=None, cors=''):
+    """Serialize a response with a JSON body (no body for None)."""
+    body = b'' if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    extra = ''.join(f'{name}: {value}\r\n' for name, value in (headers or {}).items())
+    head = (
+        f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+        'Content-Type: application/json; charset=utf-8\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        'Cache-Control: no-store\r\n'
+        f'{cors}{extra}'
+        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+        '\r\n'
+    )
+    return head.encode('latin-1') + body
+
+
+def encode_event_stream_head(cors=''):
+    head = (
+        'HTTP/1.1 200 OK\r\n'
+        'Content-Type: text/event-stream\r\n'
+        'Cache-Control: no-cache\r\n'
+        f'{cors}'
+        '\r\n'
+    )
+    # Browsers reconnect after `retry` ms when the stream drops
+    return head.encode('latin-1') + b'retry: 3000\n\n'
+
+
+def encode_stream_head(content_type, keep_alive, headers=None, cors=''):
+    """Head of a chunked 200 response; the body follows as encode_chunk() pieces."""
+    extra = ''.join(f'{name}: {value}\r\n' for name, value in (headers or {}).items())
+    head = (
+        'HTTP/1.1 200 OK\r\n'
+        f'Content-Type: {content_type}; charset=utf-8\r\n'
+        'Transfer-Encoding: chunked\r\n'
+        'Cache-Control: no-store\r\n'
+        f'{cors}{extra}'
+        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+        '\r\n'
+    )
+    return head.encode('latin-1')
+
+
+def encode_chunk(data):
+    """One chunk of a chunked body; b'' encodes the final, empty chunk."""
+    return f'{len(data):x}\r\n'.encode('latin-1') + data + b'\r\n'
+
+
+def encode_page(bookings, fmt, header=False):
+    """A page of bookings as NDJSON lines or CSV rows (with the header row if asked)."""
+    if fmt == 'ndjson':
+        return ''.join(json.dumps(b, ensure_ascii=False) + '\n' for b in bookings).encode('utf-8')
+    out = io.StringIO()
+    writer = csv.writer(out)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows([b.get(column, '') for column in EXPORT_COLUMNS] for b in bookings)
+    return out.getvalue().encode('utf-8')
+
+
+def parse_ndjson(body):
+    """Objects of an NDJSON request body; blank lines are skipped."""
+    try:
+        text = body.decode('utf-8')
+    except UnicodeDecodeError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "body is not UTF-8")
+    items = []
+    for number, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            items.append(json.loads(line))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"line {number} is not valid JSON")
+    return items
+
+
+class Export:
+    """Result of an export request: the bookings follow as a chunked stream."""
+
+    def __init__(self, tenant, fmt):
+        self.tenant = tenant
+        self.format = fmt
+        self.started = False  # the response head is sent: too late for an error status
+
+
+class EventStream:
+    """Result of an events request: the connection becomes the tenant's event stream."""
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+
+def split_tenant(path):
+    """'/sites/<site>/api/bookings/7' -> ('<site>', '/api/bookings/7'); no prefix -> ('', path)."""
+    if not path.startswith(SITE_PREFIX):
+        return '', path
+    site, slash, rest = path[len(SITE_PREFIX):].partition('/')
+    site = unquote(site)
+    if not site or not slash:
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+    return site, '/' + rest
+
+
+def public_booking(data):
+    """A booking sent without the admin token: its status can only be a pending one."""
+    if isinstance(data, dict) and data.get('status') not in PENDING_STATUSES:
+        data = {name: value for name, value in data.items() if name != 'status'}  # the store's default
+    return data
+
+
+def is_public(method, path):
+    """Whether a request is the booking form's: POST to the bookings collection."""
+    return method == 'POST' and path.rstrip('/') == API_PATH
+
+
+class BookingAPI:
+    """Routes API requests to the tenant's partition of a BookingStore.
+
+    admin_token guards every request but a booking POST (None: the admin
+    API is closed). cors_origins are the origins whose pages may call the
+    admin API ('*' for any); sites, if given, are the only tenants served.
+    """
+
+    def __init__(self, store, limiter=None, admin_token=None, cors_origins=(), sites=None):
+        self.store = store
+        self.limiter = limiter or RateLimiter(0)
+        self.admin_token = admin_token
+        self.cors_origins = frozenset(cors_origins)
+        self.sites = None if sites is None else frozenset(sites)
+        self.listeners = {}  # tenant -> set of asyncio.Queue, one per open event stream
+
+    def handle(self, method, target, body, headers=None):
+        """Return (status, payload) for one request."""
+        if method == 'OPTIONS':
+            return HTTPStatus.NO_CONTENT, None
+        path, _, query = target.partition('?')
+        tenant, path = split_tenant(path)
+        if not path.startswith(API_ROOT + '/') or (self.sites is not None and tenant not in self.sites):
+            raise HTTPError(HTTPStatus.NOT_FOUND)
+        self.limiter.check(tenant)
+        params = {name: values[-1] for name, values in parse_qs(query).items()}
+        if not is_public(method, path):
+            self.authorize(headers or {}, params)
+
+        if path.rstrip('/') == STATS_PATH:
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, self.store.stats(tenant, params.get('since'))
+
+        if path.rstrip('/') == HISTORY_PATH:
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            by = params.get('by', 'day')
+            try:
+                periods = self.store.history(tenant, by, params.get('since'))
+            except ValueError as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+            return HTTPStatus.OK, {'by': by, 'periods': periods}
+
+        if path.rstrip('/') == EVENTS_PATH:
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            if len(self.listeners.get(tenant, ())) >= MAX_LISTENERS:
+                raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "too many open event streams")
+            return HTTPStatus.OK, EventStream(tenant)
+
+        if path.rstrip('/') == EXPORT_PATH:
+            if method != 'GET':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            fmt = params.get('format', 'ndjson')
+            if fmt not in EXPORT_FORMATS:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"format must be one of {', '.join(EXPORT_FORMATS)}")
+            return HTTPStatus.OK, Export(tenant, fmt)
+
+        if path.rstrip('/') == IMPORT_PATH:
+            if method != 'POST':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            imported = self.store.import_bookings(tenant, parse_ndjson(body))
+            if imported:
+                self.notify(tenant, None)
+            return HTTPStatus.OK, {'imported': imported}
+
+        if path == API_PATH or path == API_PATH + '/':
+            if method == 'GET':
+                if 'limit' not in params and 'after' not in params:
+                    return HTTPStatus.OK, {'bookings': self.store.list(tenant, params.get('status'), params.get('date'))}
+                return HTTPStatus.OK, self.page(tenant, params)
+            if method == 'POST':
+                data = self._json(body)
+                if not self.is_admin(headers or {}, params):
+                    data = public_booking(data)
+                booking = self.store.create(tenant, data)
+                self.notify(tenant, booking)
+                return HTTPStatus.CREATED, booking
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        if path.startswith(API_PATH + '/'):
+            booking_id = self._booking_id(path[len(API_PATH) + 1:])
+            if method == 'GET':
+                booking = self.store.get(tenant, booking_id)
+            elif method == 'PATCH':
+                booking = self.store.update(tenant, booking_id, self._json(body))
+                if booking is not None:
+                    self.notify(tenant, booking)
+            else:
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+            if booking is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"no booking {booking_id}")
+            return HTTPStatus.OK, booking
+
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    def is_admin(self, headers, params):
+        """Whether the request carries the admin token."""
+        scheme, _, token = headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'bearer':
+            token = params.get('token', '')
+        return bool(self.admin_token) and hmac.compare_digest(token.encode(), self.admin_token.encode())
+
+    def authorize(self, headers, params):
+        """Raise 401 unless the request carries the admin token."""
+        if not self.is_admin(headers, params):
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "admin token required", {'WWW-Authenticate': 'Bearer'})
+
+    def cors(self, method, target, headers):
+        """CORS headers of the answer to a request (a preflight asks about its real method)."""
+        if method == 'OPTIONS':
+            method = headers.get('access-control-request-method', '').upper()
+        try:
+            _, path = split_tenant(target.partition('?')[0])
+        except HTTPError:
+            return ''
+        if is_public(method, path):
+            return PUBLIC_CORS
+        origin = headers.get('origin')
+        if origin and (origin in self.cors_origins or '*' in self.cors_origins):
+            return ADMIN_CORS.format(origin=origin)
+        return ''
+
+    def page(self, tenant, params):
+        """One page of a tenant's bookings, keyed by the last id of the previous page."""
+        limit = self._int_param(params, 'limit', MAX_PAGE)
+        after = self._int_param(params, 'after', 0)
+        if not 1 <= limit <= MAX_PAGE or after < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"limit must be 1-{MAX_PAGE} and after a booking id")
+        # One extra row tells whether another page follows
+        bookings = self.store.list(tenant, params.get('status'), params.get('date'), after=after, limit=limit + 1)
+        more = len(bookings) > limit
+        bookings = bookings[:limit]
+        return {'bookings': bookings, 'next': bookings[-1]['id'] if more else None}
+
+    async def stream_export(self, export, writer, keep_alive, cors=''):
+        """Send every booking of a tenant, one page per chunk, oldest first."""
+        name = quote(f"{export.tenant or 'bookings'}.{export.format}", safe='')
+        # The first page is read before the head, so a store error there is still a 500
+        bookings = self.store.list(export.tenant, after=0, limit=EXPORT_PAGE)
+        writer.write(encode_stream_head(EXPORT_FORMATS[export.format], keep_alive,
+                                        {'Content-Disposition': f"attachment; filename*=UTF-8''{name}"}, cors))
+        export.started = True
+        after = 0
+        while True:
+            data = encode_page(bookings, export.format, header=after == 0)
+            if data:  # an empty chunk would end the body
+                writer.write(encode_chunk(data))
+                # Waits while the client is slow to read: at most a page or two is buffered
+                await writer.drain()
+            if len(bookings) < EXPORT_PAGE:
+                break
+            after = bookings[-1]['id']
+            bookings = self.store.list(export.tenant, after=after, limit=EXPORT_PAGE)
+        writer.write(encode_chunk(b''))
+        await writer.drain()
+
+    def notify(self, tenant, booking):
+        """Tell the tenant's open event streams that a booking changed (None: reload everything)."""
+        # The whole booking, so a paged admin table can patch its row without asking for it
+        message = json.dumps(booking, ensure_ascii=False)
+        for queue in self.listeners.get(tenant, ()):
+            if not queue.full():  # a stream that is far behind refetches everything anyway
+                queue.put_nowait(message)
+
+    async def stream_events(self, tenant, reader, writer, cors=''):
+        """Send change events to one client until it disconnects."""
+        queue = asyncio.Queue(maxsize=64)
+        listeners = self.listeners.setdefault(tenant, set())
+        listeners.add(queue)
+        closed = asyncio.ensure_future(reader.read(1024))  # completes when the client goes away
+        try:
+            writer.write(encode_event_stream_head(cors))
+            await writer.drain()
+            while True:
+                message = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait((message, closed), timeout=HEARTBEAT,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if closed in done:
+                    message.cancel()
+                    return
+                if message in done:
+                    writer.write(f'data: {message.result()}\n\n'.encode('utf-8'))
+                else:
+                    message.cancel()
+                    writer.write(b': ping\n\n')
+                await writer.drain()
+        finally:
+            closed.cancel()
+            listeners.discard(queue)
+            if not listeners:
+                self.listeners.pop(tenant, None)
+
+    @staticmethod
+    def _json(body):
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "body is not valid JSON")
+
+    @staticmethod
+    def _int_param(params, name, default):
+        try:
+            return int(params.get(name, default))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"'{name}' must be a number")
+
+    @staticmethod
+    def _booking_id(text):
+        try:
+            return int(text.strip('/'))
+        except ValueError:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"no booking {text}")
+
+
+def make_handler(api):
+    """Connection callback for asyncio.start_server: serve requests until the client is done."""
+
+    async def handle_connection(reader, writer):
+        timeout = REQUEST_TIMEOUT
+        try:
+            while True:
+                headers = {}
+                cors = ''
+                request = payload = None
+                try:
+                    request = await asyncio.wait_for(read_request(reader), timeout)
+                    if request is None:
+                        return
+                    method, target, headers, body = request
+                    cors = api.cors(method, target, headers)
+                    status, payload = api.handle(method, target, body, headers)
+                    extra = None
+                    if isinstance(payload, EventStream):
+                        await api.stream_events(payload.tenant, reader, writer, cors)
+                        return
+                    if isinstance(payload, Export):
+                        keep_alive = wants_keep_alive(headers)
+                        await api.stream_export(payload, writer, keep_alive, cors)
+                        if not keep_alive:
+                            return
+                        timeout = KEEPALIVE_TIMEOUT
+                        continue
+                except HTTPError as e:
+                    status, payload, extra = e.status, {'error': str(e)}, e.headers
+                except ValueError as e:
+                    # Validation errors from the store
+                    status, payload, extra = HTTPStatus.BAD_REQUEST, {'error': str(e)}, None
+                except Exception as e:
+                    # Anything else is the server's fault (e.g. sqlite3.OperationalError from the store)
+                    where = f"{request[0]} {request[1]}" if request else "request"
+                    print(f"Error in {where}: {type(e).__name__}: {e}", file=sys.stderr)
+                    if isinstance(payload, Export) and payload.started:
+                        return  # the body is cut short: the client sees an incomplete chunked response
+                    status, payload, extra = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "internal server error"}, None
+
+                # Parse errors leave the stream in an unknown state: close after answering
+                keep_alive = bool(headers) and wants_keep_alive(headers)
+                writer.write(encode_response(status, payload, keep_alive, extra, cors))
+                await writer.drain()
+                if not keep_alive:
+                    return
+                timeout = KEEPALIVE_TIMEOUT
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def serve(store, host='127.0.0.1', port=8080, ready=None, rate=0, burst=None,
+                admin_token=None, cors_origins=(), sites=None):
+    """Serve the booking API until cancelled."""
+    api = BookingAPI(store, RateLimiter(rate, burst), admin_token, cors_origins, sites)
+    server = await asyncio.start_server(make_handler(api), host, port, backlog=BACKLOG)
+    if ready is not None:
+        ready(server)
+    async with server:
+        await server.serve_forever()
+
+
+def raise_open_file_limit():
+    """Allow as many open sockets as the hard limit permits (POSIX only)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or hard > soft:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Booking server for the generated websites")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', '-p', type=int, default=8080, help="port to listen on (default: 8080)")
+    parser.add_argument('--data', '-d', default='bookings.db',
+                        help="SQLite database, or a .jsonl log for the in-memory store (default: bookings.db)")
+    parser.add_argument('--rate', type=float, default=20,
+                        help="requests per second allowed per site, 0 for no limit (default: 20)")
+    parser.add_argument('--burst', type=int, help="requests a site may send at once (default: 2 x rate)")
+    parser.add_argument('--admin-token', default=os.environ.get(TOKEN_ENV),
+                        help=f"token the admin panels must send (default: ${TOKEN_ENV}, or a random one)")
+    parser.add_argument('--cors-origin', action='append', default=[], metavar='ORIGIN',
+                        help="origin allowed to call the admin API, repeatable ('null' for pages opened "
+                             "from disk; default: none)")
+    parser.add_argument('--site', action='append', dest='sites', metavar='NAME',
+                        help="serve only this site folder name, repeatable (default: any)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    raise_open_file_limit()
+    store = open_store(args.data)
+    token = args.admin_token or secrets.token_urlsafe(16)
+
+    def ready(server):
+        print(f"Booking server on http://{args.host}:{args.port}{SITE_PREFIX}<site>{API_PATH} "
+              f"({store.count} bookings for {store.sites} sites in {args.data})")
+        if not args.admin_token:
+            print(f"Admin token: {token}")
+        sys.stdout.flush()
+
+    try:
+        asyncio.run(serve(store, args.host, args.port, ready, args.rate, args.burst,
+                          token, args.cors_origin, args.sites))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Streaming business record sources
+
+Reads business configs from JSONL or CSV one record at a time so bulk
+runs start generating before the file has been parsed and memory stays
+flat regardless of file size.
+
+JSONL: one object per line
+    {"name": "Happy Cafe", "type": "restaurant", "keywords": ["coffee", "brunch"], ...}
+
+CSV: header row with any of name, type, keywords, phone, email, address, services
+    (list fields are separated by ',', ';' or '|' inside the cell)
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+from .config import normalize_record
+
+FORMATS = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+}
+
+
+def _iter_jsonl(f):
+    for line_no, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, e
+
+
+def _iter_csv(f):
+    reader = csv.DictReader(f)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_records(path, fmt=None, skip_invalid=False):
+    """Return a lazy iterator of normalized business configs from a JSONL or CSV file.
+
+    Invalid records raise ValueError (with the line number) unless
+    skip_invalid is set, in which case they are reported on stderr and
+    skipped.
+    """
+    # Resolve now: the file is opened lazily, so a later chdir must not change which file is read
+    path = Path(path).resolve()
+    fmt = fmt or FORMATS.get(path.suffix.lower())
+    if fmt not in ('jsonl', 'csv'):
+        raise ValueError(f"Unsupported input format: {path.name} (use .jsonl or .csv)")
+    if not path.is_file():
+        raise FileNotFoundError(f"Input file not found: {path}")
+    return _iter_records(path, fmt, skip_invalid)
+
+
+def _iter_records(path, fmt, skip_invalid):
+    # utf-8-sig: spreadsheet exports often start with a BOM
+    with path.open(encoding='utf-8-sig', newline='') as f:
+        rows = _iter_jsonl(f) if fmt == 'jsonl' else _iter_csv(f)
+        for line_no, record in rows:
+            try:
+                if isinstance(record, Exception):
+                    raise ValueError(str(record))
+                if not isinstance(record, dict):
+                    raise ValueError("expected an object")
+                yield normalize_record(record)
+            except ValueError as e:
+                message = f"{path.name}:{line_no}: {e}"
+                if not skip_invalid:
+                    raise ValueError(message) from None
+                print(f"Skipping {message}", file=sys.stderr)
@@ -0,0 +1,215 @@
+"""
+Trend providers for the blog generator
+
+A provider answers one question - what is trending around a keyword - as
+a dict {'popularity', 'related_terms', 'current_issues'}, or None when it
+knows nothing about it. Real implementations would call Google Trends or
+a news API; the ones here are local stand-ins:
+
+    StaticTrendProvider()                the fixed sample trends (default)
+    FileTrendProvider('trends.jsonl')    a JSON / JSON Lines file, loaded once
+    SQLiteTrendProvider('trends.db')     a SQLite table, queried per keyword
+
+TrendCache sits in front of a provider so a batch asks it once per
+keyword: entries live for ttl seconds and the least recently used one is
+dropped past maxsize. Keywords are normalized first (case, spacing), and
+a keyword the provider does not know falls back to its first word, so
+'세무기장 비용' and '세무기장  절세' share the cached '세무기장' lookup.
+cache.metrics() reports the hit ratio and lookup latency.
+
+    cache = TrendCache(open_provider('trends.db'), maxsize=4096, ttl=3600)
+    cache.get('세무기장')
+    cache.metrics()   # {'lookups': 1, 'hits': 0, 'hit_ratio': 0.0, 'avg_ms': ..., ...}
+"""
+
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_TRENDS = {
+    'popularity': '상승',
+    'related_terms': ['AI 세무', '디지털 전환', '자동화 기장'],
+    'current_issues': ['세무 디지털화', 'AI 도입', '효율성 증대'],
+}
+TREND_FIELDS = tuple(DEFAULT_TRENDS)
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+
+def normalize_keyword(keyword):
+    """Cache / lookup key of a keyword: collapsed whitespace, case-folded."""
+    return ' '.join(str(keyword).split()).casefold()
+
+
+def trend_entry(data):
+    """The trend fields of a stored record (missing ones from DEFAULT_TRENDS)."""
+    return {field: data.get(field, DEFAULT_TRENDS[field]) for field in TREND_FIELDS}
+
+
+class TrendProvider(ABC):
+    """Base class: lookup(key) returns a trends dict, or None for an unknown keyword.
+
+    key is already normalized (normalize_keyword).
+    """
+
+    @abstractmethod
+    def lookup(self, key):
+        """Trends dict for a normalized keyword, or None if the provider does not know it."""
+
+    def close(self):
+        pass
+
+
+class StaticTrendProvider(TrendProvider):
+    """The same sample trends for every keyword."""
+
+    def lookup(self, key):
+        return dict(DEFAULT_TRENDS)
+
+
+class FileTrendProvider(TrendProvider):
+    """Trends from a JSON object {keyword: trends} or JSON Lines {"keyword": ..., ...} file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.trends = {}
+        text = self.path.read_text(encoding='utf-8-sig')
+        if self.path.suffix == '.json':
+            records = [dict(value, keyword=key) for key, value in json.loads(text).items()]
+        else:
+            records = (json.loads(line) for line in text.splitlines() if line.strip())
+        for record in records:
+            if not record.get('keyword'):
+                raise ValueError(f"{self.path}: trend record without a keyword")
+            self.trends[normalize_keyword(record['keyword'])] = trend_entry(record)
+
+    def lookup(self, key):
+        return self.trends.get(key)
+
+
+class SQLiteTrendProvider(TrendProvider):
+    """Trends in a SQLite table trends(keyword, data), one indexed lookup per keyword."""
+
+    SCHEMA = "CREATE TABLE IF NOT EXISTS trends (keyword TEXT PRIMARY KEY, data TEXT NOT NULL)"
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute(self.SCHEMA)
+        self.db.commit()
+
+    def lookup(self, key):
+        row = self.db.execute("SELECT data FROM trends WHERE keyword = ?", (key,)).fetchone()
+        return trend_entry(json.loads(row[0])) if row else None
+
+    def put_many(self, records):
+        """Store (keyword, trends) pairs, replacing existing keywords, in one transaction."""
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO trends (keyword, data) VALUES (?, ?)",
+                ((normalize_keyword(keyword), json.dumps(trend_entry(trends), ensure_ascii=False))
+                 for keyword, trends in records))
+
+    def put(self, keyword, trends):
+        self.put_many([(keyword, trends)])
+
+    def close(self):
+        self.db.close()
+
+
+def open_provider(path=None):
+    """Provider for a path: SQLite for .db / .sqlite, a JSON / JSONL file otherwise, static for None."""
+    if not path:
+        return StaticTrendProvider()
+    if Path(path).suffix.lower() in SQLITE_SUFFIXES:
+        # sqlite3.connect would quietly create an empty database for a mistyped path
+        if not Path(path).is_file():
+            raise FileNotFoundError(f"Trend database not found: {path}")
+        return SQLiteTrendProvider(path)
+    return FileTrendProvider(path)
+
+
+class TrendCache:
+    """TTL + LRU cache of a provider's trends, keyed on the normalized keyword.
+
+    ttl=None keeps entries until they are evicted; maxsize bounds the
+    number of entries (least recently used goes first).
+    """
+
+    def __init__(self, provider=None, maxsize=1024, ttl=3600, clock=time.monotonic):
+        self.provider = provider or StaticTrendProvider()
+        self.maxsize = max(maxsize, 1)
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (expires, trends)
+        self.counts = {'lookups': 0, 'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0}
+        self.seconds = 0.0            # total time in get()
+        self.max_seconds = 0.0
+        self.provider_seconds = 0.0   # of which spent in the provider
+
+    @property
+    def hits(self):
+        return self.counts['hits']
+
+    def get(self, keyword):
+        """Trends for keyword ({'keyword', 'popularity', 'related_terms', 'current_issues'})."""
+        started = time.perf_counter()
+        self.counts['lookups'] += 1
+        key = normalize_keyword(keyword)
+        trends = self._cached(key)
+        if trends is None:
+            self.counts['misses'] += 1
+            trends = self._load(key)
+        else:
+            self.counts['hits'] += 1
+        elapsed = time.perf_counter() - started
+        self.seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        return {'keyword': keyword, **trends}
+
+    def _cached(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] is not None and entry[0] <= self.clock():
+            del self.entries[key]
+            self.counts['expired'] += 1
+            return None
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def _load(self, key):
+        """Ask the provider; unknown keywords fall back to their first word, then the defaults."""
+        started = time.perf_counter()
+        trends = self.provider.lookup(key)
+        self.provider_seconds += time.perf_counter() - started
+        if trends is None:
+            head = key.split(' ', 1)[0]
+            trends = (self._cached(head) or self._load(head)) if head != key else dict(DEFAULT_TRENDS)
+        self._store(key, trends)
+        return trends
+
+    def _store(self, key, trends):
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        self.entries[key] = (expires, trends)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.counts['evictions'] += 1
+
+    def metrics(self):
+        """Hit ratio and lookup latency so far (times in milliseconds)."""
+        lookups = self.counts['lookups']
+        return dict(
+            self.counts,
+            size=len(self.entries),
+            hit_ratio=self.counts['hits'] / lookups if lookups else 0.0,
+            avg_ms=self.seconds * 1000 / lookups if lookups else 0.0,
+            max_ms=self.max_seconds * 1000,
+            provider_ms=self.provider_seconds * 1000,
+        )
+
+    def close(self):
+        self.provider.close()
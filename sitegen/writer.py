@@ -0,0 +1,191 @@
+"""
+Atomic site bundle writer
+
+A site is written as one bundle: every file goes into a hidden temp
+directory next to the target folder, the staged files and directories
+are fsynced, and the temp directory is renamed into place. A crash mid-run leaves at most a
+stray `.name.*.tmp` directory - never a half-written site folder.
+
+With batch_size > 1 several sites share one sync barrier: their files
+are fsynced back to back after all of them are written (so the kernel
+writes them out together), and each parent directory is synced once for
+the whole batch rather than once per site. Only the bundle's own files
+are synced, never the rest of the filesystem:
+
+    with BundleWriter(batch_size=64) as writer:
+        for folder, files in sites:
+            writer.write(folder, files)    # staged; committed every 64 sites
+
+batch_size=None never flushes on its own: the caller calls flush() and,
+if it raises, writer.committed lists the folders that did reach disk.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from .cache import MANIFEST_NAME
+
+
+def _sync_dir(path):
+    """Persist a rename by syncing the parent directory (no-op on Windows)."""
+    if os.name == 'nt':
+        return
+    _fsync(path)
+
+
+def _fsync(path, flags=os.O_RDONLY):
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_tree(root):
+    """fsync every file under root, then every directory (so the new entries persist too)."""
+    # Windows can only fsync a file opened for writing, and not a directory at all
+    file_flags = os.O_RDWR if os.name == 'nt' else os.O_RDONLY
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        for name in filenames:
+            _fsync(os.path.join(dirpath, name), file_flags)
+        _sync_dir(dirpath)
+
+
+def _built_entries(folder):
+    """Top-level names the previous build wrote into folder (from its manifest)."""
+    try:
+        manifest = json.loads((folder / MANIFEST_NAME).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return set()
+    return {name.split('/', 1)[0] for name in manifest.get('files', [])}
+
+
+def _carry_over(source, target):
+    """Hard-link (or copy, across filesystems) a file or directory tree to target."""
+    if source.is_dir() and not source.is_symlink():
+        shutil.copytree(source, target, symlinks=True, copy_function=_link_or_copy)
+    else:
+        _link_or_copy(source, target)
+
+
+def _link_or_copy(source, target):
+    try:
+        os.link(source, target, follow_symlinks=False)
+    except OSError:
+        shutil.copy2(source, target, follow_symlinks=False)
+    return target
+
+
+class BundleWriter:
+    """Stage site bundles in temp directories and commit them atomically."""
+
+    def __init__(self, sync=True, batch_size=1):
+        self.sync = sync
+        self.batch_size = None if batch_size is None else max(batch_size, 1)
+        self.pending = []    # (temp dir, target folder)
+        self.committed = []  # folders renamed into place by the last flush()
+
+    def write(self, folder, files):
+        """Stage one site ({filename: str or bytes}) for folder; return the folder path."""
+        folder = Path(folder)
+        folder.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f'.{folder.name}.', suffix='.tmp', dir=folder.parent))
+        try:
+            for name, content in files.items():
+                path = staging / name
+                if '/' in name:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                if isinstance(content, bytes):
+                    path.write_bytes(content)
+                    continue
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self.pending.append((staging, folder))
+        if self.batch_size is not None and len(self.pending) >= self.batch_size:
+            self.flush()
+        return folder
+
+    def flush(self):
+        """Sync every staged bundle once, then rename each into place.
+
+        If this raises, the folders in self.committed were written and
+        every other staged bundle was dropped.
+        """
+        self.committed = []
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        try:
+            if self.sync:
+                self._sync_data([staging for staging, _ in pending])
+            for staging, folder in pending:
+                self._swap(staging, folder)
+                self.committed.append(folder)
+        except BaseException:
+            for staging, _ in pending:
+                shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if self.sync:
+            for parent in {folder.parent for _, folder in pending}:
+                _sync_dir(parent)
+
+    def discard(self):
+        """Drop staged bundles without committing them."""
+        for staging, _ in self.pending:
+            shutil.rmtree(staging, ignore_errors=True)
+        self.pending = []
+
+    def _sync_data(self, stagings):
+        for staging in stagings:
+            _sync_tree(staging)
+
+    def _swap(self, staging, folder):
+        """Rename staging over folder, keeping files the generator does not own.
+
+        The live folder is left whole until the staging dir replaces it:
+        user files are linked (or copied) into the staging dir, not moved.
+        """
+        if not folder.exists():
+            os.rename(staging, folder)
+            return
+
+        # Carry over user-added files (images, custom pages) into the new bundle;
+        # files listed in the previous manifest belong to the old build
+        owned = _built_entries(folder)
+        for entry in folder.iterdir():
+            if entry.name not in owned and not (staging / entry.name).exists():
+                _carry_over(entry, staging / entry.name)
+
+        retired = Path(tempfile.mkdtemp(prefix=f'.{folder.name}.', suffix='.old', dir=folder.parent))
+        os.rmdir(retired)
+        os.rename(folder, retired)
+        try:
+            os.rename(staging, folder)
+        except BaseException:
+            os.rename(retired, folder)
+            raise
+        shutil.rmtree(retired, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+        return False
+
+
+def write_bundle(folder, files, sync=True):
+    """Write one site atomically and return its folder path."""
+    with BundleWriter(sync=sync) as writer:
+        return writer.write(folder, files)
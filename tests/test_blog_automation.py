@@ -0,0 +1,30 @@
+import json
+
+import blog_automation
+from sitegen.blog_site import BlogBuilder
+
+
+def test_pages_of_colliding_keywords_get_distinct_names(tmp_path):
+    keywords = ['AI tools', 'ai-tools', 'AI tools', 'AI  tools!']
+    results = list(blog_automation.iter_blog_batch(keywords, workers=1, chunk_size=2, word_limit=300,
+                                                   html_dir=tmp_path))
+    pages = [result['page'] for result in results]
+    assert [p.rsplit('/', 1)[1] for p in pages] == ['ai-tools.html', 'ai-tools-2.html', 'ai-tools.html',
+                                                    'ai-tools-3.html']
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['ai-tools-2.html', 'ai-tools-3.html', 'ai-tools.html']
+    assert 'ai-tools' in (tmp_path / 'ai-tools-2.html').read_text(encoding='utf-8')
+    assert all('body' not in result for result in results)
+
+
+def test_blog_bodies_are_rendered_by_the_workers(tmp_path):
+    results = list(blog_automation.iter_blog_batch(['세무기장'], workers=1, word_limit=300, bodies=True))
+    generator = blog_automation.WebsiteGenerator(verbose=False)
+    assert results[0]['body'] == generator.render_body('세무기장', results[0]['post'])
+
+    with BlogBuilder(tmp_path / 'blog') as blog:
+        report = blog_automation.run_blog_batch(['세무기장', '절세'], tmp_path / 'posts.jsonl', workers=1,
+                                                word_limit=300, blog=blog)
+    assert report['succeeded'] == 2 and report['blog']['added'] == 2
+    assert '절세' in (tmp_path / 'blog/posts/절세.html').read_text(encoding='utf-8')
+    lines = [json.loads(line) for line in (tmp_path / 'posts.jsonl').read_text(encoding='utf-8').splitlines()]
+    assert [line['keyword'] for line in lines] == ['세무기장', '절세'] and 'body' not in lines[0]
@@ -0,0 +1,96 @@
+import re
+
+from sitegen.blog_site import BlogBuilder
+
+TAGS = ['세무', '비용', '창업', 'Seoul', 'seoul']
+
+
+def make_post(i, version=0, tags=None, created='2026-01-01'):
+    if tags is None:
+        tags = [tag for n, tag in enumerate(TAGS) if i % (n + 2) == 0] or [TAGS[0]]
+    return {'metadata': {'title': f'글 {i} v{version}', 'description': f'설명 {i}', 'keywords': tags,
+                         'created_date': created, 'word_count': 100, 'style': 'informative',
+                         'images_count': 0},
+            'content': f'# 글 {i}\n본문 v{version}', 'images': [], 'trends': {}}
+
+
+def snapshot(folder):
+    files = {}
+    for path in sorted(folder.rglob('*')):
+        if path.is_file() and path.name != '.blog.db':
+            text = path.read_text(encoding='utf-8')
+            files[str(path.relative_to(folder))] = re.sub(r'<lastBuildDate>.*?</lastBuildDate>', '', text)
+    return files
+
+
+def open_blog(folder):
+    return BlogBuilder(folder, base_url='https://blog.example.com/', page_size=7, sitemap_size=50)
+
+
+# (post, version, tags): retag, drop tags, add a new tag, change the newest post
+CHANGES = [(5, 1, ['비용']), (10, 1, None), (60, 2, ['창업', 'Seoul', '새 태그']), (119, 1, [])]
+
+
+def test_incremental_build_matches_clean_build(tmp_path):
+    incremental, clean = tmp_path / 'incremental', tmp_path / 'clean'
+    sizes = [1, 3, 7, 13, 2, 40, 1, 20, 33]
+    first = 0
+    for step, size in enumerate(sizes):
+        with open_blog(incremental) as blog:
+            for i in range(first, first + size):
+                blog.add(f'키워드 {i}', make_post(i))
+            if step == 5:
+                for i, version, tags in CHANGES[:2]:
+                    assert blog.add(f'키워드 {i}', make_post(i, version, tags)) == 'changed'
+        first += size
+    with open_blog(incremental) as blog:
+        for i, version, tags in CHANGES:
+            blog.add(f'키워드 {i}', make_post(i, version, tags))
+
+    final = {i: (version, tags) for i, version, tags in CHANGES}
+    with open_blog(clean) as blog:
+        for i in range(first):
+            version, tags = final.get(i, (0, None))
+            blog.add(f'키워드 {i}', make_post(i, version, tags))
+
+    expected = snapshot(clean)
+    assert 'tags/새-태그/index.html' in expected
+    assert snapshot(incremental) == expected
+
+
+def test_created_date_alone_is_not_a_change(tmp_path):
+    with open_blog(tmp_path) as blog:
+        blog.add('세무기장 비용', make_post(1, created='2026-01-01'))
+    with open_blog(tmp_path) as blog:
+        assert blog.add('세무기장 비용', make_post(1, created='2026-02-01')) == 'unchanged'
+        assert blog.build()['pages'] == 0
+
+
+def test_changed_post_keeps_its_created_date(tmp_path):
+    with open_blog(tmp_path) as blog:
+        blog.add('세무기장 비용', make_post(1, created='2026-01-01'))
+    with open_blog(tmp_path) as blog:
+        assert blog.add('세무기장 비용', make_post(1, version=1, created='2026-02-01')) == 'changed'
+    page = (tmp_path / 'posts/세무기장-비용.html').read_text(encoding='utf-8')
+    assert '2026-01-01' in page and '2026-02-01' not in page
+    assert '2026-01-01' in (tmp_path / 'index.html').read_text(encoding='utf-8')
+
+
+def test_colliding_slugs_get_a_suffix(tmp_path):
+    with open_blog(tmp_path) as blog:
+        assert blog.add('세무기장 비용', make_post(1)) == 'added'
+        assert blog.add('세무기장-비용?', make_post(2)) == 'added'
+        assert blog.add('세무기장 비용', make_post(1)) == 'unchanged'
+    with open_blog(tmp_path) as blog:
+        assert blog.add('세무기장-비용?', make_post(2, version=1)) == 'changed'
+    assert '글 1 v0' in (tmp_path / 'posts/세무기장-비용.html').read_text(encoding='utf-8')
+    assert '글 2 v1' in (tmp_path / 'posts/세무기장-비용-2.html').read_text(encoding='utf-8')
+
+
+def test_feed_dates_posts_by_created(tmp_path):
+    with open_blog(tmp_path) as blog:
+        blog.add('세무기장 비용', make_post(1, created='2026-01-05'))
+    with open_blog(tmp_path) as blog:
+        blog.add('세무기장 비용', make_post(1, version=1))
+    feed = (tmp_path / 'rss.xml').read_text(encoding='utf-8')
+    assert '<pubDate>Mon, 05 Jan 2026 00:00:00 +0000</pubDate>' in feed
@@ -0,0 +1,92 @@
+import pytest
+
+from sitegen.booking_store import BookingStore, SQLiteBookingStore
+
+SITE = 'happy-cafe-website'
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    store = BookingStore(tmp_path / 'bookings.jsonl') if request.param == 'memory' \
+        else SQLiteBookingStore(str(tmp_path / 'bookings.db'))
+    yield store
+    store.close()
+
+
+def imported(created, status='pending'):
+    return {'name': 'Kim', 'status': status, 'createdAt': created}
+
+
+def test_stats_count_today_from_any_moment(store):
+    store.import_bookings(SITE, [imported('2026-01-14T10:00:00.000Z'), imported('2026-01-15T09:00:00.000Z'),
+                                 imported('2026-01-15T16:00:00.000Z'), imported('2026-01-16T01:00:00.000Z')])
+    store.import_bookings(SITE, [imported('2026-01-15T12:00:00.000Z', 'completed')])
+    store.import_bookings('other-website', [imported('2026-01-15T12:00:00.000Z')])
+
+    stats = store.stats(SITE, since='2026-01-15T12:00:00.000Z')
+    assert stats == {'total': 5, 'today': 3, 'statuses': {'pending': 4, 'completed': 1}}
+    assert store.stats(SITE, since='2026-01-17T00:00:00.000Z')['today'] == 0
+    assert store.stats(SITE, since='2026-01-01T00:00:00.000Z')['today'] == 5
+    assert store.stats('nobody-website') == {'total': 0, 'today': 0, 'statuses': {}}
+
+
+def test_new_bookings_count_as_today(store):
+    store.create(SITE, {'name': 'Kim'})
+    store.create(SITE, {'name': 'Lee'})
+    assert store.stats(SITE)['today'] == 2
+
+
+def test_status_transitions_move_the_counters(store):
+    first = store.create(SITE, {'name': 'Kim'})
+    store.create(SITE, {'name': 'Lee'})
+    store.update(SITE, first['id'], {'status': 'confirmed'})
+    store.update(SITE, first['id'], {'status': 'completed'})
+    store.update(SITE, first['id'], {'message': 'same status'})
+
+    assert store.stats(SITE)['statuses'] == {'pending': 1, 'completed': 1}
+    (day,) = store.history(SITE, 'day')
+    assert day['total'] == 2 and day['statuses'] == {'pending': 1, 'completed': 1}
+    assert store.list(SITE, status='completed')[0]['id'] == first['id']
+
+
+@pytest.mark.parametrize('status', [5, 'done', '', 'PENDING'])
+def test_unknown_statuses_are_rejected(store, status):
+    with pytest.raises(ValueError):
+        store.create(SITE, {'name': 'Kim', 'status': status})
+    booking = store.create(SITE, {'name': 'Kim'})
+    with pytest.raises(ValueError):
+        store.update(SITE, booking['id'], {'status': status})
+    with pytest.raises(ValueError):
+        store.import_bookings(SITE, [imported('2026-01-15T12:00:00.000Z', status)])
+    assert store.stats(SITE)['statuses'] == {'pending': 1}
+
+
+def test_korean_statuses_are_accepted(store):
+    booking = store.create(SITE, {'name': '김', 'status': '대기중'})
+    store.update(SITE, booking['id'], {'status': '완료'})
+    assert store.stats(SITE)['statuses'] == {'완료': 1}
+
+
+def test_history_by_week_and_month(store):
+    store.import_bookings(SITE, [imported('2026-01-12T10:00:00.000Z'), imported('2026-01-18T10:00:00.000Z'),
+                                 imported('2026-01-19T10:00:00.000Z'), imported('2026-02-01T10:00:00.000Z')])
+    assert [(p['period'], p['total']) for p in store.history(SITE, 'week')] == \
+        [('2026-01-12', 2), ('2026-01-19', 1), ('2026-01-26', 1)]
+    assert [(p['period'], p['total']) for p in store.history(SITE, 'month', since='2026-01-15')] == \
+        [('2026-01', 2), ('2026-02', 1)]
+    with pytest.raises(ValueError):
+        store.history(SITE, 'year')
+
+
+def test_memory_store_replays_counters(tmp_path):
+    path = tmp_path / 'bookings.jsonl'
+    store = BookingStore(path)
+    store.import_bookings(SITE, [imported('2026-01-15T09:00:00.000Z'), imported('2026-01-15T16:00:00.000Z')])
+    booking = store.create(SITE, {'name': 'Kim'})
+    store.update(SITE, booking['id'], {'status': 'cancelled'})
+    before = store.stats(SITE, since='2026-01-15T12:00:00.000Z'), store.history(SITE)
+    store.close()
+
+    store = BookingStore(path)
+    assert (store.stats(SITE, since='2026-01-15T12:00:00.000Z'), store.history(SITE)) == before
+    store.close()
@@ -0,0 +1,58 @@
+import pytest
+
+from sitegen import cache
+from sitegen.batch import build_one
+from sitegen.cache import BuildCache, template_version
+from sitegen.generators import v2
+from sitegen.writer import BundleWriter
+
+CONFIG = {'business_name': 'Alpha Cafe', 'business_type': 'cafe'}
+
+
+@pytest.fixture(autouse=True)
+def fresh_versions(monkeypatch):
+    monkeypatch.setattr(cache, '_versions', {})
+
+
+def build(tmp_path, config=CONFIG, options=None):
+    writer = BundleWriter(sync=False, batch_size=None)
+    result = build_one('v2', config, True, tmp_path, writer, options)
+    writer.flush()
+    assert result['ok'], result['error']
+    return result['cached']
+
+
+def test_unchanged_site_is_skipped(tmp_path):
+    assert not build(tmp_path)
+    assert build(tmp_path)
+
+
+def test_config_and_options_invalidate(tmp_path):
+    build(tmp_path)
+    assert not build(tmp_path, dict(CONFIG, phone='010-1234'))
+    assert not build(tmp_path, dict(CONFIG, phone='010-1234'), {'minify': True})
+    assert build(tmp_path, dict(CONFIG, phone='010-1234'), {'minify': True})
+
+
+def test_missing_file_invalidates(tmp_path):
+    build(tmp_path)
+    next(tmp_path.glob('*/admin.html')).unlink()
+    assert not build(tmp_path)
+
+
+def test_shared_module_edit_invalidates(tmp_path, monkeypatch):
+    shared = tmp_path / 'shared.py'
+    shared.write_text('A = 1\n')
+    monkeypatch.setattr(cache, 'shared_sources', lambda: (shared,))
+    before = BuildCache(tmp_path, CONFIG, v2.__file__).digest
+
+    cache._versions.clear()
+    shared.write_text('A = 2\n')
+    assert BuildCache(tmp_path, CONFIG, v2.__file__).digest != before
+    assert template_version(v2.__file__) == template_version((v2.__file__,))
+
+
+def test_render_path_modules_are_hashed():
+    names = {path.name for path in cache.shared_sources()}
+    assert {'templates.py', 'colors.py', 'minify.py', 'assets.py', 'compress.py', 'config.py',
+            'booking_client.py', 'pipeline.py'} <= names
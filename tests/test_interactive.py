@@ -0,0 +1,33 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from sitegen.config import TYPE_PRESETS, TYPE_PRESETS_KO
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script(name):
+    spec = importlib.util.spec_from_file_location(Path(name).stem.replace('-', '_'), ROOT / name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def answers(menu_choice):
+    values = iter(['Happy Cafe', menu_choice, 'coffee, brunch', '010-1234-5678', 'a@b.c', 'Seoul'])
+    return lambda prompt='': next(values)
+
+
+@pytest.mark.parametrize('script, presets', [
+    ('website-auto-generator.py', TYPE_PRESETS),
+    ('홈페이지자동생성기.py', TYPE_PRESETS_KO),
+])
+@pytest.mark.parametrize('choice, preset', [('2', 'restaurant'), ('9', 'business'), ('', 'business')])
+def test_menu_choice_picks_preset(monkeypatch, capsys, script, presets, choice, preset):
+    monkeypatch.setattr('builtins.input', answers(choice))
+    config = load_script(script).get_user_input()
+    assert config['type'] == preset
+    assert config['services'] == presets[preset]['services']
+    assert config['keywords'] == ['coffee', 'brunch']
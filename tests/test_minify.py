@@ -0,0 +1,69 @@
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from sitegen import booking_client
+from sitegen.minify import minify_css, minify_html, minify_js
+from sitegen.pipeline import GENERATORS, render_bundle
+
+SCRIPTS = ['BOOKING_SCRIPT', 'BOOKING_ADMIN_SCRIPT', 'BOOKING_TABLE_SCRIPT', 'BOOKING_TRANSFER_SCRIPT']
+
+
+def script_body(name):
+    return re.search(r'<script>(.*)</script>', getattr(booking_client, name), re.S).group(1)
+
+
+@pytest.mark.parametrize('name', SCRIPTS)
+def test_shipped_scripts_lose_every_comment(name):
+    minified = minify_js(script_body(name))
+    assert '//' not in minified
+    assert '/*' not in minified
+    assert len(minified) < len(script_body(name))
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason='node is not installed')
+@pytest.mark.parametrize('name', SCRIPTS)
+def test_minified_scripts_still_parse(name, tmp_path):
+    path = tmp_path / 'script.js'
+    path.write_text(minify_js(script_body(name)), encoding='utf-8')
+    result = subprocess.run(['node', '--check', str(path)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_regex_literals_are_kept_verbatim():
+    js = "var r = /[\"']/g; // quote\nvar s = /\\/\\/ x/.test(a) && b / c / d;\nreturn /[/]/"
+    assert minify_js(js) == "var r = /[\"']/g;\nvar s = /\\/\\/ x/.test(a) && b / c / d;\nreturn /[/]/"
+
+
+def test_strings_and_urls_survive():
+    js = "  var u = 'http://x/*y*/';   // c\n\n  fetch(u) /* c */\n"
+    assert minify_js(js) == "var u = 'http://x/*y*/';\nfetch(u)"
+    assert minify_css('a  {  color: red ; } /* c */ b{content:"/* x */"}') == 'a{color:red}b{content:"/* x */"}'
+
+
+def test_html_keeps_pre_and_minifies_blocks():
+    html = '<div>\n  <p>a   b</p>\n</div>\n<pre>  x\n  y</pre>\n<script>\n  // c\n  go()\n</script>'
+    assert minify_html(html) == '<div><p>a b</p></div><pre>  x\n  y</pre><script>go()</script>'
+
+
+def test_nested_template_literals_are_one_literal():
+    js = "x(`<b>${a ? `<i>\"${b}\"</i>` : ''}</b>`, '</p>');\n// c\ny()"
+    assert minify_js(js) == "x(`<b>${a ? `<i>\"${b}\"</i>` : ''}</b>`, '</p>');\ny()"
+
+
+@pytest.mark.skipif(not shutil.which('node'), reason='node is not installed')
+@pytest.mark.parametrize('generator', sorted(GENERATORS))
+def test_minified_pages_have_no_comments_and_parse(generator, tmp_path):
+    _, files = render_bundle({'business_name': 'Alpha Cafe', 'business_type': 'cafe'}, generator,
+                             options={'minify': True})
+    for name, content in files.items():
+        if not name.endswith('.html'):
+            continue
+        for k, script in enumerate(re.findall(r'<script>(.*?)</script>', content, re.S)):
+            assert '//' not in script.replace('://', ''), name
+            path = tmp_path / f'{name}.{k}.js'
+            path.write_text(script, encoding='utf-8')
+            result = subprocess.run(['node', '--check', str(path)], capture_output=True, text=True)
+            assert result.returncode == 0, (name, result.stderr)
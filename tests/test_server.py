@@ -0,0 +1,121 @@
+import asyncio
+import json
+import sqlite3
+from http import HTTPStatus
+
+import pytest
+
+from sitegen.booking_store import BookingStore
+from sitegen.server import BookingAPI, HTTPError, RateLimiter, make_handler
+
+TOKEN = 'secret'
+ADMIN = {'authorization': f'Bearer {TOKEN}'}
+BOOKINGS = '/sites/happy-cafe-website/api/bookings'
+
+
+@pytest.fixture
+def api():
+    store = BookingStore()
+    yield BookingAPI(store, admin_token=TOKEN, cors_origins=['https://admin.example.com'])
+    store.close()
+
+
+def post(api, name='Kim'):
+    return api.handle('POST', BOOKINGS, json.dumps({'name': name}).encode())
+
+
+def test_visitors_may_only_post_bookings(api):
+    status, booking = post(api)
+    assert status == HTTPStatus.CREATED
+
+    for method, target in [('GET', BOOKINGS), ('GET', f"{BOOKINGS}/{booking['id']}"),
+                           ('PATCH', f"{BOOKINGS}/{booking['id']}"),
+                           ('GET', '/sites/happy-cafe-website/api/stats'),
+                           ('GET', '/sites/happy-cafe-website/api/events'),
+                           ('GET', '/sites/happy-cafe-website/api/export'),
+                           ('POST', '/sites/happy-cafe-website/api/import')]:
+        with pytest.raises(HTTPError) as error:
+            api.handle(method, target, b'{}')
+        assert error.value.status == HTTPStatus.UNAUTHORIZED, (method, target)
+
+
+def test_admin_token_in_header_or_query(api):
+    post(api)
+    status, payload = api.handle('GET', BOOKINGS, b'', ADMIN)
+    assert status == HTTPStatus.OK and len(payload['bookings']) == 1
+    status, _ = api.handle('GET', '/sites/happy-cafe-website/api/export?token=secret', b'', {})
+    assert status == HTTPStatus.OK
+    with pytest.raises(HTTPError):
+        api.handle('GET', BOOKINGS, b'', {'authorization': 'Bearer wrong'})
+
+
+def test_no_token_configured_closes_the_admin_api():
+    api = BookingAPI(BookingStore())
+    with pytest.raises(HTTPError) as error:
+        api.handle('GET', BOOKINGS + '?token=', b'', {'authorization': 'Bearer '})
+    assert error.value.status == HTTPStatus.UNAUTHORIZED
+
+
+def test_cors_is_open_for_bookings_and_restricted_for_admin(api):
+    assert 'Allow-Origin: *' in api.cors('POST', BOOKINGS, {'origin': 'https://anywhere.example'})
+    preflight = {'origin': 'https://anywhere.example', 'access-control-request-method': 'POST'}
+    assert 'Allow-Origin: *' in api.cors('OPTIONS', BOOKINGS, preflight)
+    assert api.cors('GET', BOOKINGS, {'origin': 'https://evil.example'}) == ''
+    admin = api.cors('PATCH', BOOKINGS + '/1', {'origin': 'https://admin.example.com'})
+    assert 'Allow-Origin: https://admin.example.com' in admin and 'Authorization' in admin
+
+
+def test_unknown_sites_are_rejected():
+    api = BookingAPI(BookingStore(), admin_token=TOKEN, sites=['happy-cafe-website'])
+    assert post(api)[0] == HTTPStatus.CREATED
+    with pytest.raises(HTTPError) as error:
+        api.handle('POST', '/sites/made-up-website/api/bookings', b'{"name": "x"}')
+    assert error.value.status == HTTPStatus.NOT_FOUND
+    assert api.store.sites == 1
+
+
+def test_rate_buckets_are_bounded():
+    limiter = RateLimiter(1, burst=1, max_tenants=3)
+    for tenant in 'abcde':
+        limiter.check(tenant)
+    assert list(limiter.buckets) == ['c', 'd', 'e']
+    with pytest.raises(HTTPError) as error:
+        limiter.check('e')
+    assert error.value.status == HTTPStatus.TOO_MANY_REQUESTS
+
+
+@pytest.mark.parametrize('status, stored', [('Completed', 'pending'), ('확정', 'pending'), ('대기중', '대기중'),
+                                            ('Pending', 'Pending')])
+def test_visitors_can_only_create_pending_bookings(api, status, stored):
+    body = json.dumps({'name': 'Kim', 'status': status}).encode()
+    assert api.handle('POST', BOOKINGS, body)[1]['status'] == stored
+    assert api.handle('POST', BOOKINGS, body, ADMIN)[1]['status'] == status
+
+
+def request(api, raw):
+    """Send one raw request through the connection handler; return the status line and body."""
+    async def run():
+        server = await asyncio.start_server(make_handler(api), '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(raw)
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+    head, _, body = asyncio.run(run()).partition(b'\r\n\r\n')
+    return head.split(b'\r\n', 1)[0].decode(), body
+
+
+@pytest.mark.parametrize('target', [BOOKINGS, '/sites/happy-cafe-website/api/export'])
+def test_store_errors_are_answered_with_500(api, monkeypatch, capsys, target):
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(api.store, 'list', locked)
+    line, body = request(api, f'GET {target} HTTP/1.1\r\nAuthorization: Bearer {TOKEN}\r\n'
+                              'Connection: close\r\n\r\n'.encode())
+    assert line == 'HTTP/1.1 500 Internal Server Error'
+    assert json.loads(body) == {'error': 'internal server error'}
+    assert 'database is locked' in capsys.readouterr().err
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from sitegen.config import normalize_record
+from sitegen.sources import iter_records
+
+
+def test_records_are_normalized():
+    config = normalize_record({'Name': ' Alpha Cafe ', 'type': 'cafe', 'keywords': 'coffee; brunch',
+                               'services': ['Menu', ' '], 'unknown': 5, 'phone': None})
+    assert config == {'business_name': 'Alpha Cafe', 'business_type': 'cafe', 'keywords': ['coffee', 'brunch'],
+                      'services': ['Menu']}
+
+
+@pytest.mark.parametrize('record, message', [
+    ({'name': 'Alpha', 'type': 5}, "'type' must be text, not int"),
+    ({'name': ['Alpha']}, "'name' must be text, not list"),
+    ({'name': 'Alpha', 'keywords': [1, 2]}, "'keywords' must be text or a list of text, not list"),
+    ({'name': 'Alpha', 'services': {'a': 1}}, "'services' must be text or a list of text, not dict"),
+    ({'type': 'cafe'}, "record has no business name"),
+])
+def test_invalid_records_name_the_field(record, message):
+    with pytest.raises(ValueError, match=message):
+        normalize_record(record)
+
+
+def test_invalid_records_are_reported_with_their_line(tmp_path, capsys):
+    path = tmp_path / 'businesses.jsonl'
+    rows = [{'name': 'Alpha', 'type': 'cafe'}, {'name': 'Beta', 'type': 5}, {'name': 'Gamma', 'phone': True}]
+    path.write_text('\n'.join(json.dumps(row) for row in rows), encoding='utf-8')
+    with pytest.raises(ValueError, match="businesses.jsonl:2: 'type' must be text, not int"):
+        list(iter_records(path))
+    assert [config['business_name'] for config in iter_records(path, skip_invalid=True)] == ['Alpha']
+    err = capsys.readouterr().err
+    assert ":2: 'type' must be text, not int" in err and ":3: 'phone' must be text, not bool" in err
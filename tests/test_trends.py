@@ -0,0 +1,46 @@
+import pytest
+
+from sitegen.trends import DEFAULT_TRENDS, TrendCache, TrendProvider
+
+
+class CountingProvider(TrendProvider):
+    def __init__(self, known):
+        self.known = known
+        self.calls = []
+
+    def lookup(self, key):
+        self.calls.append(key)
+        return self.known.get(key)
+
+
+def test_provider_without_lookup_fails_on_creation():
+    class Forgetful(TrendProvider):
+        pass
+
+    with pytest.raises(TypeError, match='lookup'):
+        Forgetful()
+
+
+def test_cache_normalizes_and_falls_back_to_first_word():
+    trends = dict(DEFAULT_TRENDS, popularity='급상승')
+    provider = CountingProvider({'세무기장': trends})
+    cache = TrendCache(provider)
+    assert cache.get('세무기장  비용')['popularity'] == '급상승'
+    assert cache.get('세무기장 절세')['popularity'] == '급상승'
+    assert cache.get('세무기장 비용')['keyword'] == '세무기장 비용'
+    assert provider.calls == ['세무기장 비용', '세무기장', '세무기장 절세']
+    assert cache.get('모르는키워드') == {'keyword': '모르는키워드', **DEFAULT_TRENDS}
+
+
+def test_cache_expires_and_evicts():
+    now = [0.0]
+    provider = CountingProvider({'a': DEFAULT_TRENDS, 'b': DEFAULT_TRENDS, 'c': DEFAULT_TRENDS})
+    cache = TrendCache(provider, maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.get('a')
+    cache.get('b')
+    cache.get('a')
+    cache.get('c')            # evicts b, the least recently used
+    assert list(cache.entries) == ['a', 'c']
+    now[0] = 11
+    cache.get('a')
+    assert cache.counts == {'lookups': 5, 'hits': 1, 'misses': 4, 'expired': 1, 'evictions': 1}
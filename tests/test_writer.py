@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from sitegen import batch
+from sitegen.cache import MANIFEST_NAME
+from sitegen.writer import BundleWriter, write_bundle
+
+CONFIGS = [
+    {'business_name': 'Alpha Cafe', 'business_type': 'cafe'},
+    {'business_name': 'Beta Law', 'business_type': 'legal'},
+    {'business_name': 'Gamma Dental', 'business_type': 'medical'},
+]
+
+
+def staged(tmp_path):
+    return [p.name for p in tmp_path.iterdir() if p.name.endswith(('.tmp', '.old'))]
+
+
+def test_write_bundle_replaces_folder_and_keeps_user_files(tmp_path):
+    folder = tmp_path / 'site'
+    write_bundle(folder, {'index.html': 'v1', MANIFEST_NAME: '{"files": ["index.html"]}'}, sync=False)
+    (folder / 'logo.png').write_bytes(b'png')
+    (folder / 'extra').mkdir()
+    (folder / 'extra' / 'page.html').write_text('mine')
+
+    write_bundle(folder, {'index.html': 'v2', MANIFEST_NAME: '{"files": ["index.html"]}'}, sync=False)
+
+    assert (folder / 'index.html').read_text() == 'v2'
+    assert (folder / 'logo.png').read_bytes() == b'png'
+    assert (folder / 'extra' / 'page.html').read_text() == 'mine'
+    assert staged(tmp_path) == []
+
+
+def test_failed_swap_leaves_live_folder_whole(tmp_path, monkeypatch):
+    folder = tmp_path / 'site'
+    write_bundle(folder, {'index.html': 'v1', MANIFEST_NAME: '{"files": ["index.html"]}'}, sync=False)
+    (folder / 'logo.png').write_bytes(b'png')
+
+    rename = os.rename
+
+    def failing_rename(src, dst):
+        if str(src).endswith('.tmp'):
+            raise OSError('disk full')
+        rename(src, dst)
+
+    monkeypatch.setattr(os, 'rename', failing_rename)
+    with pytest.raises(OSError):
+        write_bundle(folder, {'index.html': 'v2'}, sync=False)
+
+    assert (folder / 'index.html').read_text() == 'v1'
+    assert (folder / 'logo.png').read_bytes() == b'png'
+    assert staged(tmp_path) == []
+
+
+def test_batch_size_none_waits_for_flush(tmp_path):
+    writer = BundleWriter(sync=False, batch_size=None)
+    for i in range(5):
+        writer.write(tmp_path / f'site{i}', {'index.html': str(i)})
+    assert not any((tmp_path / f'site{i}').exists() for i in range(5))
+    writer.flush()
+    assert writer.committed == [tmp_path / f'site{i}' for i in range(5)]
+    assert (tmp_path / 'site4' / 'index.html').read_text() == '4'
+
+
+def test_discard_drops_staged_bundles(tmp_path):
+    with pytest.raises(RuntimeError):
+        with BundleWriter(sync=False, batch_size=10) as writer:
+            writer.write(tmp_path / 'site', {'index.html': 'x'})
+            raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_build_chunk_marks_every_site_failed_when_sync_fails(tmp_path, monkeypatch):
+    def failing_sync(self, stagings):
+        raise OSError('sync failed')
+
+    monkeypatch.setattr(BundleWriter, '_sync_data', failing_sync)
+    results = batch.build_chunk('simple', CONFIGS, output_dir=tmp_path)
+
+    assert [r['ok'] for r in results] == [False, False, False]
+    assert all('sync failed' in r['error'] for r in results)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_build_chunk_keeps_sites_committed_before_a_failed_swap(tmp_path, monkeypatch):
+    swap = BundleWriter._swap
+
+    def failing_swap(self, staging, folder):
+        if folder.name.startswith('beta'):
+            raise OSError('rename failed')
+        swap(self, staging, folder)
+
+    monkeypatch.setattr(BundleWriter, '_swap', failing_swap)
+    results = batch.build_chunk('simple', CONFIGS, output_dir=tmp_path, sync=False)
+
+    assert [r['ok'] for r in results] == [True, False, False]
+    assert os.path.isdir(results[0]['path'])
+    assert staged(tmp_path) == []
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="needs /proc to name the synced files")
+def test_sync_covers_only_the_staged_bundle(tmp_path, monkeypatch):
+    def system_wide_sync():
+        raise AssertionError('os.sync flushes every filesystem')
+
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, 'sync', system_wide_sync, raising=False)
+    monkeypatch.setattr(os, 'fsync', lambda fd: synced.append(os.readlink(f'/proc/self/fd/{fd}'))
+                        or real_fsync(fd))
+    folder = tmp_path / 'site'
+    write_bundle(folder, {'index.html': 'v1', 'css/style.css': 'a{}'})
+    assert (folder / 'index.html').read_text() == 'v1'
+    names = [os.path.relpath(path, tmp_path) for path in synced]
+    assert sum(name.endswith('index.html') for name in names) == 1
+    assert sum(name.endswith('style.css') for name in names) == 1
+    assert names[-1] == '.'   # the parent directory, after the rename